@@ -3,7 +3,10 @@ import hou
 from Packages.apps.houdini.funcs.save_thumbnail import save_thumbnail
 from Packages.logic.filefunc import return_increment_edit
 from Packages.logic.json_funcs import set_recent_file
+from Packages.utils import tracing
+from Packages.utils.listing_cache import listing_cache
 
+@tracing.traced('houdini.increment_edit')
 def increment_edit():
     '''
     '''
@@ -16,6 +19,7 @@ def increment_edit():
     new_file_path = os.path.join(parent_directory, new_file_name)
 
     hou.hipFile.save(new_file_path)
+    listing_cache.invalidate(parent_directory)
     set_recent_file(new_file_path)
 
     save_thumbnail()
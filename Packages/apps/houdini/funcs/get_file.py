@@ -1,11 +1,16 @@
 import hou
 from Packages.utils.funcs import forward_slash
 from Packages.logic.json_funcs import set_recent_file
+from Packages.utils.copy_engine import materialize_file
 
 def open_houdini_file(file_path: str):
     '''
     '''
     
     file_path = forward_slash(file_path)
+    try:
+        materialize_file(file_path)
+    except OSError as e:
+        print(f"Could not materialize {file_path}: {e}")
     hou.hipFile.load(file_path)
     set_recent_file(file_path)
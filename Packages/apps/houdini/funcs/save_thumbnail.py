@@ -1,6 +1,5 @@
 import hou
 import os
-from PIL import Image
 from Packages.utils.constants.constants_old import CURRENT_PROJECT_PREVIEW_FOLDER
 
 
@@ -62,24 +61,15 @@ def save_thumbnail(output_path=None):
     except:
         print("Aucune fenêtre MPlay à fermer ou erreur lors de la fermeture.")
 
-    # Compression du PNG
+    # Compression du PNG hors de Houdini (worker de publication)
     if os.path.exists(temp_output):
         try:
-            with Image.open(temp_output) as img:
-                img.save(output_path, "PNG", optimize=True, quality=75)  # Compression plus forte
-            os.remove(temp_output)
-            print(f"Image compressée sauvegardée à : {output_path}")
+            from Packages.logic import publish_jobs
+            publish_jobs.submit_compress_thumbnail(temp_output, output_path)
+            print(f"Compression de l'image programmée : {output_path}")
         except Exception as e:
-            print(f"Erreur lors de la compression : {e}")
-            if os.path.exists(temp_output):
-                os.rename(temp_output, output_path)
-
-    # Vérifier le résultat
-    if os.path.exists(output_path):
-        file_size = os.path.getsize(output_path)
-        print(f"Thumbnail sauvegardé : {output_path} (Taille : {file_size} octets)")
-        if file_size == 0:
-            print("Erreur : Le fichier est vide !")
+            print(f"Erreur lors de la programmation de la compression : {e}")
+            os.replace(temp_output, output_path)
     else:
         print(f"Échec de la création du fichier à : {output_path}")
 
@@ -1,5 +1,5 @@
-import re
 from maya import cmds
+from Packages.logic import maya_ascii
 
 def list_nodes(node_types: list) -> list:
     
@@ -263,23 +263,14 @@ def list_shading_nodes() -> None:
     
     shading_node_types = RMAN_NODES + MAYA_NODES + ARNOLD_NODES
     shading_nodes = list_nodes(shading_node_types)
-    for node in shading_nodes:
-        print(node)
     return shading_nodes
     
 def delete_colon(file_name: str, liste_strings: list) -> None:
     try:
-        with open(file_name, 'r') as fichier:
-            contenu = fichier.read()
-
-            for chaine in liste_strings:
-                # Utilisation de l'expression régulière pour remplacer les occurrences
-                contenu = re.sub(rf'":{chaine}\w*', f'"{chaine}', contenu)
-
-        with open(file_name, 'w') as fichier:
-            fichier.write(contenu)
+        # Une seule expression pour tous les nœuds, fichier lu par blocs
+        result = maya_ascii.delete_colon(file_name, liste_strings)
             
-        print(f"Les occurrences ont été remplacées dans le fichier {file_name}")
+        print(f"{result['replacements']} occurrences ont été remplacées dans le fichier {file_name} ({result['seconds']:.1f} s)")
         
     except FileNotFoundError:
         print(f"Le fichier {file_name} n'a pas été trouvé.")
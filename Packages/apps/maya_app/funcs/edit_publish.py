@@ -2,15 +2,17 @@ import os
 import shutil
 from maya import cmds
 import maya.api.OpenMaya as om
-from PySide2.QtWidgets import QMessageBox
 from Packages.apps.maya_app.funcs import playblast
 from Packages.logic.filefunc import publish_funcs
 from Packages.logic.filefunc import get_funcs
 from Packages.logic import json_funcs
 from Packages.apps.maya_app.funcs import debug_funcs
-from Packages.utils.constants.constants_old import PYTHON_W
+from Packages.logic import publish_jobs
+from Packages.utils import tracing
+from Packages.utils.listing_cache import listing_cache
 
 
+@tracing.traced('maya.increment_edit')
 def increment_edit():
     '''
     Incrémente et sauvegarde la version du fichier en cours.
@@ -23,12 +25,14 @@ def increment_edit():
 
     cmds.file(rename=new_file_path)
     cmds.file(save=True)
+    listing_cache.invalidate(parent_directory)
     om.MGlobal.displayInfo(f'{new_file_name} saved.')
     json_funcs.set_recent_file(new_file_path)
 
     playblast.update_thumbnail()
 
 
+@tracing.traced('maya.publish')
 def publish(del_colon: bool = True, variant: str = '', usd=False):
     '''
     Publier le fichier et gérer les sauvegardes des anciennes versions.
@@ -71,28 +75,26 @@ def publish(del_colon: bool = True, variant: str = '', usd=False):
 
         # Déplacer le fichier existant dans le dossier backup avec le nouveau nom
         shutil.move(publish_file_path, backup_file_path)
+        listing_cache.invalidate(backup_directory)
         print(f"Fichier sauvegardé sous : {backup_file_path}")
 
     # 4 - Exporter la sélection sous le nom de publication
-    cmds.file(publish_file_path, force=True, options="v=0", type="mayaAscii", exportSelected=True,
-              preserveReferences=False)
-    playblast.create_thumbnail(publish_file_name, increment=True)
-
-    # Afficher un message de confirmation après l'export
-    msg = QMessageBox()
-    msg.setIcon(QMessageBox.Information)
-    msg.setText("L'export du fichier a été réalisé avec succès.")
-    msg.setInformativeText(f"Emplacement du fichier :\n{publish_file_path}")
-    msg.setWindowTitle("Export réussi")
-    msg.setStandardButtons(QMessageBox.Ok)
-    msg.exec_()
-
-    # 5 - Suppression des deux-points si nécessaire
+    with tracing.span('maya.publish.export', path=publish_file_path):
+        cmds.file(publish_file_path, force=True, options="v=0", type="mayaAscii", exportSelected=True,
+                  preserveReferences=False)
+    listing_cache.invalidate(publish_directory)
+    with tracing.span('maya.publish.thumbnail'):
+        playblast.create_thumbnail(publish_file_name, increment=True)
+
+    # 5 - Suppression des deux-points hors de Maya (worker de publication)
     if del_colon:
+        shading_nodes = debug_funcs.list_shading_nodes()
         try:
-            os.system(PYTHON_W, f'delete_colon.py "{publish_file_path}"')
-            print('SUCCESS PYTHON W')
-        except:
-            print('FAILED PYTHON W')
-            shading_nodes = debug_funcs.list_shading_nodes()
+            publish_jobs.submit_delete_colon(publish_file_path, shading_nodes)
+        except Exception as e:
+            print(f'Publish job failed ({e}), colon cleanup done in Maya')
             debug_funcs.delete_colon(publish_file_path, shading_nodes)
+
+    # Confirmation non bloquante : l'artiste reprend la main tout de suite
+    om.MGlobal.displayInfo(f'{publish_file_name} published : {publish_file_path}')
+    cmds.inViewMessage(assistMessage=f"Export réussi : <hl>{publish_file_name}</hl>", position='topCenter', fade=True)
@@ -3,6 +3,7 @@ __author__ = "Apolline Royer"
 from maya import cmds
 import os
 from Packages.logic.json_funcs import set_recent_file
+from Packages.utils.copy_engine import materialize_file
 
 #IMPORTING FILES
 
@@ -168,6 +169,10 @@ def open_maya_file(file_path):
         file_path (str): The path to the Maya file to be opened.
     """
     if cmds.file(file_path, q=True, exists=True):
+        try:
+            materialize_file(file_path)
+        except OSError as e:
+            print(f"Could not materialize {file_path}: {e}")
         cmds.file(file_path, open=True, force=True)
         print("Maya file opened successfully: " + file_path)
         set_recent_file(file_path)
@@ -39,22 +39,13 @@ def get_username():
     pipezer_dir = os.path.join(user_home_dir, '.pipezer')
     user_file_path = os.path.join(pipezer_dir, 'user.json')
 
-    print(f"Chemin complet pour user.json : {user_file_path}")
-
     try:
         if os.path.exists(user_file_path):
-            print("Fichier user.json trouvé. Contenu :")
             with open(user_file_path, 'r') as user_file:
                 data = json.load(user_file)
-                print(f"Données chargées depuis user.json : {data}")
                 username = data.get("username")
                 if username:
-                    print(f"Nom d'utilisateur extrait : {username}")
                     return username
-                else:
-                    print("Clé 'username' absente dans user.json.")
-        else:
-            print("Fichier user.json introuvable.")
     except Exception as e:
         print(f"Erreur lors de la lecture de user.json : {e}")
 
@@ -208,9 +199,10 @@ def publish_usd_asset(start_frame=1, end_frame=1, use_catmull_clark=True):
     # Obtenir le nom de l'utilisateur
     username = get_username()
 
-    # Ajouter des notifications pour les deux fichiers exportés
-    add_notification(username, "export", os.path.basename(geo_file_path))
-    add_notification(username, "export", os.path.basename(asset_file_path))
+    # Ajouter des notifications pour les deux fichiers exportés (écrites par le worker de publication)
+    from Packages.logic import publish_jobs
+    publish_jobs.submit_notification(username, "export", os.path.basename(geo_file_path))
+    publish_jobs.submit_notification(username, "export", os.path.basename(asset_file_path))
 
     # Créer des miniatures pour les fichiers USD
     playblast.create_thumbnail(geo_file_name, increment=True, ext='.usd')
@@ -4,6 +4,7 @@ from PySide2.QtWidgets import QDialog, QWidget, QVBoxLayout, QRadioButton, QPush
 from Packages.apps.maya_app.ui.maya_main_window import maya_main_window
 from Packages.utils.constants.constants_old import ASSET_DIR, PREFIX, WORKSPACE_MEL_PATH
 from Packages.utils.constants.project_pipezer_data import CURRENT_PROJECT
+from Packages.utils.listing_cache import listing_cache
 from maya import cmds
 import maya.api.OpenMaya as om
 from PySide2.QtGui import QFont
@@ -58,23 +59,16 @@ def get_username():
 
     try:
         if os.path.exists(user_file_path):
-            print(f"Chargement de {user_file_path} pour récupérer le nom d'utilisateur.")
             with open(user_file_path, 'r') as user_file:
                 data = json.load(user_file)
                 username = data.get("username")
                 if username:
-                    print(f"Nom d'utilisateur trouvé dans user.json : {username}")
                     return username
-                else:
-                    print("Clé 'username' absente dans user.json.")
-        else:
-            print(f"Fichier user.json introuvable à : {user_file_path}")
     except Exception as e:
         print(f"Erreur lors de la récupération de l'utilisateur : {e}")
 
     # Retour par défaut si user.json est absent ou invalide
     default_username = os.getenv("USERNAME", "unknown_user")
-    print(f"Utilisation du nom par défaut : {default_username}")
     return default_username
 
 
@@ -311,6 +305,7 @@ class CreateAssetDialog(QDialog):
         file_path_geo = os.path.join(maya_directory, 'scenes', 'geo', file_name_geo)
         cmds.file(rename=file_path_geo)
         cmds.file(save=True, type='mayaAscii')
+        listing_cache.invalidate(os.path.dirname(file_path_geo))
 
         # Créer des fichiers pour les départements restants (ldv, rig) si sélectionnés
         for dep in ['ldv', 'rig']:
@@ -328,6 +323,7 @@ class CreateAssetDialog(QDialog):
             tmp_dep_file_path = os.path.join(directory_dep, file_name_geo)
             new_dep_file_path = os.path.join(directory_dep, file_name_dep)
             os.rename(tmp_dep_file_path, new_dep_file_path)
+            listing_cache.invalidate(directory_dep)
 
         # Créer les groupes de base si sélectionné
         if self.create_groups_button.isChecked():
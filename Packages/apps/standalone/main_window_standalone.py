@@ -5,15 +5,14 @@ Fenêtre principale standalone moderne
 import os
 from Packages.ui.base_main_window import BaseMainWindow
 from Packages.ui.modern_main_window import ModernMainWindow
-from Packages.ui.modern_settings_widget import ModernSettingsWidget
 from Packages.ui.content_migrator import ContentMigrator
 from Packages.ui.widgets import OpenFileWidget
 from Packages.utils.logger import init_logger
+from Packages.utils.listing_cache import listing_cache
+from Packages.utils import tracing
 from Packages.logic import json_funcs
-from PySide2.QtCore import Qt, QSize
+from PySide2.QtCore import Qt, QSize, QTimer
 from PySide2.QtGui import QIcon
-from PySide2.QtWidgets import QVBoxLayout, QLabel
-from PySide2.QtWidgets import QPushButton, QVBoxLayout, QHBoxLayout, QSpacerItem, QSizePolicy
 from Packages.ui.dialogs.create_shot_dialog import CreateShotDialog
 from Packages.ui.base_main_window import CreateAssetDialogStandalone
 
@@ -42,15 +41,17 @@ class MainWindowStandalone(ModernMainWindow):
         username = get_username()
         self.set_username(username)
         
-        # Intégrer le contenu existant dans les pages
+        # Seule la page par défaut est construite au démarrage,
+        # les autres le sont à la première navigation ou quand l'application est inactive
         self.setup_browser_content()
-        self.setup_recent_content()
-        self.setup_search_content()
-        self.setup_asset_content()
-        self.setup_shot_content()
-        self.setup_settings_content()
-        self.setup_crash_content()
-        self.setup_notifications_content()
+        self.register_page_builder(self.recent_page, self.setup_recent_content)
+        self.register_page_builder(self.search_page, self.setup_search_content)
+        self.register_page_builder(self.asset_page, self.setup_asset_content)
+        self.register_page_builder(self.shot_page, self.setup_shot_content)
+        self.register_page_builder(self.settings_page, self.setup_settings_content)
+        self.register_page_builder(self.crash_page, self.setup_crash_content)
+        self.register_page_builder(self.notifications_page, self.setup_notifications_content)
+        self.schedule_prewarm([self.recent_page, self.search_page, self.notifications_page, self.settings_page, self.crash_page])
         
         # Connecter les signaux
         self.connect_signals()
@@ -58,14 +59,17 @@ class MainWindowStandalone(ModernMainWindow):
         # Configurer le mode développeur après que tout le contenu soit créé
         self.configure_dev_mode()
         
+    def on_page_built(self, page):
+        """Applique le mode développeur au contenu d'une page construite à la demande"""
+        self.configure_dev_mode()
+        
     def setup_browser_content(self):
         """Configure le contenu de la page Browser"""
         # Utiliser le ContentMigrator pour créer le contenu du browser
         self.browser_content = ContentMigrator.create_browser_content(self, self.current_directory)
         
         # Ajouter au layout de la page
-        layout = QVBoxLayout(self.browser_page)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = self.get_page_layout(self.browser_page)
         layout.addWidget(self.browser_content)
         
     def setup_recent_content(self):
@@ -74,8 +78,7 @@ class MainWindowStandalone(ModernMainWindow):
         self.recent_content = ContentMigrator.create_recent_content(self)
         
         # Ajouter au layout de la page
-        layout = QVBoxLayout(self.recent_page)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = self.get_page_layout(self.recent_page)
         layout.addWidget(self.recent_content)
         
     def setup_search_content(self):
@@ -84,8 +87,7 @@ class MainWindowStandalone(ModernMainWindow):
         self.search_content = ContentMigrator.create_search_content(self)
         
         # Ajouter au layout de la page
-        layout = QVBoxLayout(self.search_page)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = self.get_page_layout(self.search_page)
         layout.addWidget(self.search_content)
         
     def setup_asset_content(self):
@@ -94,8 +96,7 @@ class MainWindowStandalone(ModernMainWindow):
         self.asset_content = ContentMigrator.create_asset_content(self)
         
         # Ajouter au layout de la page
-        layout = QVBoxLayout(self.asset_page)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = self.get_page_layout(self.asset_page)
         layout.addWidget(self.asset_content)
         
     def setup_shot_content(self):
@@ -104,20 +105,20 @@ class MainWindowStandalone(ModernMainWindow):
         self.shot_content = ContentMigrator.create_shot_content(self)
         
         # Ajouter au layout de la page
-        layout = QVBoxLayout(self.shot_page)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = self.get_page_layout(self.shot_page)
         layout.addWidget(self.shot_content)
         
     def setup_settings_content(self):
         """Configure le contenu de la page Settings"""
         # Intégrer le widget de paramètres moderne
-        layout = QVBoxLayout(self.settings_page)
-        layout.setContentsMargins(0, 0, 0, 0)
+        from Packages.ui.modern_settings_widget import ModernSettingsWidget
+        layout = self.get_page_layout(self.settings_page)
         self.settings_widget = ModernSettingsWidget(self)
         layout.addWidget(self.settings_widget)
         
         # Synchroniser le thème
         self.settings_widget.set_theme(self.current_theme)
+        self.settings_widget.settings_changed.connect(self.on_settings_changed)
         
     def setup_crash_content(self):
         """Configure le contenu de la page Crash"""
@@ -125,8 +126,7 @@ class MainWindowStandalone(ModernMainWindow):
         self.crash_content = ContentMigrator.create_crash_content(self)
         
         # Ajouter au layout de la page
-        layout = QVBoxLayout(self.crash_page)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = self.get_page_layout(self.crash_page)
         layout.addWidget(self.crash_content)
         
     def setup_notifications_content(self):
@@ -137,16 +137,16 @@ class MainWindowStandalone(ModernMainWindow):
         self.notifications_widget = NotificationsWidget(self)
         
         # Ajouter au layout de la page
-        layout = QVBoxLayout(self.notifications_page)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = self.get_page_layout(self.notifications_page)
         layout.addWidget(self.notifications_widget)
+
+        # Traitements de publication en cours (file d'attente du worker)
+        from Packages.ui.widgets.publish_jobs_widget import PublishJobsWidget
+        self.publish_jobs_widget = PublishJobsWidget(self)
+        layout.addWidget(self.publish_jobs_widget)
         
     def connect_signals(self):
         """Connecte les signaux"""
-        # Connecter le signal de changement de paramètres
-        if hasattr(self, 'settings_widget'):
-            self.settings_widget.settings_changed.connect(self.on_settings_changed)
-            
         # Connecter les boutons du header
         if hasattr(self, 'refresh_button'):
             self.refresh_button.clicked.connect(self.refresh_current_content)
@@ -178,6 +178,8 @@ class MainWindowStandalone(ModernMainWindow):
         if current_index == 0:  # Browser
             if hasattr(self, 'browser_content') and hasattr(self.browser_content, 'current_directory'):
                 # Rafraîchir l'affichage des fichiers (le filtrage est géré dans le ContentMigrator)
+                if hasattr(self.browser_content, 'directory_loader'):
+                    self.browser_content.directory_loader.invalidate()
                 if hasattr(self.browser_content, 'browser_file_table'):
                     self.browser_content.browser_file_table.setRowCount(0)
                     # Le filtrage sera géré par la fonction update_filtered_file_table
@@ -199,10 +201,10 @@ class MainWindowStandalone(ModernMainWindow):
             if hasattr(self, 'settings_widget'):
                 # Rafraîchir les paramètres si nécessaire
                 pass
-        elif current_index == 6:  # Crash
+        elif current_index == 7:  # Crash
             # Pas de rafraîchissement nécessaire pour la page Crash
             pass
-        elif current_index == 7:  # Notifications
+        elif current_index == 6:  # Notifications
             if hasattr(self, 'notifications_widget'):
                 # Rafraîchir les notifications
                 self.notifications_widget.load_notifications()
@@ -223,6 +225,24 @@ class MainWindowStandalone(ModernMainWindow):
                 self.recent_content.open_file_widget_recent.prefs_button.show()
             if hasattr(self, 'search_content') and hasattr(self.search_content, 'open_file_widget_search_file'):
                 self.search_content.open_file_widget_search_file.prefs_button.show()
+            
+            # Compteurs du cache de listings dans la barre de statut
+            if not hasattr(self, 'listing_cache_timer'):
+                self.listing_cache_timer = QTimer(self)
+                self.listing_cache_timer.timeout.connect(self.update_listing_cache_stats)
+            self.listing_cache_timer.start(2000)
+            self.update_listing_cache_stats()
+            
+            # Panneau de performances (spans, caches, workers, blocages de l'interface)
+            if not hasattr(self, 'dev_mode_dock'):
+                from PySide2.QtWidgets import QDockWidget
+                from Packages.ui.widgets.dev_mode_widget import devModeWidget
+                self.dev_mode_dock = QDockWidget("Dev mode", self)
+                self.dev_mode_dock.setObjectName("dev_mode_dock")
+                self.dev_mode_dock.setWidget(devModeWidget(self.dev_mode_dock))
+                self.addDockWidget(Qt.BottomDockWidgetArea, self.dev_mode_dock)
+            self.dev_mode_dock.show()
+            tracing.set_enabled(True)
         else:
             # Masquer les boutons de préférences
             if hasattr(self, 'browser_content') and hasattr(self.browser_content, 'open_file_widget_browser'):
@@ -231,6 +251,25 @@ class MainWindowStandalone(ModernMainWindow):
                 self.recent_content.open_file_widget_recent.prefs_button.hide()
             if hasattr(self, 'search_content') and hasattr(self.search_content, 'open_file_widget_search_file'):
                 self.search_content.open_file_widget_search_file.prefs_button.hide()
+            
+            if hasattr(self, 'listing_cache_timer'):
+                self.listing_cache_timer.stop()
+                self.statusBar().clearMessage()
+            
+            if hasattr(self, 'dev_mode_dock'):
+                self.dev_mode_dock.hide()
+                tracing.set_enabled(False)
+
+    def update_listing_cache_stats(self):
+        """Affiche les compteurs du cache de listings (mode développeur)"""
+        stats = listing_cache.stats()
+        total = stats['hits'] + stats['misses']
+        hit_rate = stats['hits'] / total * 100 if total else 0.0
+        self.statusBar().showMessage(
+            f"Listing cache : {stats['hits']} hits / {stats['misses']} misses ({hit_rate:.0f}%) - "
+            f"{stats['revalidations']} revalidations, {stats['relists']} relists - "
+            f"{stats['directories']} dossiers, {stats['watched']} surveillés"
+        )
 
     def refresh_interface_texts(self):
         """Rafraîchit tous les textes de l'interface selon la langue actuelle"""
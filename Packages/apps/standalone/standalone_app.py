@@ -11,9 +11,9 @@ from Packages.logic.json_funcs.convert_funcs import dict_to_json
 from Packages.utils.constants.version import VERSION, USER_VERSION
 from Packages.utils.constants.project_pipezer_data import CURRENT_PROJECT
 from Packages.utils.constants.preferences import (
-    USER_PREFS, BLANK_PREFS,
+    USER_PREFS,
     VERSION_JSON_PATH, BLANK_VERSION_JSON_PATH,
-    APPS_JSON_PATH, CURRENT_PROJECT_JSON_PATH
+    CURRENT_PROJECT_JSON_PATH
 )
 from Packages.utils.funcs import get_current_value
 from Packages.utils.constants.maya_pref import (
@@ -28,16 +28,19 @@ from Packages.utils.constants.houdini_pref import (
     H_SHELF_PIPEZER_NAME, H_SHELF_PIPEZER_SOURCE,
     HOUDINI_SHELF_PATH, HOUDINI_MENU_PATH
 )
-from Packages.utils.app_finder import AppFinder
 from Packages.utils.init_project import InitProject
 from Packages.ui.dialogs.preferences_dialog import PreferencesDialog
 from Packages.utils.translation import translation_manager
+from Packages.utils.theme_engine import theme_engine
 
 
 class PipeZerApp(QApplication):
 
     def __init__(self, argv=sys.argv):
         super(PipeZerApp, self).__init__(argv)
+
+        # La QApplication est à PipeZer : feuille de style globale
+        theme_engine.standalone = True
         
         # Afficher le dialog de chargement
         self.loading_dialog = LoadingDialog()
@@ -57,10 +60,7 @@ class PipeZerApp(QApplication):
         # Charger les préférences de langue
         translation_manager.load_language_preference()
         
-        # Effectuer les vérifications restantes
-        self.check_pref()
-        self.find_apps()
-
+        # Les préférences et la recherche des applications ont été faites par le LoadingThread
         # Vérifier si c'est le premier lancement ou si les préférences sont manquantes
         if self.is_first_launch() or not self.has_valid_preferences():
             # Afficher le dialog de préférences
@@ -169,10 +169,9 @@ class PipeZerApp(QApplication):
         """Configure le pipeline selon le choix de l'utilisateur"""
         try:
             if choice == "create_new":
-                # Créer les dossiers par défaut
-                for folder in ['04_asset', '05_shot', '02_ressource']:
-                    folder_path = os.path.join(project_path, folder)
-                    os.makedirs(folder_path, exist_ok=True)
+                # Créer les dossiers par défaut (organisation 'project' de ProjectFiles/Templates/layouts.json)
+                from Packages.logic.layout_spec import apply_layout
+                apply_layout('project', project_path, project=project_path)
                 print("Dossiers de pipeline créés avec succès")
                 
             elif choice == "use_existing":
@@ -206,47 +205,6 @@ class PipeZerApp(QApplication):
                     file.write(content)
                     print(f"Création du fichier : {file_path}")
 
-    def find_apps(self):
-        apps_dict = AppFinder().app_dict
-        with open(APPS_JSON_PATH, 'w', encoding='utf-8') as file:
-            json.dump(apps_dict, file, indent=4, ensure_ascii=False)
-
-    def check_pref(self):
-        self.check_pipezer_pref()
-        self.check_maya_pref()
-        self.check_houdini_pref()
-
-    def check_pipezer_pref(self):
-        if not os.path.exists(USER_PREFS):
-            shutil.copytree(BLANK_PREFS, USER_PREFS)
-            return
-
-        for json_file in os.listdir(BLANK_PREFS):
-            json_file_path = os.path.join(USER_PREFS, json_file)
-            if not os.path.exists(json_file_path):
-                shutil.copy(os.path.join(BLANK_PREFS, json_file), USER_PREFS)
-
-    def check_maya_pref(self):
-        if not os.path.exists(os.path.join(MAYA_SHELF_PATH, SHELF_PIPEZER_NAME)):
-            shutil.copy(SHELF_PIPEZER_SOURCE, MAYA_SHELF_PATH)
-
-        if not os.path.exists(os.path.join(MAYA_MENU_PATH, MENU_PIPEZER_NAME)):
-            shutil.copy(MENU_PIPEZER_SOURCE, MAYA_MENU_PATH)
-
-        if not os.path.exists(os.path.join(MAYA_SCRIPTS_PATH, USER_SETUP_NAME)):
-            shutil.copy(USER_SETUP_SOURCE, MAYA_SCRIPTS_PATH)
-
-        for icon, icon_source in zip(ICONS, ICONS_PATHS_SOURCE):
-            if not os.path.exists(os.path.join(MAYA_ICON_PATH, icon)):
-                shutil.copy(icon_source, MAYA_ICON_PATH)
-
-    def check_houdini_pref(self):
-        if not os.path.exists(os.path.join(HOUDINI_SHELF_PATH, H_SHELF_PIPEZER_NAME)):
-            shutil.copy(H_SHELF_PIPEZER_SOURCE, HOUDINI_SHELF_PATH)
-
-        if not os.path.exists(os.path.join(HOUDINI_MENU_PATH, H_MENU_PIPEZER_NAME)):
-            shutil.copy(H_MENU_PIPEZER_SOURCE, HOUDINI_MENU_PATH)
-
     def update_pipezer_pref(self):
         if self.VERSION == self.USER_VERSION:
             return
@@ -0,0 +1,2 @@
+from Packages.benchmark.generator import generate_project
+from Packages.benchmark.benchmarks import run_benchmarks, build_report, compare_reports
@@ -0,0 +1,66 @@
+"""
+Usage :
+    python -m Packages.benchmark --assets 200 --shots 50 --versions 10 --output bench.json
+    python -m Packages.benchmark --output bench_new.json --compare bench.json
+"""
+
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+from Packages.benchmark.generator import generate_project
+from Packages.benchmark.benchmarks import BENCHMARKS, run_benchmarks, build_report, format_report, compare_reports
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Mesures de performance de PipeZer sur un projet synthétique')
+    parser.add_argument('--assets', type=int, default=50, help="Nombre d'assets")
+    parser.add_argument('--shots', type=int, default=20, help='Nombre de plans')
+    parser.add_argument('--versions', type=int, default=5, help="Nombre de versions d'edit par département")
+    parser.add_argument('--metadata-size', type=int, default=200, help='Longueur des commentaires de file_data.json')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5, help='Nombre de répétitions de chaque mesure')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), default=None, help='Mesures à lancer')
+    parser.add_argument('--root', default=None, help='Dossier où générer le projet (temporaire par défaut)')
+    parser.add_argument('--keep', action='store_true', help='Conserver le projet généré')
+    parser.add_argument('--output', default=None, help='Fichier JSON où écrire les résultats')
+    parser.add_argument('--compare', default=None, help='Rapport JSON précédent à comparer')
+    args = parser.parse_args(argv)
+
+    parameters = {
+        'assets': args.assets,
+        'shots': args.shots,
+        'versions': args.versions,
+        'metadata_size': args.metadata_size,
+        'seed': args.seed,
+        'repeat': args.repeat,
+    }
+
+    root = args.root or tempfile.mkdtemp(prefix='pipezer_benchmark_')
+    try:
+        project = generate_project(root, args.assets, args.shots, args.versions, args.metadata_size, seed=args.seed)
+        results = run_benchmarks(project, args.repeat, args.only)
+    finally:
+        if not args.keep and not args.root:
+            shutil.rmtree(root, ignore_errors=True)
+
+    report = build_report(project, parameters, results)
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=4)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            previous = json.load(file)
+        if previous.get('parameters') != parameters:
+            print('\nWarning: the reports were made with different parameters')
+        print('\n' + compare_reports(previous, report))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,260 @@
+"""
+Mesures de performance de PipeZer sur un projet synthétique (voir generator.py).
+
+Chaque mesure est répétée et résumée (min, médiane, moyenne, max en ms) : la
+médiane est la valeur à comparer d'un commit à l'autre.
+"""
+
+import io
+import os
+import sys
+import time
+import platform
+import statistics
+import subprocess
+import contextlib
+from Packages.utils.listing_cache import listing_cache
+from Packages.logic.filefunc import get_funcs as file_get_funcs
+from Packages.logic.json_funcs import get_funcs as json_get_funcs
+from Packages.utils.funcs import forward_slash
+
+
+PIPEZER_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Nombre de lignes ajoutées au tableau (un résultat de recherche en affiche au plus 100)
+TABLE_ROWS = 100
+
+
+def measure(func, repeat: int = 5, setup=None) -> dict:
+    """Exécute func repeat fois (setup avant chaque exécution, hors mesure) et résume les durées"""
+    durations = []
+    ops = 0
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        ops = func()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    median = statistics.median(durations)
+    return {
+        'ops': ops,
+        'repeat': repeat,
+        'min_ms': min(durations),
+        'median_ms': median,
+        'mean_ms': statistics.mean(durations),
+        'max_ms': max(durations),
+        'per_op_us': median * 1000 / ops if ops else 0.0,
+    }
+
+
+@contextlib.contextmanager
+def use_project_file_data(file_data_path: str):
+    """Fait lire file_data.json du projet synthétique au lieu de celui du projet courant"""
+    previous = json_get_funcs.pipezer_data_FILE_DATA
+    json_get_funcs.pipezer_data_FILE_DATA = file_data_path
+    json_get_funcs._file_data_cache['mtime'] = None
+    try:
+        yield
+    finally:
+        json_get_funcs.pipezer_data_FILE_DATA = previous
+        json_get_funcs._file_data_cache['mtime'] = None
+
+
+def _reset_file_data_cache():
+    json_get_funcs._file_data_cache['mtime'] = None
+
+
+#benchmarks -----------------------------------------------------------------------
+
+def bench_search(project: dict, repeat: int) -> dict:
+    """Recherche d'un nom présent (arrêt à 100 résultats) et d'un nom absent (parcours complet)"""
+    def search_hit():
+        return len(file_get_funcs.search_files(project['path'], '_rig_', max_results=100))
+
+    def search_miss():
+        file_get_funcs.search_files(project['path'], 'no_such_file', max_results=100)
+        return 1
+
+    return {
+        'search.hit': measure(search_hit, repeat),
+        'search.miss': measure(search_miss, repeat),
+    }
+
+
+def bench_listing(project: dict, repeat: int) -> dict:
+    """Listing des dossiers d'edit et de publish, sans cache puis depuis le cache"""
+    directories = project['edit_directories'] + project['publish_directories']
+
+    def list_all():
+        for directory in directories:
+            file_get_funcs.get_files(directory)
+        return len(directories)
+
+    results = {'listing.cold': measure(list_all, repeat, setup=listing_cache.invalidate)}
+    list_all()
+    results['listing.warm'] = measure(list_all, repeat)
+    return results
+
+
+def bench_metadata(project: dict, repeat: int) -> dict:
+    """Lecture des métadonnées (commentaire, utilisateur) de chaque fichier d'edit"""
+    # Clés de file_data.json : chemins complets, comme set_funcs.update_file_data
+    file_paths = [forward_slash(file_path) for file_path in project['edit_files']]
+
+    def lookup_all():
+        for file_path in file_paths:
+            json_get_funcs.get_file_data(file_path)
+        return len(file_paths)
+
+    def lookup_first():
+        json_get_funcs.get_file_data(file_paths[0])
+        return 1
+
+    with use_project_file_data(project['file_data_path']):
+        return {
+            'metadata.load': measure(lookup_first, repeat, setup=_reset_file_data_cache),
+            'metadata.lookup': measure(lookup_all, repeat),
+        }
+
+
+def bench_version_increment(project: dict, repeat: int) -> dict:
+    """Nom de la version suivante de la dernière version d'edit de chaque dossier"""
+    last_files = []
+    for directory in project['edit_directories']:
+        files = file_get_funcs.get_files(directory)
+        if files:
+            last_files.append(os.path.join(directory, files[-1]))
+
+    def increment_all():
+        # return_increment_edit affiche le nouveau chemin
+        with contextlib.redirect_stdout(io.StringIO()):
+            for file_path in last_files:
+                file_get_funcs.return_increment_edit(file_path)
+        return len(last_files)
+
+    return {'version.increment': measure(increment_all, repeat)}
+
+
+def bench_publish_naming(project: dict, repeat: int) -> dict:
+    """Nom de publication, version affichée et incrément de publication de chaque fichier d'edit"""
+    file_names = [os.path.basename(file_path) for file_path in project['edit_files']]
+    publish_lists = []
+    for directory in project['publish_directories']:
+        publish_files = file_get_funcs.get_files(directory)
+        old_files = file_get_funcs.get_files(os.path.join(directory, 'OLD'))
+        if publish_files:
+            publish_lists.append((publish_files[0], old_files))
+
+    def name_all():
+        for file_name in file_names:
+            publish_name = file_get_funcs.return_publish_name(file_name)
+            file_get_funcs.get_version_num(file_name)
+            file_get_funcs.get_version_num(publish_name)
+        for publish_name, old_files in publish_lists:
+            file_get_funcs.return_increment_publish_name(publish_name, list(old_files))
+        return len(file_names) + len(publish_lists)
+
+    return {'publish.naming': measure(name_all, repeat)}
+
+
+def bench_table(project: dict, repeat: int) -> dict:
+    """Remplissage du tableau de fichiers (seulement si PySide2 est disponible)"""
+    try:
+        from PySide2.QtWidgets import QApplication
+    except ImportError:
+        return {}
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    from Packages.ui.widgets.custom_table_widget import CustomTableWidget
+
+    table = CustomTableWidget()
+    table.setColumnCount(5)
+    file_paths = project['edit_files'][:TABLE_ROWS]
+
+    def fill():
+        table.setUpdatesEnabled(False)
+        for file_path in file_paths:
+            table.add_item(file_path)
+        table.setUpdatesEnabled(True)
+        app.processEvents()
+        return len(file_paths)
+
+    with use_project_file_data(project['file_data_path']):
+        result = {'table.fill': measure(fill, repeat, setup=lambda: table.setRowCount(0))}
+
+    table.deleteLater()
+    return result
+
+
+BENCHMARKS = {
+    'search': bench_search,
+    'listing': bench_listing,
+    'metadata': bench_metadata,
+    'version': bench_version_increment,
+    'publish': bench_publish_naming,
+    'table': bench_table,
+}
+
+
+#report ---------------------------------------------------------------------------
+
+def get_commit() -> str:
+    try:
+        process = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PIPEZER_ROOT,
+                                 capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return process.stdout.strip() or None
+
+
+def run_benchmarks(project: dict, repeat: int = 5, selected=None) -> dict:
+    """Lance les mesures sélectionnées (toutes par défaut) et retourne {nom: résumé}"""
+    results = {}
+    for name, benchmark in BENCHMARKS.items():
+        if selected and name not in selected:
+            continue
+        results.update(benchmark(project, repeat))
+    return results
+
+
+def build_report(project: dict, parameters: dict, results: dict) -> dict:
+    return {
+        'commit': get_commit(),
+        'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'parameters': parameters,
+        'project': {
+            'files': project['file_count'],
+            'edit_directories': len(project['edit_directories']),
+            'generation_seconds': project['generation_seconds'],
+        },
+        'results': results,
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [f"PipeZer benchmark ({report['commit'] or 'unknown commit'}, python {report['python']}, "
+             f"{report['project']['files']} files)", '']
+    lines.append(f"{'benchmark':<20} {'ops':>6} {'median ms':>10} {'min ms':>10} {'per op us':>10}")
+    for name, result in report['results'].items():
+        lines.append(f"{name:<20} {result['ops']:>6} {result['median_ms']:>10.2f} "
+                     f"{result['min_ms']:>10.2f} {result['per_op_us']:>10.1f}")
+    return '\n'.join(lines)
+
+
+def compare_reports(previous: dict, current: dict) -> str:
+    """Écart des médianes entre deux rapports (négatif = plus rapide)"""
+    lines = [f"{previous.get('commit') or '?'} -> {current.get('commit') or '?'}", '']
+    lines.append(f"{'benchmark':<20} {'before ms':>10} {'after ms':>10} {'change':>8}")
+    for name, result in current['results'].items():
+        before = previous.get('results', {}).get(name)
+        if before is None:
+            lines.append(f"{name:<20} {'-':>10} {result['median_ms']:>10.2f} {'new':>8}")
+            continue
+        change = (result['median_ms'] - before['median_ms']) / before['median_ms'] * 100 if before['median_ms'] else 0.0
+        lines.append(f"{name:<20} {before['median_ms']:>10.2f} {result['median_ms']:>10.2f} {change:>+7.1f}%")
+    return '\n'.join(lines)
@@ -0,0 +1,142 @@
+"""
+Génération d'un projet synthétique qui suit l'arborescence et le nommage réels de PipeZer :
+
+    <PROJECT>/04_asset/<type>/<asset>/<dept>/maya/scenes/edit/PROJECT_type_asset_dept_E_XXX.ma
+    <PROJECT>/04_asset/<type>/<asset>/<dept>/maya/scenes/publish/PROJECT_type_asset_dept_P.ma (+ OLD/..._P_XXX.ma)
+    <PROJECT>/05_shot/seqXXX/shXXX/<dept>/maya/scenes/edit/PROJECT_seqXXX_shXXX_dept_E_XXX.ma
+    <PROJECT>/.pipezer_data/file_data.json, prefix.json, variants.json, preview/<fichier>.png
+
+Le contenu est déterministe pour une même graine (seed).
+"""
+
+import os
+import json
+import time
+import random
+import string
+import base64
+from Packages.utils.funcs import forward_slash
+
+
+ASSET_TYPES = ['01_character', '02_prop', '03_item', '04_enviro', '05_module']
+ASSET_DEPARTMENTS = ['geo', 'ldv', 'rig']
+SHOT_DEPARTMENTS = {'01_animation': 'anim', '02_lighting': 'light', '04_fx': 'fx'}
+SHOTS_PER_SEQUENCE = 10
+USERS = ['alice', 'bruno', 'chloe', 'david', 'emma']
+
+# PNG 1x1 transparent (aperçus)
+_PREVIEW_PNG = base64.b64decode(
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=='
+)
+_SCENE_CONTENT = '//Maya ASCII 2024 scene\nrequires maya "2024";\n'
+
+
+def _write(path: str, content):
+    mode = 'wb' if isinstance(content, bytes) else 'w'
+    with open(path, mode) as file:
+        file.write(content)
+
+
+def _create_scene_folders(dept_path: str, base_name: str, versions: int, project: dict):
+    """Crée le projet maya d'un département avec versions d'edit et publications"""
+    maya_path = os.path.join(dept_path, 'maya')
+    edit_path = os.path.join(maya_path, 'scenes', 'edit')
+    publish_path = os.path.join(maya_path, 'scenes', 'publish')
+    old_path = os.path.join(publish_path, 'OLD')
+    os.makedirs(edit_path)
+    os.makedirs(old_path)
+    _write(os.path.join(maya_path, 'workspace.mel'), '//Maya workspace\n')
+
+    edit_files = []
+    for version in range(1, versions + 1):
+        file_name = f'{base_name}_E_{version:03}.ma'
+        _write(os.path.join(edit_path, file_name), _SCENE_CONTENT)
+        edit_files.append(file_name)
+
+    # Une publication par version d'edit sur deux, les anciennes dans OLD
+    publish_count = max(1, versions // 2)
+    for version in range(1, publish_count):
+        _write(os.path.join(old_path, f'{base_name}_P_{version:03}.ma'), _SCENE_CONTENT)
+    _write(os.path.join(publish_path, f'{base_name}_P.ma'), _SCENE_CONTENT)
+
+    project['edit_directories'].append(edit_path)
+    project['publish_directories'].append(publish_path)
+    project['edit_files'].extend(os.path.join(edit_path, file_name) for file_name in edit_files)
+
+
+def generate_project(root: str, assets: int = 50, shots: int = 20, versions: int = 5,
+                     metadata_size: int = 200, name: str = 'BENCH', seed: int = 0) -> dict:
+    """
+    Génère un projet synthétique dans root et retourne sa description :
+    chemins du projet, dossiers d'edit et de publish, fichiers d'edit et nombre de fichiers créés.
+    metadata_size est la longueur des commentaires enregistrés dans file_data.json.
+    """
+    start = time.perf_counter()
+    rng = random.Random(seed)
+
+    project_path = os.path.join(root, name)
+    if os.path.exists(project_path):
+        raise FileExistsError(f'Project already exists: {project_path}')
+
+    project = {
+        'path': project_path,
+        'name': name,
+        'edit_directories': [],
+        'publish_directories': [],
+        'edit_files': [],
+    }
+
+    # Assets : 04_asset/<type>/<asset>/<dept>
+    for index in range(assets):
+        asset_type_folder = ASSET_TYPES[index % len(ASSET_TYPES)]
+        asset_type = asset_type_folder.split('_', 1)[1]
+        asset_name = f'{asset_type}{index:04}'
+        asset_path = os.path.join(project_path, '04_asset', asset_type_folder, asset_name)
+
+        for dept in ASSET_DEPARTMENTS:
+            _create_scene_folders(os.path.join(asset_path, dept), f'{name}_{asset_type}_{asset_name}_{dept}', versions, project)
+
+    # Shots : 05_shot/seqXXX/shXXX/<dept>
+    for index in range(shots):
+        sequence = f'seq{(index // SHOTS_PER_SEQUENCE + 1) * 10:03}'
+        shot = f'sh{(index % SHOTS_PER_SEQUENCE + 1) * 10:03}'
+        shot_path = os.path.join(project_path, '05_shot', sequence, shot)
+
+        for dept_folder, dept in SHOT_DEPARTMENTS.items():
+            _create_scene_folders(os.path.join(shot_path, dept_folder), f'{name}_{sequence}_{shot}_{dept}', versions, project)
+
+    # Ressources (ignorées par la recherche)
+    ressource_path = os.path.join(project_path, '02_ressource', 'references')
+    os.makedirs(ressource_path)
+    for index in range(max(1, assets // 5)):
+        _write(os.path.join(ressource_path, f'reference_{index:04}.png'), _PREVIEW_PNG)
+
+    # .pipezer_data : métadonnées de chaque fichier d'edit, aperçu de la dernière version
+    pipezer_data_path = os.path.join(project_path, '.pipezer_data')
+    preview_path = os.path.join(pipezer_data_path, 'preview')
+    os.makedirs(preview_path)
+    os.makedirs(os.path.join(pipezer_data_path, 'icons'))
+
+    letters = string.ascii_letters + '       '
+    file_data = {}
+    for file_path in project['edit_files']:
+        file_name = os.path.basename(file_path)
+        # Même clé que set_funcs.update_file_data
+        file_data[forward_slash(file_path)] = {
+            'comment': ''.join(rng.choice(letters) for _ in range(metadata_size)),
+            'user': rng.choice(USERS),
+        }
+        if file_name.endswith(f'_E_{versions:03}.ma'):
+            _write(os.path.join(preview_path, f'{file_name}.png'), _PREVIEW_PNG)
+
+    with open(os.path.join(pipezer_data_path, 'file_data.json'), 'w', encoding='utf-8') as json_file:
+        json.dump(file_data, json_file, indent=4)
+    for json_name in ('prefix.json', 'variants.json'):
+        _write(os.path.join(pipezer_data_path, json_name), '{}')
+
+    file_count = sum(len(files) for _, _, files in os.walk(project_path))
+    project['file_count'] = file_count
+    project['file_data_path'] = os.path.join(pipezer_data_path, 'file_data.json')
+    project['generation_seconds'] = time.perf_counter() - start
+
+    return project
@@ -0,0 +1,138 @@
+"""
+Mesure de la suppression des deux-points (delete_colon) sur un .ma synthétique.
+
+Usage :
+    python -m Packages.benchmark.maya_ascii_bench --size-mb 200 --nodes 3000
+    python -m Packages.benchmark.maya_ascii_bench --size-mb 20 --nodes 500 --legacy --output colon.json
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import random
+import argparse
+import tempfile
+import tracemalloc
+from Packages.logic import maya_ascii
+from Packages.benchmark.benchmarks import get_commit
+
+
+SHADING_TYPES = ['PxrSurface', 'PxrTexture', 'lambert', 'blinn', 'place2dTexture', 'file', 'aiStandardSurface']
+
+
+def generate_ma(path: str, size_mb: float, nodes: int, seed: int = 0) -> list:
+    """
+    Écrit un .ma synthétique d'environ size_mb Mo : nœuds de shading en ':<nom>' (comme à l'export),
+    connexions et données de maillage. Retourne la liste des noms de nœuds.
+    """
+    rng = random.Random(seed)
+    names = [f'{SHADING_TYPES[index % len(SHADING_TYPES)]}_{index:05}' for index in range(nodes)]
+    target = int(size_mb * 1024 * 1024)
+
+    with open(path, 'w', encoding='utf-8', newline='\n') as file:
+        file.write('//Maya ASCII 2024 scene\nrequires maya "2024";\ncurrentUnit -l centimeter -a degree -t film;\n')
+        written = 0
+        for name in names:
+            block = (f'createNode {name.rsplit("_", 1)[0]} -n ":{name}";\n'
+                     f'\tsetAttr ".diffuseColor" -type "float3" 0.5 0.5 0.5 ;\n'
+                     f'createNode shadingEngine -n ":{name}SG";\n')
+            file.write(block)
+            written += len(block)
+
+        while written < target:
+            name = rng.choice(names)
+            values = ' '.join(f'{rng.random():.4f}' for _ in range(24))
+            block = (f'createNode mesh -n "shape{written}" -p "geo{written}";\n'
+                     f'\tsetAttr -s 8 ".vt[0:7]"  {values};\n'
+                     f'connectAttr ":{name}.oc" ":{name}SG.ss";\n'
+                     f'connectAttr "shape{written}.iog" ":{name}SG.dsm" -na;\n')
+            file.write(block)
+            written += len(block)
+
+    return names
+
+
+def legacy_delete_colon(file_path: str, names: list):
+    """Ancienne version : fichier entier en mémoire, un re.sub par nœud"""
+    with open(file_path, 'r') as file:
+        content = file.read()
+    for name in names:
+        content = re.sub(rf'":{name}\w*', f'"{name}', content)
+    with open(file_path, 'w') as file:
+        file.write(content)
+
+
+def _measure(func, source: str, work_path: str) -> dict:
+    shutil.copyfile(source, work_path)
+    start = time.perf_counter()
+    func(work_path)
+    seconds = time.perf_counter() - start
+
+    # Mémoire mesurée à part : tracemalloc ralentit beaucoup les allocations
+    memory_path = f'{work_path}.memory'
+    shutil.copyfile(source, memory_path)
+    tracemalloc.start()
+    func(memory_path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    os.remove(memory_path)
+
+    size = os.path.getsize(source)
+    return {
+        'seconds': seconds,
+        'mb_per_second': size / 1024 / 1024 / seconds if seconds else 0.0,
+        'peak_memory_mb': peak / 1024 / 1024,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Mesure de delete_colon sur un .ma synthétique')
+    parser.add_argument('--size-mb', type=float, default=100)
+    parser.add_argument('--nodes', type=int, default=3000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--legacy', action='store_true', help="Mesurer aussi l'ancienne version (lente)")
+    parser.add_argument('--output', default=None, help='Fichier JSON où écrire les résultats')
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp(prefix='pipezer_ma_benchmark_')
+    try:
+        source = os.path.join(directory, 'source.ma')
+        names = generate_ma(source, args.size_mb, args.nodes, args.seed)
+
+        results = {'single_pass': _measure(lambda path: maya_ascii.delete_colon(path, names), source,
+                                           os.path.join(directory, 'single_pass.ma'))}
+        if args.legacy:
+            results['legacy'] = _measure(lambda path: legacy_delete_colon(path, names), source,
+                                         os.path.join(directory, 'legacy.ma'))
+            with open(os.path.join(directory, 'single_pass.ma'), 'rb') as single_pass, \
+                    open(os.path.join(directory, 'legacy.ma'), 'rb') as legacy:
+                results['identical'] = single_pass.read() == legacy.read()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    report = {
+        'commit': get_commit(),
+        'python': sys.version.split()[0],
+        'parameters': {'size_mb': args.size_mb, 'nodes': args.nodes, 'seed': args.seed},
+        'results': results,
+    }
+
+    for name in ('single_pass', 'legacy'):
+        if name in results:
+            result = results[name]
+            print(f"{name:<12} {result['seconds']:>8.2f} s {result['mb_per_second']:>8.1f} MB/s "
+                  f"{result['peak_memory_mb']:>8.1f} MB peak")
+    if 'identical' in results:
+        print(f"identical output: {results['identical']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=4)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
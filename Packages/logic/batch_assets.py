@@ -0,0 +1,246 @@
+"""
+Création d'assets en masse à partir d'une liste CSV ou JSON (préparation d'un show).
+
+CSV (une ligne par asset) :
+    name,type,departments,software
+    hero,character,geo;ldv;rig,Maya
+    sword,02_prop,geo;ldv,Maya;Houdini
+
+JSON :
+    [{"name": "hero", "type": "character", "departments": {"geo": "Maya", "ldv": "Houdini"}},
+     {"name": "sword", "type": "02_prop", "departments": ["geo", "ldv"], "software": "Maya"}]
+
+Un seul logiciel s'applique à tous les départements, sinon un logiciel par département.
+Tout le plan (dossiers et templates) est calculé avant de toucher au disque, d'après
+les organisations 'asset_department.<logiciel>' de ProjectFiles/Templates/layouts.json.
+
+Usage :
+    python -m Packages.logic.batch_assets assets.csv --dry-run
+    python -m Packages.logic.batch_assets assets.csv --project D:/shows/NOR --workers 32
+"""
+
+import os
+import csv
+import sys
+import json
+import argparse
+from Packages.logic.layout_spec import LayoutPlanner
+from Packages.utils.logger import init_logger
+
+
+logger = init_logger(__file__)
+
+ASSET_FOLDER = '04_asset'
+DEFAULT_ASSET_TYPES = ['01_character', '02_prop', '03_item', '04_enviro', '05_module']
+
+DEPARTMENT_FOLDERS = {
+    'Geometry': 'geo',
+    'LookDev': 'ldv',
+    'Rigging': 'rig'
+}
+
+SOFTWARES = ['None', 'Maya', 'Houdini', 'Blender', 'ZBrush', 'Cinema 4D']
+
+
+def department_folder(department: str) -> str:
+    """'Geometry' ou 'geo' -> 'geo'"""
+    return DEPARTMENT_FOLDERS.get(department, department.lower())
+
+
+def normalize_software(software: str) -> str:
+    """'maya' -> 'Maya', '' -> 'None'"""
+    for name in SOFTWARES:
+        if name.lower() == (software or 'None').strip().lower():
+            return name
+    raise ValueError(f'Unknown software: {software}')
+
+
+def get_asset_types(project: str) -> list:
+    asset_base_path = os.path.join(project, ASSET_FOLDER)
+    if os.path.isdir(asset_base_path):
+        types = sorted(entry.name for entry in os.scandir(asset_base_path) if entry.is_dir())
+        if types:
+            return types
+    return list(DEFAULT_ASSET_TYPES)
+
+
+def resolve_asset_type(value: str, asset_types: list) -> str:
+    """'02_prop', 'prop' ou 'Prop' -> '02_prop'"""
+    value = value.strip().lower()
+    for asset_type in asset_types:
+        if value in (asset_type.lower(), asset_type.split('_', 1)[-1].lower()):
+            return asset_type
+    raise ValueError(f"Unknown asset type: {value} (expected one of {', '.join(asset_types)})")
+
+
+#reading --------------------------------------------------------------------------
+
+def _split(value) -> list:
+    if isinstance(value, (list, tuple)):
+        return [str(item).strip() for item in value if str(item).strip()]
+    return [item.strip() for item in str(value or '').replace('|', ';').split(';') if item.strip()]
+
+
+def _departments(departments, software) -> dict:
+    """{dossier du département: logiciel}"""
+    if isinstance(departments, dict):
+        return {department_folder(department): normalize_software(name) for department, name in departments.items()}
+
+    departments = _split(departments)
+    softwares = _split(software) or ['None']
+    if len(softwares) == 1:
+        softwares = softwares * len(departments)
+    elif len(softwares) != len(departments):
+        raise ValueError(f'{len(departments)} department(s) but {len(softwares)} software(s)')
+    return {department_folder(department): normalize_software(name) for department, name in zip(departments, softwares)}
+
+
+def read_asset_list(path: str) -> list:
+    """
+    Lit un fichier CSV ou JSON : [{'name', 'type', 'departments': {dossier: logiciel}, 'line'}].
+    Les lignes invalides sont gardées avec 'error'.
+    """
+    if path.lower().endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        if isinstance(data, dict):
+            data = data.get('assets', [])
+        entries = [(index + 1, entry) for index, entry in enumerate(data)]
+    else:
+        with open(path, 'r', encoding='utf-8-sig', newline='') as file:
+            # Ligne 1 : en-têtes
+            entries = [(index + 2, {key.strip().lower(): value for key, value in row.items() if key})
+                       for index, row in enumerate(csv.DictReader(file))]
+
+    rows = []
+    for line, entry in entries:
+        row = {'name': str(entry.get('name') or '').strip(), 'type': str(entry.get('type') or '').strip(),
+               'departments': {}, 'line': line}
+        try:
+            if not row['name'] or not row['type']:
+                raise ValueError('name and type are required')
+            row['departments'] = _departments(entry.get('departments', ''), entry.get('software', ''))
+        except ValueError as e:
+            row['error'] = str(e)
+        rows.append(row)
+    return rows
+
+
+#planning -------------------------------------------------------------------------
+
+def plan_asset(planner: LayoutPlanner, project: str, asset_name: str, asset_type: str, departments: dict):
+    """
+    Ajoute au plan les dossiers et templates d'un asset ({dossier du département: logiciel}),
+    d'après les organisations 'asset_department.<logiciel>' (voir Packages/logic/layout_spec.py).
+    Les templates introuvables sont listés dans planner.missing_sources.
+    """
+    owner = f'{asset_type}/{asset_name}'
+    asset_path = os.path.join(project, ASSET_FOLDER, asset_type, asset_name)
+    planner.plan.add_directory(asset_path, owner)
+
+    for department, software in departments.items():
+        department_path = os.path.join(asset_path, department)
+        layout = f'asset_department.{software}'
+        if planner.has_layout(layout):
+            planner.add(layout, department_path, owner, project=project, asset=asset_name, department=department)
+        else:
+            planner.plan.add_directory(department_path, owner)
+
+
+class AssetBatch:
+    """Plan de création d'une liste d'assets"""
+
+    def __init__(self, rows: list, project: str = None, spec: dict = None):
+        if project is None:
+            from Packages.utils.constants.project_pipezer_data import CURRENT_PROJECT
+            project = CURRENT_PROJECT
+
+        self.project = project
+        self.planner = LayoutPlanner(spec)
+        self.plan = self.planner.plan
+        self.assets = []  # 'type/nom' à créer
+        self.skipped = []  # (ligne, raison)
+        self.missing_templates = self.planner.missing_sources
+
+        asset_types = get_asset_types(project)
+        for row in rows:
+            label = f"line {row['line']}: {row['name'] or '?'}"
+            if 'error' in row:
+                self.skipped.append((label, row['error']))
+                continue
+            try:
+                asset_type = resolve_asset_type(row['type'], asset_types)
+            except ValueError as e:
+                self.skipped.append((label, str(e)))
+                continue
+
+            owner = f"{asset_type}/{row['name']}"
+            if owner in self.assets:
+                self.skipped.append((label, 'duplicate in list'))
+                continue
+            if os.path.exists(os.path.join(project, ASSET_FOLDER, asset_type, row['name'])):
+                self.skipped.append((label, f'{owner} already exists'))
+                continue
+
+            plan_asset(self.planner, project, row['name'], asset_type, row['departments'])
+            self.assets.append(owner)
+
+    @classmethod
+    def from_file(cls, path: str, project: str = None):
+        return cls(read_asset_list(path), project)
+
+    def summary(self) -> str:
+        lines = [f'{len(self.assets)} asset(s) to create: {len(self.plan.directories)} folder(s), '
+                 f'{len(self.plan.copies)} template(s)']
+        if self.skipped:
+            lines.append(f'{len(self.skipped)} skipped:')
+            lines += [f'    {label} ({reason})' for label, reason in self.skipped]
+        if self.missing_templates:
+            lines.append('Missing templates (departments created without scene):')
+            lines += [f'    {template}' for template in self.missing_templates]
+        return '\n'.join(lines)
+
+    def execute(self, max_workers: int = None, progress=None, notify: bool = True) -> dict:
+        """Exécute le plan, puis une seule notification pour tout le lot"""
+        result = self.plan.execute(max_workers, progress)
+        result['created'] = [asset for asset in self.assets if asset not in result['failed_owners']]
+
+        if notify and result['created']:
+            from Packages.utils.notification_utils import add_notification, get_username
+            names = ', '.join(asset.split('/', 1)[1] for asset in result['created'][:5])
+            if len(result['created']) > 5:
+                names += f" (+{len(result['created']) - 5})"
+            add_notification(get_username(), 'create_asset', f"{len(result['created'])} assets: {names}")
+        return result
+
+
+def create_assets(path: str, project: str = None, max_workers: int = None, notify: bool = True) -> dict:
+    """Crée tous les assets d'un fichier CSV/JSON (API pour les scripts)"""
+    batch = AssetBatch.from_file(path, project)
+    logger.info(batch.summary())
+    return batch.execute(max_workers, notify=notify)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Création d'assets en masse depuis un CSV/JSON")
+    parser.add_argument('path', help='Liste des assets (.csv ou .json)')
+    parser.add_argument('--project', default=None, help='Projet (par défaut, le projet courant)')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--dry-run', action='store_true', help='Afficher le plan sans rien créer')
+    parser.add_argument('--no-notification', action='store_true')
+    args = parser.parse_args(argv)
+
+    batch = AssetBatch.from_file(args.path, args.project)
+    print(batch.summary())
+    if args.dry_run or not batch.assets:
+        return 0
+
+    result = batch.execute(args.workers, notify=not args.no_notification)
+    print(f"{len(result['created'])} asset(s) created in {result['seconds']:.2f} s")
+    for path, error in result['errors'].items():
+        print(f'    {path}: {error}')
+    return 1 if result['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
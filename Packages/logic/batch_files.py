@@ -0,0 +1,285 @@
+"""
+Opérations en masse sur des fichiers sélectionnés : version suivante, renommage par
+motif et déplacement dans OLD.
+
+Tout le lot est planifié et vérifié avant de toucher au disque : numéros de version et
+noms existants d'après un index construit avec un seul listing par dossier (voir
+Packages/utils/listing_cache.py), collisions entre fichiers du même lot. Les fichiers
+refusés sont listés avec leur raison, le reste est exécuté en parallèle.
+
+Depuis un script :
+    from Packages.logic.batch_files import FileBatch
+    batch = FileBatch.version_up(paths)
+    print(batch.summary())
+    print(batch.report(batch.execute()))
+
+Usage :
+    python -m Packages.logic.batch_files version_up D:/shows/NOR/05_shot/sq0010/*/layout/*.hip --dry-run
+    python -m Packages.logic.batch_files rename scenes/*.ma --find _wip --replace _final
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from Packages.utils import tracing
+from Packages.utils.copy_engine import copy_file, is_temp_file
+from Packages.utils.fs_plan import default_workers
+from Packages.utils.listing_cache import listing_cache
+from Packages.utils.logger import init_logger
+
+
+logger = init_logger(__file__)
+
+OLD_FOLDER = 'OLD'
+
+OPERATIONS = {
+    'version_up': 'version up',
+    'rename': 'rename',
+    'move_to_old': 'move to OLD',
+}
+
+# Même motif que extract_increment / return_increment_edit : '_003.'
+_VERSION = re.compile(r'_(\d{3})\.')
+_INVALID_CHARACTERS = re.compile(r'[<>:"/\\|?*]')
+
+# Lignes affichées dans les résumés avant "(+N)"
+MAX_LISTED = 20
+
+
+class VersionIndex:
+    """Noms existants et dernière version de chaque fichier, par dossier (un seul listing, relu du disque, par dossier)"""
+
+    def __init__(self):
+        self._names = {}  # dossier: noms (normcase)
+        self._versions = {}  # dossier: {clé de version: dernier numéro}
+
+    @staticmethod
+    def version_key(name: str):
+        """'lamp_geo_E_003.ma' -> 'lamp_geo_E_###.ma', None si le nom n'a pas de version"""
+        if _VERSION.search(name) is None:
+            return None
+        return os.path.normcase(_VERSION.sub('_###.', name, count=1))
+
+    def _load(self, directory: str):
+        if directory not in self._names:
+            try:
+                entries = listing_cache.list_directory(directory, fresh=True)
+            except FileNotFoundError:
+                entries = []
+
+            versions = {}
+            for entry in entries:
+                key = self.version_key(entry.name)
+                if key is None or entry.is_dir or is_temp_file(entry.name):
+                    continue
+                number = int(_VERSION.search(entry.name).group(1))
+                versions[key] = max(versions.get(key, 0), number)
+
+            self._names[directory] = {os.path.normcase(entry.name) for entry in entries}
+            self._versions[directory] = versions
+        return self._names[directory]
+
+    def exists(self, path: str) -> bool:
+        return os.path.normcase(os.path.basename(path)) in self._load(os.path.dirname(path))
+
+    def last_version(self, path: str):
+        """Numéro de la dernière version du fichier dans son dossier, None s'il n'a pas de version"""
+        directory = os.path.dirname(path)
+        self._load(directory)
+        return self._versions[directory].get(self.version_key(os.path.basename(path)))
+
+
+class FileBatch:
+    """Liste de (source, destination) d'une même opération, vérifiée avant exécution"""
+
+    def __init__(self, operation: str, index: VersionIndex = None):
+        if operation not in OPERATIONS:
+            raise ValueError(f'Unknown operation: {operation}')
+        self.operation = operation
+        self.index = index or VersionIndex()
+        self.operations = []  # (source, destination)
+        self.skipped = []  # (chemin, raison)
+        self._reserved = set()  # destinations déjà prises par le lot
+
+    def __len__(self):
+        return len(self.operations)
+
+    #planning -----------------------------------------------------------------------
+
+    def _check_source(self, path: str) -> bool:
+        if not self.index.exists(path):
+            self.skipped.append((path, 'file not found'))
+            return False
+        return True
+
+    def _add(self, source: str, destination: str):
+        destination = os.path.normpath(destination)
+        key = os.path.normcase(destination)
+        if key in self._reserved:
+            self.skipped.append((source, f'{os.path.basename(destination)} is already planned for another file'))
+        elif self.index.exists(destination):
+            self.skipped.append((source, f'{os.path.basename(destination)} already exists'))
+        else:
+            self._reserved.add(key)
+            self.operations.append((source, destination))
+
+    @classmethod
+    def version_up(cls, paths: list, index: VersionIndex = None):
+        """Copie de chaque fichier vers la version qui suit la dernière version de son dossier"""
+        batch = cls('version_up', index)
+        # Plusieurs versions d'un même fichier sélectionnées : la plus récente passe en premier
+        for path in sorted(paths, reverse=True):
+            if not batch._check_source(path):
+                continue
+            last_version = batch.index.last_version(path)
+            if last_version is None:
+                batch.skipped.append((path, 'no version number (_XXX.) in the name'))
+                continue
+            name = _VERSION.sub(f'_{last_version + 1:03}.', os.path.basename(path), count=1)
+            batch._add(path, os.path.join(os.path.dirname(path), name))
+        return batch
+
+    @classmethod
+    def rename(cls, paths: list, find: str, replace: str, regex: bool = False, index: VersionIndex = None):
+        """Remplace find par replace dans le nom de chaque fichier (expression régulière si regex)"""
+        if not find:
+            raise ValueError('Nothing to replace')
+        try:
+            pattern = re.compile(find if regex else re.escape(find))
+        except re.error as e:
+            raise ValueError(f'Invalid pattern: {e}')
+
+        batch = cls('rename', index)
+        for path in paths:
+            if not batch._check_source(path):
+                continue
+            name = os.path.basename(path)
+            new_name = pattern.sub(replace if regex else lambda match: replace, name)
+            if new_name == name:
+                batch.skipped.append((path, 'pattern not found in the name'))
+            elif not new_name.strip('. ') or _INVALID_CHARACTERS.search(new_name):
+                batch.skipped.append((path, f"invalid name '{new_name}'"))
+            else:
+                batch._add(path, os.path.join(os.path.dirname(path), new_name))
+        return batch
+
+    @classmethod
+    def move_to_old(cls, paths: list, index: VersionIndex = None):
+        """Déplace chaque fichier dans le dossier OLD de son dossier (créé si besoin)"""
+        batch = cls('move_to_old', index)
+        for path in paths:
+            if not batch._check_source(path):
+                continue
+            directory = os.path.dirname(path)
+            if os.path.basename(directory) == OLD_FOLDER:
+                batch.skipped.append((path, f'already in {OLD_FOLDER}'))
+                continue
+            batch._add(path, os.path.join(directory, OLD_FOLDER, os.path.basename(path)))
+        return batch
+
+    def summary(self) -> str:
+        lines = [f'{len(self.operations)} file(s) to {OPERATIONS[self.operation]}:']
+        for source, destination in self.operations[:MAX_LISTED]:
+            lines.append(f'    {os.path.basename(source)} -> {os.path.relpath(destination, os.path.dirname(source))}')
+        if len(self.operations) > MAX_LISTED:
+            lines.append(f'    (+{len(self.operations) - MAX_LISTED})')
+        if self.skipped:
+            lines.append(f'{len(self.skipped)} skipped:')
+            lines += [f'    {os.path.basename(path)} ({reason})' for path, reason in self.skipped[:MAX_LISTED]]
+            if len(self.skipped) > MAX_LISTED:
+                lines.append(f'    (+{len(self.skipped) - MAX_LISTED})')
+        return '\n'.join(lines)
+
+    #execution ----------------------------------------------------------------------
+
+    def _run(self, source: str, destination: str):
+        if self.operation == 'version_up':
+            copy_file(source, destination)
+            return
+
+        if self.operation == 'move_to_old':
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+        # os.rename écrase la destination sous Linux : jamais un fichier existant
+        if os.path.exists(destination):
+            raise FileExistsError(destination)
+        os.rename(source, destination)
+
+    def execute(self, max_workers: int = None, progress=None) -> dict:
+        """
+        Exécute toutes les opérations en parallèle.
+        progress(fait, total) est appelé après chaque fichier.
+        Retourne {'done': [(source, destination)], 'errors': {source: message}, 'skipped': [...], 'seconds'}.
+        """
+        total = len(self.operations)
+        if max_workers is None:
+            max_workers = default_workers(self.operations[0][0] if self.operations else os.getcwd())
+
+        done, errors = [], {}
+        start = time.perf_counter()
+
+        with tracing.span('batch_files.execute', operation=self.operation, files=total, workers=max_workers), \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(source, destination, executor.submit(self._run, source, destination))
+                       for source, destination in self.operations]
+            for index, (source, destination, future) in enumerate(futures):
+                try:
+                    future.result()
+                    done.append((source, destination))
+                except OSError as e:
+                    errors[source] = f'{type(e).__name__}: {e}'
+                if progress is not None:
+                    progress(index + 1, total)
+
+        for directory in {os.path.dirname(path) for pair in self.operations for path in pair}:
+            listing_cache.invalidate(directory)
+
+        seconds = time.perf_counter() - start
+        logger.info(f'{OPERATIONS[self.operation]}: {len(done)} file(s) in {seconds:.2f} s '
+                    f'({max_workers} workers, {len(errors)} error(s), {len(self.skipped)} skipped)')
+        return {'done': done, 'errors': errors, 'skipped': list(self.skipped), 'seconds': seconds}
+
+    def report(self, result: dict) -> str:
+        """Compte rendu unique du lot"""
+        label = OPERATIONS[self.operation]
+        lines = [f"{label[0].upper()}{label[1:]}: {len(result['done'])} file(s) done "
+                 f"in {result['seconds']:.2f} s"]
+        if result['errors']:
+            lines.append(f"{len(result['errors'])} error(s):")
+            lines += [f'    {os.path.basename(path)}: {error}' for path, error in list(result['errors'].items())[:MAX_LISTED]]
+        if result['skipped']:
+            lines.append(f"{len(result['skipped'])} skipped:")
+            lines += [f'    {os.path.basename(path)} ({reason})' for path, reason in result['skipped'][:MAX_LISTED]]
+        return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Opérations en masse sur des fichiers')
+    parser.add_argument('operation', choices=list(OPERATIONS))
+    parser.add_argument('paths', nargs='+', help='Fichiers')
+    parser.add_argument('--find', default=None, help='Texte à remplacer (rename)')
+    parser.add_argument('--replace', default='', help='Remplacement (rename)')
+    parser.add_argument('--regex', action='store_true', help='--find est une expression régulière')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--dry-run', action='store_true', help='Afficher le plan sans rien modifier')
+    args = parser.parse_args(argv)
+
+    paths = [os.path.abspath(path) for path in args.paths]
+    if args.operation == 'rename':
+        batch = FileBatch.rename(paths, args.find, args.replace, args.regex)
+    else:
+        batch = getattr(FileBatch, args.operation)(paths)
+
+    print(batch.summary())
+    if args.dry_run or not batch.operations:
+        return 0
+
+    result = batch.execute(args.workers)
+    print(batch.report(result))
+    return 1 if result['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
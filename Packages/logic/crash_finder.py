@@ -0,0 +1,139 @@
+"""
+Recherche des fichiers de crash et d'autosave des logiciels (onglet Crash).
+
+Au lieu de parcourir tout le dossier temp, on ne regarde que les dossiers où
+chaque logiciel écrit ses fichiers de secours, avec une profondeur limitée.
+Le contenu de chaque dossier est gardé en cache (mémoire + crash_files.json) et
+n'est relu que si la date de modification du dossier a changé.
+"""
+
+import os
+import json
+import fnmatch
+import tempfile
+from collections import namedtuple
+from Packages.utils.constants.user import USER_DIR
+from Packages.utils.constants.preferences import CRASH_FILES_JSON_PATH
+from Packages.utils import tracing
+
+
+CrashLocation = namedtuple('CrashLocation', ['directory', 'max_depth', 'patterns'])
+
+TEMP_DIR = tempfile.gettempdir()
+
+# Extensions des fichiers que PipeZer sait ouvrir
+COMPATIBLE_EXTENSIONS = ('.ma', '.mb', '.hip', '.hipnc', '.hiplc', '.nk', '.blend', '.kra', '.fbx', '.obj', '.psd', '.drp', '.uasset', '.zpr')
+
+CRASH_LOCATIONS = [
+    # Maya : <scene>_crash.ma et <user>.<date>.<heure>.ma dans le dossier temp
+    CrashLocation(TEMP_DIR, 0, ('*_crash.ma', '*_crash.mb', '*.[0-9][0-9][0-9][0-9][0-9][0-9][0-9][0-9].[0-9][0-9][0-9][0-9].ma')),
+    # Houdini : crash.<scene>_<user>_<pid>.hip dans $TEMP/houdini_temp
+    CrashLocation(os.path.join(TEMP_DIR, 'houdini_temp'), 1, ('crash.*.hip', 'crash.*.hipnc', 'crash.*.hiplc')),
+    CrashLocation(TEMP_DIR, 0, ('crash.*.hip', 'crash.*.hipnc', 'crash.*.hiplc')),
+    # Nuke : autosaves dans ~/.nuke
+    CrashLocation(os.path.join(USER_DIR, '.nuke'), 1, ('*.autosave', '*.nk.autosave')),
+    # Blender : quit.blend et <pid>_autosave.blend dans le dossier temp
+    CrashLocation(TEMP_DIR, 0, ('quit.blend', '*autosave.blend', '*.crash.blend')),
+    # Autres logiciels : fichiers compatibles nommés crash/autosave, peu profond
+    CrashLocation(TEMP_DIR, 1, tuple(f'*crash*{ext}' for ext in COMPATIBLE_EXTENSIONS) + tuple(f'*autosave*{ext}' for ext in COMPATIBLE_EXTENSIONS)),
+]
+
+MAX_RESULTS = 50
+
+
+class CrashFileFinder:
+    """Recherche ciblée et en cache des fichiers de crash"""
+
+    def __init__(self, locations=CRASH_LOCATIONS, cache_path=CRASH_FILES_JSON_PATH, max_results=MAX_RESULTS):
+        self.locations = locations
+        self.cache_path = cache_path
+        self.max_results = max_results
+
+        # dossier -> {'mtime': float, 'files': {nom: mtime}, 'dirs': [noms]}
+        self._directories = {}
+        self._results = []
+        self._load_cache()
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._directories = data.get('directories', {})
+            self._results = [tuple(result) for result in data.get('results', [])]
+        except (OSError, ValueError):
+            self._directories = {}
+            self._results = []
+
+    def _save_cache(self):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'directories': self._directories, 'results': self._results}, f)
+        except OSError as e:
+            print(f"Impossible d'écrire le cache des fichiers crash: {e}")
+
+    def cached_results(self) -> list:
+        """Derniers résultats connus [(chemin, mtime)], sans accès disque"""
+        return list(self._results)
+
+    def _read_directory(self, directory: str, seen: set) -> dict:
+        """Contenu d'un dossier, relu seulement si sa date de modification a changé"""
+        seen.add(directory)
+        dir_mtime = os.stat(directory).st_mtime
+
+        cached = self._directories.get(directory)
+        if cached is not None and cached['mtime'] == dir_mtime:
+            return cached
+
+        files = {}
+        dirs = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif entry.is_file():
+                        files[entry.name] = entry.stat().st_mtime
+                except OSError:
+                    continue
+
+        cached = {'mtime': dir_mtime, 'files': files, 'dirs': dirs}
+        self._directories[directory] = cached
+        return cached
+
+    def _scan_location(self, location: CrashLocation, found: dict, seen: set):
+        to_visit = [(location.directory, 0)]
+
+        while to_visit:
+            directory, depth = to_visit.pop()
+            try:
+                content = self._read_directory(directory, seen)
+            except OSError:
+                continue
+
+            for name, mtime in content['files'].items():
+                lower_name = name.lower()
+                if any(fnmatch.fnmatchcase(lower_name, pattern) for pattern in location.patterns):
+                    found[os.path.join(directory, name)] = mtime
+
+            if depth < location.max_depth:
+                for name in content['dirs']:
+                    to_visit.append((os.path.join(directory, name), depth + 1))
+
+    def scan(self) -> list:
+        """Parcourt les dossiers de crash et retourne les N fichiers les plus récents [(chemin, mtime)]"""
+        found = {}
+        seen = set()
+
+        with tracing.span('crash.scan') as scan_span:
+            for location in self.locations:
+                self._scan_location(location, found, seen)
+            scan_span.set(directories=len(seen), found=len(found))
+
+        # Oublier les dossiers qui n'existent plus ou ne sont plus visités
+        self._directories = {directory: content for directory, content in self._directories.items() if directory in seen}
+
+        results = sorted(found.items(), key=lambda item: item[1], reverse=True)
+        self._results = results[:self.max_results]
+        self._save_cache()
+        return list(self._results)
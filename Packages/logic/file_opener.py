@@ -6,6 +6,7 @@ from Packages.logic.json_funcs import set_recent_file, get_pref
 from Packages.utils.constants.preferences import APPS_JSON_PATH
 from Packages.utils.constants.pipezer import PIPEZER_PATH
 from Packages.utils.logger import init_logger
+from Packages.utils.copy_engine import materialize_file
 from Packages.logic.open_in_usdview import open_in_usd_view
 
 EXTS = {
@@ -99,7 +100,12 @@ class FileOpener:
         Returns:
             None
         """
-        
+        # Scène vide instanciée par lien physique : copie propre avant ouverture
+        try:
+            materialize_file(file_path)
+        except OSError as e:
+            logger.warning(f"Could not materialize {file_path}: {e}")
+
         pref_dict = {
             'houdini': 'HOUDINI_USER_PREF_DIR',
             'maya': 'MAYA_APP_DIR',
@@ -1,8 +1,8 @@
-from Packages.logic.filefunc.action_funcs import increment_file_external
+from Packages.logic.filefunc.action_funcs import increment_file_external, get_increment_file_path
 from Packages.logic.filefunc.get_funcs import (
     get_dirs, get_files,
     get_version_file, get_version_num, get_file_modification_date_time,
     return_publish_name, extract_increment, return_increment_edit, clean_directory,
-    get_recent_files_old, get_publish_files
+    get_recent_files_old, get_publish_files, search_files
 )
 from Packages.logic.filefunc.interactions import open_explorer
\ No newline at end of file
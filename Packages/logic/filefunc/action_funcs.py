@@ -1,17 +1,17 @@
 import os
-import shutil
 from Packages.logic.filefunc import get_funcs
+from Packages.utils.copy_engine import copy_file
 
-def increment_file_external(file_path: str) -> str:
+
+def get_increment_file_path(file_path: str) -> str:
     """
-    Copie un fichier spécifié vers le même répertoire en incrémentant le suffixe numérique
-    au nom du fichier pour le différencier de la version précédente.
+    Retourne le chemin de la version suivante d'un fichier, ou None si elle ne peut pas être créée.
 
     Args:
-        file_path (str): Le chemin absolu du fichier à copier.
+        file_path (str): Le chemin absolu du fichier à incrémenter.
 
     Returns:
-        str: Le chemin absolu du nouveau fichier créé avec un nom incrémenté.
+        str: Le chemin absolu de la nouvelle version (qui n'existe pas encore).
     """
     # Vérifier si le fichier existe
     if not os.path.isfile(file_path):
@@ -34,9 +34,28 @@ def increment_file_external(file_path: str) -> str:
         print(f"Erreur : Le fichier de destination existe déjà : {new_file_path}")
         return None
 
+    return new_file_path
+
+
+def increment_file_external(file_path: str) -> str:
+    """
+    Copie un fichier spécifié vers le même répertoire en incrémentant le suffixe numérique
+    au nom du fichier pour le différencier de la version précédente.
+    Copie bloquante : depuis l'interface, utiliser get_increment_file_path et Packages.ui.copy_thread.
+
+    Args:
+        file_path (str): Le chemin absolu du fichier à copier.
+
+    Returns:
+        str: Le chemin absolu du nouveau fichier créé avec un nom incrémenté.
+    """
+    new_file_path = get_increment_file_path(file_path)
+    if new_file_path is None:
+        return None
+
     # Copier le fichier vers le nouveau chemin
     try:
-        shutil.copy(file_path, new_file_path)
+        copy_file(file_path, new_file_path)
         print(f"Fichier incrémenté créé avec succès : {new_file_path}")
         return new_file_path
     except Exception as e:
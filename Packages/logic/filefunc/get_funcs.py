@@ -3,10 +3,13 @@ import re
 import datetime
 import operator
 from typing import Literal
+from Packages.utils.listing_cache import listing_cache
+from Packages.utils import tracing
+from Packages.utils.copy_engine import is_temp_file
 from Packages.logic.filefunc.file_class import AssetFileInfos, SequenceFileInfos, ShotFileInfos
 
 
-def get_items(directory_path: str, type: Literal['dir', 'file'], exclude_type: list = []) -> list:
+def get_items(directory_path: str, type: Literal['dir', 'file'], exclude_type: list = [], fresh: bool = False) -> list:
     """
     Retourne une liste triée des noms d'éléments (fichiers ou répertoires) dans le chemin spécifié.
 
@@ -14,40 +17,33 @@ def get_items(directory_path: str, type: Literal['dir', 'file'], exclude_type: l
     - directory_path (str): Chemin du répertoire où chercher les éléments.
     - type (str): Type d'éléments à rechercher ('dir' pour répertoires, 'file' pour fichiers).
     - exclude_type (list, optional): Liste des extensions à exclure pour les fichiers. Par défaut, vide.
+    - fresh (bool, optional): relire le dossier au lieu du cache (calcul d'un nom de version).
 
     Returns:
     - list: Liste triée des noms des éléments correspondants aux critères spécifiés.
     """
 
-    os_dict = {
-        'dir': os.path.isdir,
-        'file': os.path.isfile
-    }
-
     if type not in ['dir', 'file']:
         raise ValueError("Le paramètre 'type' doit être soit 'dir' soit 'file'.")
 
+    # Listing partagé par tout le processus (invalidé par watcher ou revalidé par TTL)
     item_names = []
-    for item in os.listdir(directory_path):
-        item_path = os.path.join(directory_path, item)
-
-        if item.endswith(tuple(exclude_type)):
+    for entry in listing_cache.list_directory(directory_path, fresh=fresh):
+        if entry.name.endswith(tuple(exclude_type)) or is_temp_file(entry.name):
             continue
 
-        if os_dict[type](item_path):
-            item_names.append(item)
+        if entry.is_dir == (type == 'dir'):
+            item_names.append(entry.name)
 
-    return sorted(item_names)
+    return item_names
 
 
 def get_dirs(directory_path: str) -> list[str]:
-    print(f'Search directories in directory : {directory_path}')
     return get_items(directory_path=directory_path, type='dir')
 
 
-def get_files(directory_path: str) -> list[str]:
-    print(f'Search files in directory : {directory_path}')
-    return get_items(directory_path=directory_path, type='file', exclude_type=[".txt", '.mel', '.db'])
+def get_files(directory_path: str, fresh: bool = False) -> list[str]:
+    return get_items(directory_path=directory_path, type='file', exclude_type=[".txt", '.mel', '.db'], fresh=fresh)
 
 
 def get_version_file(version: str, parent_directory: str) -> str:
@@ -127,12 +123,17 @@ def get_file_modification_date_time(file_path: str):
     """
     Récupère la date et l'heure de modification d'un fichier spécifié au format "jj/mm/aaaa hh:mm".
     """
-    if not os.path.exists(file_path):
-        return
+    # Utiliser le stat du cache de listings si le dossier a déjà été listé
+    entry = listing_cache.get_entry(file_path)
+    if entry is not None:
+        mtime = entry.mtime
+    else:
+        if not os.path.exists(file_path):
+            return
 
-    # Obtenir les informations de modification du fichier
-    file_stat = os.stat(file_path)
-    modification_time = datetime.datetime.fromtimestamp(file_stat.st_mtime)
+        # Obtenir les informations de modification du fichier
+        mtime = os.stat(file_path).st_mtime
+    modification_time = datetime.datetime.fromtimestamp(mtime)
     formatted_date = modification_time.strftime("%d/%m/%Y")
     formatted_time = modification_time.strftime("%H:%M")
     formatted_date_time = f'{formatted_date}\n{formatted_time}'
@@ -174,7 +175,6 @@ def return_publish_name(file_name: str, usd: bool = False, variant: str = ''):
         base_name = os.path.splitext(publish_file_name)[0]
         publish_file_name = f'{base_name}.usd'
 
-    print(f'Return Publish Name : {publish_file_name}')
     return publish_file_name
 
 def extract_increment(file_name: str, mode='v'):
@@ -211,7 +211,8 @@ def return_increment_edit(file_path: str, is_usd: bool = False):
 
     parent_dir = os.path.dirname(file_path)
     base_name = os.path.basename(file_path)
-    other_files = get_files(parent_dir)
+    # Jamais depuis le cache : une version créée par un autre poste serait écrasée
+    other_files = get_files(parent_dir, fresh=True)
 
     # Filtrer les fichiers qui ont le même préfixe que le fichier actuel
     matching_files = [f for f in other_files if base_name.split('_')[0] in f]
@@ -303,6 +304,34 @@ def get_recent_files_old(directory: str, num: int = 10):
     return recent_files
 
 
+def search_files(directory: str, search_text: str, max_results: int = 100, excluded: tuple = ('02_ressource',)) -> list:
+    """
+    Recherche les fichiers dont le nom contient search_text (sans tenir compte de la casse).
+    Les dossiers contenant un des noms de excluded sont ignorés, la recherche s'arrête après max_results fichiers.
+    """
+    search_text = search_text.lower()
+    matching_files = []
+
+    with tracing.span('search.scan', text=search_text) as scan_span:
+        explored = 0
+        for root, dirs, files in os.walk(directory):
+            if any(name in root for name in excluded):
+                continue
+
+            explored += 1
+            for file in files:
+                if search_text in file.lower() and not is_temp_file(file):
+                    matching_files.append(os.path.join(root, file))
+
+                    if len(matching_files) >= max_results:
+                        break
+            if len(matching_files) >= max_results:
+                break
+        scan_span.set(directories=explored, results=len(matching_files))
+
+    return matching_files
+
+
 def get_publish_files(directory: str):
     """
     Récupère les fichiers publiés d'un répertoire.
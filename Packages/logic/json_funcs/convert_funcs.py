@@ -1,4 +1,5 @@
 import json
+from Packages.utils import tracing
 
 
 def json_to_dict(json_file_path: str) -> dict:
@@ -12,8 +13,9 @@ def json_to_dict(json_file_path: str) -> dict:
         dict: Le dictionnaire Python résultant à partir du fichier JSON.
     '''
     
-    with open(json_file_path, 'r', encoding = 'utf-8') as file:
-        dico = json.load(file)
+    with tracing.span('json.read', path=json_file_path):
+        with open(json_file_path, 'r', encoding = 'utf-8') as file:
+            dico = json.load(file)
         
     return dico
 
@@ -27,5 +29,6 @@ def dict_to_json(dictionary: dict, json_file_path: str) -> None:
         json_file_path (str): Le chemin du fichier JSON de destination.
     '''
     
-    with open(json_file_path, 'w', encoding = 'utf-8') as file:
-        json.dump(dictionary, file, indent = 4, ensure_ascii = False)
+    with tracing.span('json.write', path=json_file_path):
+        with open(json_file_path, 'w', encoding = 'utf-8') as file:
+            json.dump(dictionary, file, indent = 4, ensure_ascii = False)
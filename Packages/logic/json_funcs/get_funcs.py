@@ -1,6 +1,8 @@
 import os
 import json
+import threading
 from Packages.logic.json_funcs import convert_funcs
+from Packages.utils import tracing
 from Packages.utils.constants.project_pipezer_data import pipezer_data_FILE_DATA, CURRENT_PROJECT_NAME
 from Packages.utils.constants.preferences import CLICKED_ITEMS_JSON_PATH, RECENT_FILES_JSON_PATH, APPS_JSON_PATH, UI_PREFS_JSON_PATH
 
@@ -41,15 +43,38 @@ def get_recent_files(ext: list = [], length: int = 20) -> list:
     return return_list
 
 
+# Contenu de file_data.json, relu seulement quand le fichier change (une lecture par tableau au lieu d'une par ligne)
+_file_data_cache = {'mtime': None, 'data': None}
+_file_data_lock = threading.Lock()
+
+
+def _load_file_data() -> dict:
+    file_stat = os.stat(pipezer_data_FILE_DATA)
+    mtime = (file_stat.st_mtime_ns, file_stat.st_size)
+
+    with _file_data_lock:
+        if _file_data_cache['mtime'] == mtime:
+            tracing.count('metadata.hits')
+            return _file_data_cache['data']
+
+        tracing.count('metadata.misses')
+        with tracing.span('metadata.load', path=pipezer_data_FILE_DATA):
+            with open(pipezer_data_FILE_DATA, 'r', encoding='utf-8') as json_file:
+                file_data_dict: dict = json.load(json_file)
+
+        _file_data_cache['mtime'] = mtime
+        _file_data_cache['data'] = file_data_dict
+        return file_data_dict
+
+
 def get_file_data(filename: str) -> dict:
     """
     """
 
-    with open(pipezer_data_FILE_DATA, 'r', encoding='utf-8') as json_file:
-        file_data_dict: dict = json.load(json_file)
+    file_data_dict: dict = _load_file_data()
 
     if filename in file_data_dict:
-        return file_data_dict[filename]
+        return dict(file_data_dict[filename])
 
     else:
         return {'comment': '', 'user': ''}
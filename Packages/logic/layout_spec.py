@@ -0,0 +1,217 @@
+"""
+Organisation des dossiers (projet, assets, shots, projets logiciels) décrite dans
+ProjectFiles/Templates/layouts.json au lieu d'être codée en dur.
+
+Une organisation liste des dossiers et des fichiers (templates) relatifs à sa racine :
+    "software.maya": {
+        "variables": {"department": [], "empty_scenes": false},
+        "folders": ["scenes/edit/{department}", "scenes/publish/OLD"],
+        "files": [{"source": "{project_files}/Workspaces/workspace.mel", "target": "workspace.mel"},
+                  {"source": "...", "target": "...", "when": "empty_scenes"}]
+    }
+
+Une variable liste multiplie le chemin (une entrée par valeur, aucune si la liste est vide).
+Les variables globales ("variables" à la racine du fichier) peuvent en utiliser d'autres,
+ainsi que {pipezer} et {project}. Un fichier .yaml est lu si PyYAML est installé.
+
+"template_mode": "copy" (par défaut) copie les templates ; "lazy" les instancie sans
+copier de données quand le système de fichiers le permet (voir Packages/utils/copy_engine.py).
+
+Le plan est comparé au disque avant d'être appliqué : relancer sur un projet déjà
+(partiellement) créé ne fait que quelques lots de listings et crée ce qui manque.
+
+Usage :
+    python -m Packages.logic.layout_spec project D:/shows/NOR --dry-run
+    python -m Packages.logic.layout_spec software.maya D:/shows/NOR/04_asset/02_prop/lamp/maya --var department=geo,ldv
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import itertools
+from Packages.utils.copy_engine import template_cache_directory
+from Packages.utils.fs_plan import FileSystemPlan
+from Packages.utils.logger import init_logger
+
+
+logger = init_logger(__file__)
+
+_FIELD = re.compile(r'\{(\w+)\}')
+
+_specs = {}
+
+
+def get_layouts_path() -> str:
+    from Packages.utils.constants.constants_old import LAYOUTS_PATH
+    return LAYOUTS_PATH
+
+
+def load_spec(path: str = None) -> dict:
+    """Lit (une seule fois par fichier) la description des organisations"""
+    path = path or get_layouts_path()
+    if path not in _specs:
+        with open(path, 'r', encoding='utf-8') as file:
+            if path.lower().endswith(('.yaml', '.yml')):
+                try:
+                    import yaml
+                except ImportError:
+                    raise ImportError(f'PyYAML is required to read {path}')
+                _specs[path] = yaml.safe_load(file)
+            else:
+                _specs[path] = json.load(file)
+    return _specs[path]
+
+
+def expand(pattern: str, variables: dict) -> list:
+    """'scenes/edit/{department}', {'department': ['geo', 'ldv']} -> ['scenes/edit/geo', 'scenes/edit/ldv']"""
+    names = list(dict.fromkeys(_FIELD.findall(pattern)))
+    for name in names:
+        if name not in variables:
+            raise KeyError(f"Unknown layout variable '{name}' in '{pattern}'")
+
+    values = [variables[name] if isinstance(variables[name], (list, tuple)) else [variables[name]] for name in names]
+    results = []
+    for combination in itertools.product(*values):
+        current = dict(zip(names, combination))
+        results.append(_FIELD.sub(lambda match: str(current[match.group(1)]), pattern))
+    return results
+
+
+def _resolve(variables: dict) -> dict:
+    """Remplace les variables qui en utilisent d'autres ('{pipezer}/template')"""
+    variables = dict(variables)
+    for _ in range(len(variables)):
+        changed = False
+        for name, value in variables.items():
+            if isinstance(value, str) and _FIELD.search(value):
+                try:
+                    expanded = expand(value, variables)
+                except KeyError:
+                    continue
+                if len(expanded) == 1 and expanded[0] != value:
+                    variables[name] = expanded[0]
+                    changed = True
+        if not changed:
+            break
+    return variables
+
+
+def _join(root: str, relative: str) -> str:
+    return os.path.normpath(os.path.join(root, *relative.split('/')))
+
+
+class LayoutPlanner:
+    """Construit un FileSystemPlan à partir des organisations décrites"""
+
+    def __init__(self, spec: dict = None, plan: FileSystemPlan = None):
+        self.spec = spec if spec is not None else load_spec()
+        self.plan = plan if plan is not None else FileSystemPlan()
+        self.plan.template_mode = self.spec.get('template_mode', 'copy')
+        self.missing_sources = []
+        self._source_exists = {}
+
+    def layout_names(self, prefix: str = '') -> list:
+        return [name for name in self.spec['layouts'] if name.startswith(prefix)]
+
+    def has_layout(self, name: str) -> bool:
+        return name in self.spec['layouts']
+
+    def variables(self, layout: dict, given: dict) -> dict:
+        from Packages.utils.constants.pipezer import PIPEZER_PATH
+        variables = {'pipezer': PIPEZER_PATH}
+        variables.update(self.spec.get('variables', {}))
+        variables.update(layout.get('variables', {}))
+        variables.update({name: value for name, value in given.items() if value is not None})
+        return _resolve(variables)
+
+    def _exists(self, source: str) -> bool:
+        # Un même template sert à des centaines de dossiers : vérifié une seule fois
+        if source not in self._source_exists:
+            self._source_exists[source] = os.path.exists(source)
+            if not self._source_exists[source]:
+                self.missing_sources.append(source)
+        return self._source_exists[source]
+
+    def add(self, name: str, root: str, owner: str = None, **variables):
+        """Ajoute au plan l'organisation name sous root"""
+        if name not in self.spec['layouts']:
+            raise KeyError(f'Unknown layout: {name}')
+        layout = self.spec['layouts'][name]
+        variables = self.variables(layout, variables)
+        if self.plan.template_cache is None and variables.get('project'):
+            self.plan.template_cache = template_cache_directory(variables['project'])
+
+        self.plan.add_directory(root, owner)
+        for pattern in layout.get('folders', []):
+            for relative in expand(pattern, variables):
+                self.plan.add_directory(_join(root, relative), owner)
+
+        for file_spec in layout.get('files', []):
+            if file_spec.get('when') and not variables.get(file_spec['when']):
+                continue
+            for target in expand(file_spec['target'], variables):
+                source = os.path.normpath(expand(file_spec['source'], variables)[0])
+                if self._exists(source):
+                    self.plan.add_copy(source, _join(root, target), owner)
+        return self
+
+    def diff(self, max_workers: int = None):
+        """(plan de ce qui manque sur le disque, statistiques)"""
+        return self.plan.missing(max_workers)
+
+    def apply(self, max_workers: int = None, progress=None, transactional: bool = False) -> dict:
+        """Crée seulement ce qui manque"""
+        missing_plan, stats = self.diff(max_workers)
+        logger.info(f"Layout diff: {stats['missing']} missing, {stats['existing']} existing ({stats['scans']} listings)")
+        result = missing_plan.execute(max_workers, progress, transactional)
+        result['diff'] = stats
+        return result
+
+
+def apply_layout(name: str, root: str, max_workers: int = None, **variables) -> dict:
+    """Crée ce qui manque de l'organisation name sous root (API pour les scripts)"""
+    return LayoutPlanner().add(name, root, **variables).apply(max_workers)
+
+
+def _parse_variables(values: list) -> dict:
+    variables = {}
+    for value in values or []:
+        name, _, text = value.partition('=')
+        variables[name] = text.split(',') if ',' in text else text
+    return variables
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Crée ce qui manque d'une organisation de dossiers")
+    parser.add_argument('layout', help='Nom de l\'organisation (ex: project, software.maya)')
+    parser.add_argument('root', help='Dossier racine')
+    parser.add_argument('--var', action='append', help='Variable nom=valeur (liste : nom=a,b,c)')
+    parser.add_argument('--spec', default=None, help='Fichier des organisations (par défaut, ProjectFiles/Templates)')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--dry-run', action='store_true', help='Afficher ce qui manque sans rien créer')
+    args = parser.parse_args(argv)
+
+    variables = _parse_variables(args.var)
+    variables.setdefault('project', args.root)
+    planner = LayoutPlanner(load_spec(args.spec)).add(args.layout, args.root, **variables)
+    missing_plan, stats = planner.diff(args.workers)
+
+    print(f"{stats['missing']} missing, {stats['existing']} existing ({stats['scans']} listings)")
+    for source in planner.missing_sources:
+        print(f'    template not found: {source}')
+    if args.dry_run:
+        for path in list(missing_plan.directories) + list(missing_plan.copies):
+            print(f'    {path}')
+        return 0
+
+    result = missing_plan.execute(args.workers)
+    print(f"{len(result['directories'])} folder(s) and {len(result['copies'])} file(s) created in {result['seconds']:.2f} s")
+    for path, error in result['errors'].items():
+        print(f'    {path}: {error}')
+    return 1 if result['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,307 @@
+"""
+Post-traitement des fichiers Maya ASCII (.ma) publiés, sans Maya.
+
+Le fichier est lu par blocs et découpé sur les fins de ligne : un nom de nœud ne
+contient jamais de retour à la ligne, donc aucune correspondance n'est coupée
+entre deux blocs et la mémoire reste constante quelle que soit la taille du fichier.
+
+Les corrections sont des transformations enchaînées en un seul passage :
+    - Transform / RegexTransform : sur un bloc de lignes complètes (le plus rapide)
+    - LineTransform : ligne par ligne
+    - StatementTransform : instruction MEL complète (ex: un setAttr sur plusieurs lignes,
+      jusqu'au ';' final)
+
+Exemple :
+    processor = MayaAsciiProcessor([create_transform('delete_colon', names=shading_nodes)])
+    stats = processor.process(publish_file_path)
+"""
+
+import os
+import re
+import time
+import shutil
+from Packages.utils import tracing
+from Packages.utils.copy_engine import temp_path_for
+from Packages.utils.logger import init_logger
+
+
+logger = init_logger(__file__)
+
+CHUNK_SIZE = 8 * 1024 * 1024
+
+
+#transforms -----------------------------------------------------------------------
+
+class Transform:
+    """Transformation d'un bloc de lignes complètes (bytes), count compte les modifications"""
+
+    name = 'transform'
+    statement_level = False
+
+    def __init__(self):
+        self.count = 0
+
+    def apply(self, data: bytes) -> bytes:
+        return data
+
+
+class RegexTransform(Transform):
+    """Remplacement par expression régulière (bytes), appliqué au bloc entier"""
+
+    name = 'regex'
+
+    def __init__(self, pattern, replacement):
+        super(RegexTransform, self).__init__()
+        self.pattern = re.compile(pattern) if isinstance(pattern, bytes) else pattern
+        self.replacement = replacement
+
+    def apply(self, data: bytes) -> bytes:
+        if self.pattern is None:
+            return data
+        data, count = self.pattern.subn(self.replacement, data)
+        self.count += count
+        return data
+
+
+class LineTransform(Transform):
+    """Transformation ligne par ligne : transform_line retourne la ligne (modifiée ou non), ou None pour la supprimer"""
+
+    name = 'line'
+
+    def transform_line(self, line: bytes):
+        return line
+
+    def apply(self, data: bytes) -> bytes:
+        lines = []
+        for line in data.splitlines(keepends=True):
+            new_line = self.transform_line(line)
+            if new_line is not line:
+                self.count += 1
+            if new_line is not None:
+                lines.append(new_line)
+        return b''.join(lines)
+
+
+class StatementTransform(Transform):
+    """Transformation par instruction MEL : transform_statement retourne l'instruction, ou None pour la supprimer"""
+
+    name = 'statement'
+    statement_level = True
+
+    def transform_statement(self, statement: bytes):
+        return statement
+
+    def apply(self, data: bytes) -> bytes:
+        new_statement = self.transform_statement(data)
+        if new_statement is not data:
+            self.count += 1
+        return new_statement or b''
+
+
+def _trie_regex(trie: dict) -> bytes:
+    """Expression régulière d'un trie {caractère: sous-trie}, b'' marque la fin d'un nom"""
+    alternatives = [re.escape(char) + _trie_regex(child) for char, child in sorted(trie.items()) if char != b'']
+    if not alternatives:
+        return b''
+
+    pattern = alternatives[0] if len(alternatives) == 1 else b'(?:' + b'|'.join(alternatives) + b')'
+    if b'' in trie:
+        # Nom complet ici : la suite est optionnelle (gourmande, le nom le plus long gagne)
+        pattern = b'(?:' + pattern + b')?'
+    return pattern
+
+
+def build_names_pattern(names) -> bytes:
+    """
+    Alternative compilée sous forme de trie : à chaque position au plus une branche
+    est essayée, au lieu d'un essai par nom avec une alternative simple.
+    """
+    trie = {}
+    for name in names:
+        if not name:
+            continue
+        node = trie
+        for char in name.encode('utf-8'):
+            node = node.setdefault(bytes([char]), {})
+        node[b''] = {}
+
+    return _trie_regex(trie)
+
+
+def compile_colon_pattern(names):
+    """'":<nom>\\w*' pour tous les noms en une seule expression, ou None si la liste est vide"""
+    names_pattern = build_names_pattern(names)
+    if not names_pattern:
+        return None
+    return re.compile(b'":(' + names_pattern + rb')\w*')
+
+
+class DeleteColonTransform(RegexTransform):
+    """
+    Remplace '":<nom>...' par '"<nom>' pour chaque nœud de names.
+    Quand un nom est le préfixe d'un autre (lambert1 / lambert12), le plus long est gardé.
+    """
+
+    name = 'delete_colon'
+
+    def __init__(self, names):
+        super(DeleteColonTransform, self).__init__(compile_colon_pattern(names), rb'"\1')
+
+
+# Transformations disponibles par nom (ex: pour les traitements lancés hors de Maya)
+TRANSFORMS = {}
+
+
+def register_transform(name: str, factory):
+    """Rend une transformation disponible pour create_transform (factory(**options) -> Transform)"""
+    TRANSFORMS[name] = factory
+
+
+def create_transform(name: str, **options) -> Transform:
+    if name not in TRANSFORMS:
+        raise ValueError(f'Unknown Maya ASCII transform: {name}')
+    return TRANSFORMS[name](**options)
+
+
+register_transform('delete_colon', DeleteColonTransform)
+
+
+#reading --------------------------------------------------------------------------
+
+def iter_line_blocks(file, chunk_size: int = CHUNK_SIZE):
+    """Blocs d'un fichier binaire, coupés après le dernier retour à la ligne (ou blanc) de chaque bloc"""
+    pending = b''
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+
+        data = pending + chunk
+        cut = data.rfind(b'\n') + 1
+        if not cut:
+            # Ligne plus longue qu'un bloc : coupure sur un blanc, jamais à l'intérieur d'un nom
+            cut = max(data.rfind(b' '), data.rfind(b'\t')) + 1
+        if not cut:
+            pending = data
+            continue
+
+        pending = data[cut:]
+        yield data[:cut]
+
+    if pending:
+        yield pending
+
+
+def _is_statement_end(line: bytes) -> bool:
+    stripped = line.strip()
+    return not stripped or stripped.endswith(b';') or stripped.startswith(b'//')
+
+
+def iter_statements(blocks):
+    """
+    Instructions MEL complètes à partir de blocs de lignes : une instruction se termine par ';'
+    en fin de ligne, les commentaires et lignes vides sont des instructions à part.
+    Les setAttr indentés qui suivent un createNode sont des instructions distinctes.
+    """
+    pending = []
+    for block in blocks:
+        for line in block.splitlines(keepends=True):
+            pending.append(line)
+            if line.endswith(b'\n') and _is_statement_end(line):
+                yield b''.join(pending)
+                pending = []
+
+    if pending:
+        yield b''.join(pending)
+
+
+#processor ------------------------------------------------------------------------
+
+class SourceChangedError(RuntimeError):
+    """Le fichier a été remplacé ou modifié depuis sa signature : le résultat n'est pas écrit"""
+
+
+def file_signature(file_path: str) -> list:
+    """[taille, mtime (ns), inode] d'un fichier, sérialisable en JSON"""
+    file_stat = os.stat(file_path)
+    return [file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino]
+
+
+def _check_signature(file_path: str, signature):
+    if signature is not None and file_signature(file_path) != list(signature):
+        raise SourceChangedError(f'{file_path} changed since the job was submitted')
+
+
+class MayaAsciiProcessor:
+    """Applique une suite de transformations à un .ma en un seul passage, avec écriture atomique"""
+
+    def __init__(self, transforms: list, chunk_size: int = CHUNK_SIZE):
+        self.transforms = list(transforms)
+        self.chunk_size = chunk_size
+
+    def _units(self, source):
+        blocks = iter_line_blocks(source, self.chunk_size)
+        # Découpage par instruction seulement si une transformation en a besoin (sinon par bloc, plus rapide)
+        if any(transform.statement_level for transform in self.transforms):
+            return iter_statements(blocks)
+        return blocks
+
+    def process(self, file_path: str, output_path: str = None, signature: list = None) -> dict:
+        """
+        Traite file_path et écrit le résultat dans output_path (par défaut, remplace file_path).
+        signature (file_signature) : SourceChangedError si file_path a changé entre-temps
+        (ex: nouvelle publication pendant le traitement), vérifié avant la lecture et avant le remplacement.
+        Retourne {'bytes', 'seconds', 'mb_per_second', 'counts': {transformation: modifications}}.
+        """
+        output_path = output_path or file_path
+        _check_signature(file_path, signature)
+        # Fichier temporaire ignoré par les listings (is_temp_file) tant qu'il est en cours d'écriture
+        temp_path = temp_path_for(output_path)
+        size = os.path.getsize(file_path)
+        start = time.perf_counter()
+
+        with tracing.span('maya_ascii.process', path=file_path,
+                          transforms=','.join(transform.name for transform in self.transforms)) as process_span:
+            try:
+                with open(file_path, 'rb') as source, open(temp_path, 'wb') as destination:
+                    for unit in self._units(source):
+                        for transform in self.transforms:
+                            unit = transform.apply(unit)
+                            if not unit:
+                                break
+                        destination.write(unit)
+                # Garder les permissions du fichier d'origine (sinon celles par défaut du fichier temporaire)
+                shutil.copymode(file_path, temp_path)
+                _check_signature(file_path, signature)
+                os.replace(temp_path, output_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+
+            seconds = time.perf_counter() - start
+            stats = {
+                'bytes': size,
+                'seconds': seconds,
+                'mb_per_second': size / 1024 / 1024 / seconds if seconds else 0.0,
+                'counts': {transform.name: transform.count for transform in self.transforms},
+            }
+            process_span.set(mb_per_second=f"{stats['mb_per_second']:.1f}")
+
+        logger.info(f"{os.path.basename(file_path)}: {size / 1024 / 1024:.1f} MB in {seconds:.2f} s "
+                    f"({stats['mb_per_second']:.1f} MB/s) {stats['counts']}")
+        return stats
+
+
+def delete_colon(file_path: str, names, chunk_size: int = CHUNK_SIZE) -> dict:
+    """
+    Remplace '":<nom>...' par '"<nom>' pour chaque nœud de names, en un seul passage.
+    Retourne les statistiques de MayaAsciiProcessor.process, avec 'replacements'.
+    """
+    transform = DeleteColonTransform(names)
+    if transform.pattern is None:
+        return {'bytes': os.path.getsize(file_path), 'seconds': 0.0, 'mb_per_second': 0.0, 'counts': {}, 'replacements': 0}
+
+    stats = MayaAsciiProcessor([transform], chunk_size).process(file_path)
+    stats['replacements'] = transform.count
+    return stats
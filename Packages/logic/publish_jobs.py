@@ -0,0 +1,193 @@
+"""
+Traitements de publication lancés hors du logiciel (Maya, Houdini) par un worker.
+
+Le logiciel dépose le travail dans la file (submit_*) puis lance le worker s'il ne
+tourne pas déjà : l'artiste reprend la main dès la fin de l'export. Si le worker ne
+peut pas être lancé, le travail est exécuté tout de suite dans le logiciel.
+
+Worker :
+    python -m Packages.logic.publish_jobs
+"""
+
+import os
+import sys
+import shutil
+import subprocess
+from Packages.utils.job_queue import JobQueue, PENDING
+from Packages.utils.constants.preferences import PUBLISH_JOBS_PATH
+from Packages.utils.logger import init_logger
+
+
+logger = init_logger(__file__)
+
+PIPEZER_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Le worker s'arrête après une minute sans travail
+WORKER_IDLE_TIMEOUT = 60.0
+
+
+#handlers -------------------------------------------------------------------------
+
+def run_maya_ascii(payload: dict):
+    """{'file_path', 'signature', 'transforms': [{'name', 'options'}]}"""
+    from Packages.logic import maya_ascii
+
+    transforms = [maya_ascii.create_transform(transform['name'], **transform.get('options', {}))
+                  for transform in payload['transforms']]
+    try:
+        maya_ascii.MayaAsciiProcessor(transforms).process(payload['file_path'], signature=payload.get('signature'))
+    except maya_ascii.SourceChangedError as e:
+        # Le fichier a été republié entre-temps : ne jamais écraser la nouvelle version
+        logger.warning(f'Maya ASCII job skipped: {e}')
+
+
+def run_compress_thumbnail(payload: dict):
+    """{'source', 'destination'} : PNG optimisé, ou simple renommage si PIL n'est pas disponible"""
+    source = payload['source']
+    destination = payload['destination']
+    if not os.path.exists(source):
+        if os.path.exists(destination):
+            return  # Déjà traité par un essai précédent
+        raise FileNotFoundError(source)
+
+    try:
+        from PIL import Image
+    except ImportError:
+        os.replace(source, destination)
+        return
+
+    temp_path = f'{destination}.tmp.png'
+    with Image.open(source) as image:
+        image.save(temp_path, 'PNG', optimize=True)
+    os.replace(temp_path, destination)
+    os.remove(source)
+
+
+def run_file_data(payload: dict):
+    """{'file_path', 'comment'} : auteur et commentaire du fichier publié"""
+    from Packages.logic.json_funcs import update_file_data
+    update_file_data(payload['file_path'], payload.get('comment', ''))
+
+
+def run_notification(payload: dict):
+    """{'username', 'action', 'file_name'}"""
+    from Packages.utils.notification_utils import add_notification
+    add_notification(payload['username'], payload['action'], payload['file_name'])
+
+
+HANDLERS = {
+    'maya_ascii': run_maya_ascii,
+    'compress_thumbnail': run_compress_thumbnail,
+    'file_data': run_file_data,
+    'notification': run_notification,
+}
+
+
+#submit ---------------------------------------------------------------------------
+
+_queue = None
+
+
+def get_queue() -> JobQueue:
+    global _queue
+    if _queue is None:
+        _queue = JobQueue(PUBLISH_JOBS_PATH)
+    return _queue
+
+
+def _python_executable() -> str:
+    """Interpréteur pour le worker (dans Maya/Houdini, sys.executable est le logiciel)"""
+    from Packages.utils.constants.constants_old import PYTHON_W
+    if os.path.exists(PYTHON_W):
+        return PYTHON_W
+
+    if os.path.basename(sys.executable).lower().startswith('python'):
+        return sys.executable
+    return shutil.which('python3') or shutil.which('python') or 'python'
+
+
+def start_worker() -> bool:
+    """Lance le worker dans un processus détaché s'il ne tourne pas déjà"""
+    queue = get_queue()
+    if queue.is_worker_running():
+        return False
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [PIPEZER_ROOT, env.get('PYTHONPATH')]))
+    options = {}
+    if os.name == 'nt':
+        options['creationflags'] = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.CREATE_NO_WINDOW
+    else:
+        options['start_new_session'] = True
+
+    try:
+        subprocess.Popen(
+            [_python_executable(), '-m', 'Packages.logic.publish_jobs'],
+            cwd=PIPEZER_ROOT, env=env, close_fds=True,
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            **options
+        )
+    except OSError as e:
+        logger.error(f'Publish worker could not be started: {e}')
+        return False
+    return True
+
+
+def ensure_worker() -> bool:
+    """Lance le worker si besoin : retourne True si un worker traitera la file"""
+    return start_worker() or get_queue().is_worker_running()
+
+
+def run_in_process(job_id: str):
+    """Exécute un travail de la file dans le processus courant (worker indisponible)"""
+    queue = get_queue()
+    job = queue.get(job_id)
+    if job is None or job['status'] != PENDING:
+        return
+
+    queue.start(job)
+    try:
+        HANDLERS[job['type']](job['payload'])
+    except Exception as e:
+        queue.finish(job, f'{type(e).__name__}: {e}')
+        raise
+    queue.finish(job)
+
+
+def submit(job_type: str, payload: dict, start: bool = True) -> str:
+    """Ajoute un travail à la file et lance le worker (ou l'exécute ici si aucun worker ne tourne)"""
+    if job_type not in HANDLERS:
+        raise ValueError(f'Unknown publish job type: {job_type}')
+
+    job_id = get_queue().submit(job_type, payload)
+    if start and not ensure_worker():
+        logger.warning(f'No publish worker running, {job_type} job {job_id} runs in process')
+        run_in_process(job_id)
+    return job_id
+
+
+def submit_delete_colon(file_path: str, names: list, start: bool = True) -> str:
+    from Packages.logic.maya_ascii import file_signature
+
+    return submit('maya_ascii', {
+        'file_path': file_path,
+        'signature': file_signature(file_path),
+        'transforms': [{'name': 'delete_colon', 'options': {'names': list(names)}}],
+    }, start)
+
+
+def submit_compress_thumbnail(source: str, destination: str, start: bool = True) -> str:
+    return submit('compress_thumbnail', {'source': source, 'destination': destination}, start)
+
+
+def submit_notification(username: str, action: str, file_name: str, start: bool = True) -> str:
+    return submit('notification', {'username': username, 'action': action, 'file_name': file_name}, start)
+
+
+def submit_file_data(file_path: str, comment: str = '', start: bool = True) -> str:
+    return submit('file_data', {'file_path': file_path, 'comment': comment}, start)
+
+
+if __name__ == '__main__':
+    processed = get_queue().run_worker(HANDLERS, idle_timeout=WORKER_IDLE_TIMEOUT)
+    logger.info(f'Publish worker stopped ({processed} job(s) processed)')
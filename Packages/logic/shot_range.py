@@ -0,0 +1,133 @@
+"""
+Création d'une plage de shots d'une séquence en une seule opération (ex: sq0010, sh0010 à sh0400 par pas de 10).
+
+Tout le plan est calculé avant d'écrire : dossiers des shots, dossiers master et
+multiShot de la séquence (une seule fois, et seulement s'ils n'existent pas déjà)
+et copies des templates. Il est exécuté en parallèle et annulé entièrement en cas
+d'erreur (voir Packages/utils/fs_plan.py).
+
+Les dossiers et templates viennent des organisations 'sequence_master.<nom>',
+'sequence_multiShot.<nom>' et 'shot.<nom>' de ProjectFiles/Templates/layouts.json.
+
+Depuis un script :
+    from Packages.logic.shot_range import create_shot_range
+    result = create_shot_range('0010', '0010', '0400', step=10)
+"""
+
+import os
+from Packages.logic.layout_spec import LayoutPlanner
+from Packages.utils.logger import init_logger
+
+
+logger = init_logger(__file__)
+
+DEFAULT_SHOT_FOLDER = '05_shot'
+
+
+def get_shot_root(project: str) -> str:
+    """Dossier des shots : le premier dossier du projet contenant 'shot', sinon 05_shot"""
+    if os.path.isdir(project):
+        for folder in sorted(os.listdir(project)):
+            if "shot" in folder.lower() and os.path.isdir(os.path.join(project, folder)):
+                return os.path.join(project, folder)
+    return os.path.join(project, DEFAULT_SHOT_FOLDER)
+
+
+def validate_number(number: str, label: str = 'Shot') -> str:
+    number = str(number).strip()
+    if not number.isdigit() or len(number) != 4:
+        raise ValueError(f"{label} number must be a 4-digit number (e.g., 0010).")
+    return number
+
+
+def shot_numbers(first: str, last: str = None, step: int = 10) -> list:
+    """'0010', '0040', 10 -> ['0010', '0020', '0030', '0040']"""
+    first = int(validate_number(first))
+    last = first if last in (None, '') else int(validate_number(last))
+    if last < first:
+        raise ValueError("The last shot must come after the first shot.")
+    if step < 1:
+        raise ValueError("Step must be at least 1.")
+    return [f'{number:04}' for number in range(first, last + 1, step)]
+
+
+class ShotRange:
+    """Plan de création des shots d'une séquence"""
+
+    def __init__(self, sequence_number: str, numbers: list, project: str = None, layout: str = 'default'):
+        if project is None:
+            from Packages.utils.constants.project_pipezer_data import CURRENT_PROJECT
+            project = CURRENT_PROJECT
+
+        self.project = project
+        self.layout = layout
+        self.sequence = f"sq{validate_number(sequence_number, 'Sequence')}"
+        self.sequence_folder = os.path.join(get_shot_root(project), self.sequence)
+        self.sequence_exists = os.path.exists(self.sequence_folder)
+
+        self.planner = LayoutPlanner()
+        self.plan = self.planner.plan
+        self.shots = []  # 'sq0010_sh0010' à créer
+        self.skipped = []  # shots existants
+        self.missing_templates = self.planner.missing_sources
+
+        # Dossier des shots et de la séquence dans le plan : annulés avec le reste s'ils sont nouveaux
+        self.plan.add_directory(os.path.dirname(self.sequence_folder))
+        self.plan.add_directory(self.sequence_folder, owner=self.sequence)
+
+        # Dossiers partagés par toute la séquence : une seule fois, et jamais recréés
+        for part in ('master', 'multiShot'):
+            part_folder = os.path.join(self.sequence_folder, f"{self.sequence}_{part}")
+            if not os.path.exists(part_folder):
+                self._plan_part(f'sequence_{part}', part_folder, owner=f"{self.sequence}_{part}")
+
+        for number in numbers:
+            shot = f"{self.sequence}_sh{validate_number(number)}"
+            shot_folder = os.path.join(self.sequence_folder, shot)
+            if os.path.exists(shot_folder):
+                self.skipped.append(shot)
+                continue
+            self._plan_part('shot', shot_folder, owner=shot, shot_number=number)
+            self.shots.append(shot)
+
+    def _plan_part(self, part: str, folder: str, owner: str, shot_number: str = ''):
+        self.planner.add(f'{part}.{self.layout}', folder, owner,
+                         project=self.project, sequence=self.sequence, shot_number=shot_number)
+
+    def summary(self) -> str:
+        lines = [f"{len(self.shots)} shot(s) to create in {self.sequence}: "
+                 f"{len(self.plan.directories)} folder(s), {len(self.plan.copies)} template(s)"]
+        if not self.sequence_exists:
+            lines.append(f"New sequence '{self.sequence}' (master and multiShot folders).")
+        if self.skipped:
+            lines.append(f"{len(self.skipped)} existing shot(s) skipped: {', '.join(self.skipped)}")
+        if self.missing_templates:
+            lines.append('Missing templates (folders created without scene):')
+            lines += [f'    {template}' for template in self.missing_templates]
+        return '\n'.join(lines)
+
+    def execute(self, max_workers: int = None, progress=None, notify: bool = True) -> dict:
+        """Crée tous les shots, ou aucun : la moindre erreur annule tout ce qui a été créé"""
+        result = self.plan.execute(max_workers, progress, transactional=True)
+        result['created'] = [] if result['rolled_back'] else list(self.shots)
+
+        if notify and result['created']:
+            from Packages.utils.notification_utils import add_notification, get_username
+            shots = result['created'][0] if len(result['created']) == 1 else \
+                f"{result['created'][0]} - {result['created'][-1]} ({len(result['created'])} shots)"
+            add_notification(get_username(), "create_shot", shots)
+        return result
+
+
+def create_shot_range(sequence_number: str, first: str, last: str = None, step: int = 10,
+                      project: str = None, layout: str = 'default', max_workers: int = None,
+                      notify: bool = True) -> dict:
+    """
+    Crée les shots first à last (inclus, par pas de step) de la séquence.
+    Retourne le résultat de FileSystemPlan.execute avec 'created' et 'skipped'.
+    """
+    shot_range = ShotRange(sequence_number, shot_numbers(first, last, step), project, layout)
+    logger.info(shot_range.summary())
+    result = shot_range.execute(max_workers, notify=notify)
+    result['skipped'] = shot_range.skipped
+    return result
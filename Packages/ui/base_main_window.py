@@ -5,7 +5,7 @@ import json
 import logging
 
 from PySide2.QtCore import Qt, QSize, QTimer
-from PySide2.QtGui import QPixmap, QCursor, QIcon
+from PySide2.QtGui import QPixmap, QCursor
 from PySide2.QtWidgets import (
     QTabWidget,
     QWidget,
@@ -30,13 +30,13 @@ from Packages.ui.widgets.open_file_widget import OpenFileWidget
 from Packages.ui.widgets.filtered_list_widget import FilteredListWidget
 from Packages.ui.widgets.custom_table_widget import CustomTableWidget
 from Packages.ui.widgets import StatusBar, CustomListWidget, CustomListWidgetItem, CustomMainWindow, CustomTreeWidget
-from Packages.ui.dialogs import TextEntryDialog, CreateSoftProjectDialog
 
 from Packages.utils.constants.constants_old import ASSET_DIR, PREFIX
-from Packages.utils.constants.project_pipezer_data import CURRENT_PROJECT, ICONS_PATH
-from Packages.utils.constants.project_files import ICON_PATH
+from Packages.utils.constants.project_pipezer_data import CURRENT_PROJECT
+from Packages.utils.icon_registry import icon_registry
 from Packages.utils.constants.preferences import CURRENT_PROJECT_JSON_PATH
 from Packages.utils.logger import init_logger
+from Packages.utils import tracing
 from Packages.utils.funcs import get_current_value
 
 from Packages.logic.json_funcs import (
@@ -47,7 +47,7 @@ from Packages.logic.json_funcs import (
     get_clicked_item,
     get_clicked_radio_button
 )
-from Packages.logic.filefunc import clean_directory, open_explorer, increment_file_external
+from Packages.logic.filefunc import clean_directory, open_explorer, get_increment_file_path, search_files
 from Packages.logic.file_opener import FileOpener
 
 logger = init_logger(__file__)
@@ -321,43 +321,20 @@ class BaseMainWindow(CustomMainWindow):
         self._search_file_layout.addWidget(self.search_file_table)
 
     def filter_files(self):
-        print("Début de la méthode filter_files")
-
         search_text = self.search_bar.text().lower()
         project_folder = CURRENT_PROJECT
 
-        print("Effacement du tableau")
         self.search_file_table.setRowCount(0)
 
-        matching_files = []
-        max_displayed_results = 100
-
-        for root, dirs, files in os.walk(project_folder):
-            if '02_ressource' in root:
-                print(f"Dossier ignoré : {root}")
-                continue
-
-            print(f"Exploration du dossier : {root}")
-            for file in files:
-                if search_text in file.lower():
-                    file_path = os.path.join(root, file)
-                    matching_files.append(file_path)
-
-                    if len(matching_files) >= max_displayed_results:
-                        print(f"Limite de {max_displayed_results} résultats atteinte")
-                        break
-            if len(matching_files) >= max_displayed_results:
-                break
-
-        self.search_file_table.setUpdatesEnabled(False)
+        matching_files = search_files(project_folder, search_text, max_results=100)
 
-        for file_path in matching_files:
-            print(f"Ajout du fichier au tableau : {file_path}")
-            self.search_file_table.add_item(file_path)
+        with tracing.span('table.fill', rows=len(matching_files)):
+            self.search_file_table.setUpdatesEnabled(False)
 
-        self.search_file_table.setUpdatesEnabled(True)
+            for file_path in matching_files:
+                self.search_file_table.add_item(file_path)
 
-        print("Fin de la méthode filter_files")
+            self.search_file_table.setUpdatesEnabled(True)
 
     def create_connections(self):
 
@@ -755,6 +732,7 @@ class BaseMainWindow(CustomMainWindow):
         logger.info(f'Get file infos : {file_path}')
 
         self.context_menu.close()
+        from Packages.ui.dialogs.text_entry_dialog import TextEntryDialog
         dialog = TextEntryDialog(self, text=file_comment, title='Edit comment')
 
         if dialog.exec() == QDialog.Accepted:
@@ -789,6 +767,7 @@ class BaseMainWindow(CustomMainWindow):
         directory = self.list_01.data
         logger.info(f'directory arg : {directory}')
         logger.info('Open option dialog.')
+        from Packages.ui.dialogs.create_software_project_dialog import CreateSoftProjectDialog
         project_dialog = CreateSoftProjectDialog(self, directory = directory)
         project_dialog.exec()
         
@@ -796,6 +775,7 @@ class BaseMainWindow(CustomMainWindow):
         
     def _open_create_folder_dialog(self, list_widget):
         
+        from Packages.ui.dialogs.text_entry_dialog import TextEntryDialog
         dialog = TextEntryDialog(self, text = '', title = 'Enter folder name')
         
         if dialog.exec() == QDialog.Accepted:
@@ -835,9 +815,23 @@ class BaseMainWindow(CustomMainWindow):
                 return radio_button.property('directory')
 
     def increment_file(self):
-        increment_file_external(self.current_directory)
-        self.current_directory = os.path.dirname(self.current_directory)
+        new_file_path = get_increment_file_path(self.current_directory)
+        if new_file_path is None:
+            return
+
+        # Copie en arrière-plan : la liste est rafraîchie quand la nouvelle version est en place
+        from Packages.ui.copy_thread import start_copy
+        start_copy(self, self.current_directory, new_file_path,
+                   on_copied=self._on_increment_copied, on_failed=self._on_increment_failed)
+
+    def _on_increment_copied(self, source, destination):
+        if self.current_directory == source:
+            self.current_directory = os.path.dirname(source)
         self.show_files()
+
+    def _on_increment_failed(self, source, error):
+        logger.error(f"Increment of {source} failed: {error}")
+        QMessageBox.warning(self, "Erreur", f"Impossible d'incrémenter le fichier :\n{error}")
             
     def delete_file(self): # OBSOLETE
         os.remove(self.current_directory)
@@ -854,29 +848,19 @@ class BaseMainWindow(CustomMainWindow):
         '''
         '''
         
-        bw_dict = {True: '_bw', False: ''}
-        
-        icon_file_path = os.path.join(ICON_PATH, f'{text.lower()}{bw_dict[bw]}_icon.ico')
-        if not os.path.exists(icon_file_path):
+        icon = icon_registry.get_app_icon(text, bw)
+        if icon is None:
             return
         
-        icon = QIcon(icon_file_path)
         widget.setIcon(icon)
          
     def set_qtree_item_icon(self, item: QTreeWidgetItem, item_name: str):
         '''ajoute un icon au Qtree item si il  a une image au bon nom dans le .pipezer_data
         '''
         
-        item_name_file=f"{item_name}.png"
-        icons = os.listdir(ICONS_PATH)
-        
-        if item_name_file in icons:
-            icon_file_path: str = os.path.join(ICONS_PATH, item_name_file)
-            if not os.path.exists(icon_file_path):
-                icon_file_path = os.path.join(ICONS_PATH, item_name_file.capitalize())
-            
-            icon=QIcon(icon_file_path)
-            item.setIcon(0,icon)
+        icon = icon_registry.get_icon(f"{item_name}.png")
+        if icon is not None:
+            item.setIcon(0, icon)
 
     def show_files(self):
         logger.info('Show files - - - - - - - - - - - - - - - - - - - - - - - -')
@@ -4,15 +4,55 @@ Helper pour migrer le contenu existant vers la nouvelle interface moderne
 
 import os
 from PySide2.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTabWidget, QMessageBox
-from PySide2.QtCore import Qt
+from PySide2.QtCore import Qt, QThread, Signal
 from PySide2.QtGui import QIcon
 from Packages.utils.explorer_utils import open_in_explorer
+from Packages.utils import tracing
 
 from Packages.ui.base_main_window import BaseMainWindow, CreateAssetDialogStandalone
 from Packages.ui.widgets import OpenFileWidget
 from Packages.ui.dialogs.create_shot_dialog import CreateShotDialog
 
 
+class CrashScanThread(QThread):
+    """Lance la recherche des fichiers crash en arrière-plan"""
+    crash_files_found = Signal(list)
+
+    def __init__(self, finder, parent=None):
+        super(CrashScanThread, self).__init__(parent)
+        self.finder = finder
+
+    def run(self):
+        try:
+            results = self.finder.scan()
+        except Exception as e:
+            print(f"Erreur lors de la recherche des fichiers crash: {e}")
+            return
+        self.crash_files_found.emit(results)
+
+
+class RecentFilesCheckThread(QThread):
+    """Vérifie l'existence des fichiers récents en arrière-plan, dans l'ordre de la liste"""
+    file_checked = Signal(str, bool, str)
+
+    def __init__(self, file_paths, parent=None):
+        super(RecentFilesCheckThread, self).__init__(parent)
+        self.file_paths = file_paths
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        from Packages.utils.path_checker import path_checker
+
+        try:
+            for file_path, exists, status in path_checker.iter_check(self.file_paths, lambda: self._cancelled):
+                self.file_checked.emit(file_path, exists, status)
+        except Exception as e:
+            print(f"Erreur lors de la vérification des fichiers récents: {e}")
+
+
 class ContentMigrator:
     """
     Classe helper pour migrer le contenu existant
@@ -30,7 +70,9 @@ class ContentMigrator:
         from Packages.ui.widgets.filtered_list_widget import FilteredListWidget
         from Packages.ui.widgets import StatusBar
         from Packages.utils.funcs import get_current_value
-        from Packages.utils.constants.preferences import CURRENT_PROJECT_JSON_PATH
+        from Packages.utils.constants.preferences import CURRENT_PROJECT_JSON_PATH, CLICKED_ITEMS_JSON_PATH
+        from Packages.ui.directory_loader import DirectoryLoader
+        import json
         
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -99,6 +141,7 @@ class ContentMigrator:
         # Connecter les signaux du menu contextuel
         browser_file_table.file_renamed.connect(lambda old_path, new_path: on_file_renamed(old_path, new_path))
         browser_file_table.file_duplicated.connect(lambda old_path, new_path: on_file_duplicated(old_path, new_path))
+        browser_file_table.files_changed.connect(lambda changes: on_files_changed(changes))
         browser_file_table.open_in_explorer.connect(lambda file_path: on_open_in_explorer(file_path))
         
         # Créer le widget OpenFileWidget pour l'ouverture de fichiers (AVANT la fonction de sélection)
@@ -112,13 +155,21 @@ class ContentMigrator:
                 # Mettre à jour le tableau si nécessaire
                 # Ici on pourrait rafraîchir la liste des fichiers
                 print(f"Fichier renommé: {old_path} -> {new_path}")
+                directory_loader.invalidate(os.path.dirname(new_path))
             except Exception as e:
                 QMessageBox.critical(None, "Erreur", f"Erreur lors du renommage: {str(e)}")
         
+        def on_files_changed(changes):
+            """Opération en masse : chaque dossier touché est invalidé une seule fois"""
+            print(f"{len(changes)} fichier(s) modifié(s)")
+            for directory in {os.path.dirname(path) for pair in changes for path in pair}:
+                directory_loader.invalidate(directory)
+
         def on_file_duplicated(old_path, new_path):
             """Gère la duplication d'un fichier"""
             try:
                 print(f"Fichier dupliqué: {old_path} -> {new_path}")
+                directory_loader.invalidate(os.path.dirname(new_path))
                 # Mettre à jour le tableau si nécessaire
                 # Ici on pourrait rafraîchir la liste des fichiers
             except Exception as e:
@@ -184,39 +235,25 @@ class ContentMigrator:
         }
         
         # Fonction pour filtrer les fichiers selon les extensions
-        def get_filtered_files(directory):
+        def get_filtered_files(files):
             """Récupère seulement les fichiers avec les extensions autorisées"""
-            try:
-                if not os.path.exists(directory):
-                    return []
-                
-                files = []
-                for item in os.listdir(directory):
-                    item_path = os.path.join(directory, item)
-                    if os.path.isfile(item_path):
-                        _, ext = os.path.splitext(item)
-                        if ext.lower() in ALLOWED_EXTENSIONS:
-                            files.append(item)
-                
-                return sorted(files)
-            except Exception as e:
-                print(f"Erreur lors du filtrage des fichiers: {e}")
-                return []
+            return [file for file in files if os.path.splitext(file)[1].lower() in ALLOWED_EXTENSIONS]
         
         # Fonction pour mettre à jour le tableau avec les fichiers filtrés
-        def update_filtered_file_table(directory):
+        def update_filtered_file_table(directory, files):
             """Met à jour le tableau avec seulement les fichiers autorisés"""
             try:
                 browser_file_table.setRowCount(0)
                 
-                filtered_files = get_filtered_files(directory)
+                filtered_files = get_filtered_files(files)
                 if not filtered_files:
                     return
                 
                 # Ajouter les fichiers au tableau
-                for file_name in filtered_files:
-                    file_path = os.path.join(directory, file_name)
-                    browser_file_table.add_item(file_path)
+                with tracing.span('table.fill', directory=directory, rows=len(filtered_files)):
+                    for file_name in filtered_files:
+                        file_path = os.path.join(directory, file_name)
+                        browser_file_table.add_item(file_path)
                 
                 # Sélectionner automatiquement le premier fichier
                 if browser_file_table.rowCount() > 0:
@@ -258,6 +295,7 @@ class ContentMigrator:
         widget.list_07 = list_07
         widget.current_directory = project_path
         widget.current_base_path = project_path  # Chemin de base pour la navigation
+        widget.pending_navigation = None  # Dernier dossier demandé (raccourci ou liste)
         
         # Fonction pour gérer l'affichage des blocs selon le niveau de navigation
         def show_blocks_up_to_level(level):
@@ -270,30 +308,64 @@ class ContentMigrator:
                 else:
                     list_widget.hide()
         
+        # Listing des dossiers en arrière-plan, avec cache par chemin
+        directory_loader = DirectoryLoader(widget)
+        widget.directory_loader = directory_loader
+        
+        # Dossiers qu'on a de bonnes chances d'ouvrir ensuite : on les liste à l'avance
+        PREFETCH_FOLDER_NAMES = ('scenes', 'scene', 'edit', 'publish')
+        MAX_PREFETCH = 3
+        last_selected_folders = {}  # niveau -> dernier dossier choisi
+        
+        def get_clicked_folder_names():
+            """Noms des éléments cliqués dans le projet courant (clicked_items.json)"""
+            names = set()
+            try:
+                with open(CLICKED_ITEMS_JSON_PATH, 'r', encoding='utf-8') as f:
+                    clicked_items = json.load(f)
+                project_name = os.path.basename(os.path.normpath(project_path or ''))
+                for items in clicked_items.get(project_name, {}).values():
+                    for item in items.values():
+                        if isinstance(item, list):
+                            names.update(value for value in item if isinstance(value, str))
+                        elif isinstance(item, str):
+                            names.add(item)
+            except Exception as e:
+                print(f"Impossible de lire les éléments cliqués: {e}")
+            return names
+        
+        clicked_folder_names = get_clicked_folder_names()
+        
+        def prefetch_likely_folders(level, directory, directories):
+            """Liste à l'avance les sous-dossiers les plus probables du niveau affiché"""
+            candidates = []
+            if last_selected_folders.get(level) in directories:
+                candidates.append(last_selected_folders[level])
+            candidates += [name for name in directories if name in clicked_folder_names]
+            candidates += [name for name in directories if name.lower() in PREFETCH_FOLDER_NAMES]
+            if len(directories) == 1:
+                candidates.append(directories[0])
+            
+            prefetched = []
+            for name in candidates:
+                if name not in prefetched:
+                    prefetched.append(name)
+                    directory_loader.prefetch(os.path.join(directory, name))
+                if len(prefetched) >= MAX_PREFETCH:
+                    break
+        
         # Fonction pour remplir une liste avec les dossiers d'un répertoire
-        def populate_list_with_directories(list_widget, directory):
+        def populate_list_with_directories(list_widget, directory, directories):
             """Remplit une liste avec les dossiers d'un répertoire"""
             try:
                 list_widget.clear()
-                if not os.path.exists(directory):
-                    return
-                
-                # Obtenir tous les éléments du répertoire
-                items = os.listdir(directory)
-                directories = []
-                
-                # Séparer les dossiers des fichiers
-                for item in items:
-                    item_path = os.path.join(directory, item)
-                    if os.path.isdir(item_path):
-                        directories.append(item)
-                
-                # Trier les dossiers par nom
-                directories.sort()
                 
                 # Ajouter les dossiers à la liste
                 for directory_name in directories:
                     list_widget.addItem(directory_name)
+                
+                lists = [list_01, list_02, list_03, list_04, list_05, list_06, list_07]
+                prefetch_likely_folders(lists.index(list_widget) + 1, directory, directories)
                     
             except Exception as e:
                 print(f"Erreur lors du remplissage de la liste: {e}")
@@ -377,24 +449,17 @@ class ContentMigrator:
                 # Normaliser le chemin pour éviter les problèmes de séparateurs
                 new_path = os.path.normpath(new_path)
                 
-                # Vérifier si le chemin existe
-                if not os.path.exists(new_path):
-                    return
-                
                 # Mettre à jour le répertoire courant
                 widget.current_directory = new_path
+                widget.pending_navigation = new_path
+                last_selected_folders[level] = selected_folder
                 
                 # La barre de statut a été supprimée - pas besoin de la mettre à jour
                 
-                # Mettre à jour l'affichage des fichiers avec filtrage
-                update_filtered_file_table(new_path)
-                
-                # Mettre à jour le widget d'ouverture de fichiers
-                open_file_widget_browser.update_buttons(new_path)
-                
-                # Vider et remplir la liste suivante
+                # Vider le tableau et la liste suivante en attendant le listing
+                browser_file_table.setRowCount(0)
                 if next_list_widget:
-                    populate_list_with_directories(next_list_widget, new_path)
+                    next_list_widget.clear()
                     # Afficher les blocs jusqu'au niveau suivant
                     show_blocks_up_to_level(level + 1)
                 else:
@@ -422,6 +487,24 @@ class ContentMigrator:
                     list_07.clear()
                 elif level == 5:
                     list_07.clear()
+                
+                def on_directory_listed(listing):
+                    # Ignorer le résultat si l'utilisateur a déjà cliqué ailleurs
+                    if listing is None or widget.current_directory != new_path:
+                        return
+                    directories, files = listing
+                    
+                    # Mettre à jour l'affichage des fichiers avec filtrage
+                    update_filtered_file_table(new_path, files)
+                    
+                    # Mettre à jour le widget d'ouverture de fichiers
+                    open_file_widget_browser.update_buttons(new_path)
+                    
+                    # Remplir la liste suivante
+                    if next_list_widget:
+                        populate_list_with_directories(next_list_widget, new_path, directories)
+                
+                directory_loader.request(new_path, on_directory_listed)
                     
             except Exception as e:
                 print(f"Erreur lors de la sélection niveau {level}: {e}")
@@ -430,36 +513,45 @@ class ContentMigrator:
         def update_navigation(directory):
             """Met à jour la navigation quand on clique sur un bouton de raccourci"""
             try:
-                if not os.path.exists(directory):
-                    return
-                
-                # Mettre à jour le répertoire courant
-                widget.current_directory = directory
-                
-                # La barre de statut a été supprimée - pas besoin de la mettre à jour
-                
-                # Mettre à jour l'affichage des fichiers avec filtrage
-                update_filtered_file_table(directory)
+                # Un raccourci relit toujours le dossier
+                directory_loader.invalidate(directory)
+                widget.pending_navigation = directory
                 
-                # Mettre à jour le widget d'ouverture de fichiers
-                open_file_widget_browser.update_buttons(directory)
-                
-                # Remplir la première liste avec les dossiers du répertoire sélectionné
-                populate_list_with_directories(list_01, directory)
-                
-                # Vider les autres listes
-                list_02.clear()
-                list_03.clear()
-                list_04.clear()
-                list_05.clear()
-                list_06.clear()
-                list_07.clear()
-                
-                # Afficher seulement le bloc 1 au début
-                show_blocks_up_to_level(1)
+                def on_directory_listed(listing):
+                    # Ignorer le résultat si l'utilisateur a déjà cliqué ailleurs (raccourci lent sur le réseau)
+                    if listing is None or widget.pending_navigation != directory:
+                        return
+                    directories, files = listing
+                    
+                    # Mettre à jour le répertoire courant
+                    widget.current_directory = os.path.normpath(directory)
+                    
+                    # La barre de statut a été supprimée - pas besoin de la mettre à jour
+                    
+                    # Mettre à jour l'affichage des fichiers avec filtrage
+                    update_filtered_file_table(directory, files)
+                    
+                    # Mettre à jour le widget d'ouverture de fichiers
+                    open_file_widget_browser.update_buttons(directory)
+                    
+                    # Remplir la première liste avec les dossiers du répertoire sélectionné
+                    populate_list_with_directories(list_01, directory, directories)
+                    
+                    # Vider les autres listes
+                    list_02.clear()
+                    list_03.clear()
+                    list_04.clear()
+                    list_05.clear()
+                    list_06.clear()
+                    list_07.clear()
+                    
+                    # Afficher seulement le bloc 1 au début
+                    show_blocks_up_to_level(1)
+                    
+                    # Mettre à jour le chemin de base pour la navigation
+                    widget.current_base_path = directory
                 
-                # Mettre à jour le chemin de base pour la navigation
-                widget.current_base_path = directory
+                directory_loader.request(directory, on_directory_listed)
                 
             except Exception as e:
                 print(f"Erreur lors de la mise à jour de la navigation: {e}")
@@ -520,6 +612,7 @@ class ContentMigrator:
         from PySide2.QtCore import Qt
         from Packages.ui.widgets.custom_table_widget import CustomTableWidget
         from Packages.ui.widgets.open_file_widget import OpenFileWidget
+        from Packages.utils.path_checker import path_checker, STATUS_UNREACHABLE, STATUS_TIMEOUT
         
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -534,6 +627,7 @@ class ContentMigrator:
         # Connecter les signaux du menu contextuel
         recent_file_table.file_renamed.connect(lambda old_path, new_path: on_file_renamed_recent(old_path, new_path))
         recent_file_table.file_duplicated.connect(lambda old_path, new_path: on_file_duplicated_recent(old_path, new_path))
+        recent_file_table.files_changed.connect(lambda changes: on_files_changed_recent(changes))
         recent_file_table.open_in_explorer.connect(lambda file_path: on_open_in_explorer_recent(file_path))
         
         # Créer le widget OpenFileWidget pour l'ouverture de fichiers
@@ -548,15 +642,23 @@ class ContentMigrator:
             """Gère le renommage d'un fichier dans Recent"""
             try:
                 print(f"Fichier renommé dans Recent: {old_path} -> {new_path}")
+                path_checker.forget(new_path)
                 # Recharger la liste des fichiers récents
                 load_recent_files()
             except Exception as e:
                 QMessageBox.critical(None, "Erreur", f"Erreur lors du renommage: {str(e)}")
         
+        def on_files_changed_recent(changes):
+            """Opération en masse dans Recent : un seul rechargement"""
+            for _, new_path in changes:
+                path_checker.forget(new_path)
+            load_recent_files()
+
         def on_file_duplicated_recent(old_path, new_path):
             """Gère la duplication d'un fichier dans Recent"""
             try:
                 print(f"Fichier dupliqué dans Recent: {old_path} -> {new_path}")
+                path_checker.forget(new_path)
                 # Recharger la liste des fichiers récents
                 load_recent_files()
             except Exception as e:
@@ -574,6 +676,17 @@ class ContentMigrator:
         def load_recent_files():
             """Charge les fichiers récents depuis recent_files.json"""
             try:
+                # Arrêter la vérification précédente, ses résultats seront ignorés
+                check_thread = getattr(widget, 'recent_check_thread', None)
+                if check_thread is not None and check_thread.isRunning():
+                    check_thread.cancel()
+                    try:
+                        check_thread.file_checked.disconnect(on_recent_file_checked)
+                    except RuntimeError:
+                        # Thread déjà détruit entre-temps
+                        pass
+                widget.recent_check_thread = None
+
                 recent_file_table.setRowCount(0)
                 
                 # Chemin vers le fichier recent_files.json
@@ -587,26 +700,43 @@ class ContentMigrator:
                 with open(recent_file_path, 'r', encoding='utf-8') as f:
                     recent_data = json.load(f)
                 
-                # Ajouter les fichiers au tableau
-                for file_path in recent_data.get('files', []):
-                    if os.path.exists(file_path):
-                        recent_file_table.add_item(file_path)
-                
-                # Sélectionner automatiquement le premier fichier
-                if recent_file_table.rowCount() > 0:
-                    recent_file_table.setCurrentCell(0, 0)
-                    recent_file_table.selectRow(0)
-                    
-                    # Mettre à jour le widget d'ouverture avec le premier fichier
-                    first_item = recent_file_table.item(0, 0)
-                    if first_item:
-                        first_file_path = first_item.data(32)
-                        if first_file_path:
-                            open_file_widget_recent.update_buttons(first_file_path)
+                # Les fichiers sont vérifiés en arrière-plan (partages groupés, en parallèle)
+                # et ajoutés au tableau au fur et à mesure
+                check_thread = RecentFilesCheckThread(list(recent_data.get('files', [])), widget)
+                check_thread.file_checked.connect(on_recent_file_checked)
+                check_thread.finished.connect(lambda thread=check_thread: on_recent_check_finished(thread))
+                check_thread.finished.connect(check_thread.deleteLater)
+                widget.recent_check_thread = check_thread
+                check_thread.start()
                     
             except Exception as e:
                 print(f"Erreur lors du chargement des fichiers récents: {e}")
         
+        def on_recent_check_finished(thread):
+            """Oublie le thread avant sa destruction (deleteLater)"""
+            if getattr(widget, 'recent_check_thread', None) is thread:
+                widget.recent_check_thread = None
+
+        def on_recent_file_checked(file_path, exists, status):
+            """Ajoute un fichier récent au tableau dès que son existence est confirmée"""
+            if status in (STATUS_UNREACHABLE, STATUS_TIMEOUT):
+                # Partage qui ne répond pas : le fichier existe peut-être, il reste visible
+                recent_file_table.add_unreachable_item(file_path, status)
+                return
+            if not exists:
+                return
+
+            recent_file_table.add_item(file_path)
+
+            # Sélectionner automatiquement le premier fichier accessible
+            if recent_file_table.currentRow() < 0:
+                row = recent_file_table.rowCount() - 1
+                recent_file_table.setCurrentCell(row, 0)
+                recent_file_table.selectRow(row)
+                
+                # Mettre à jour le widget d'ouverture avec le premier fichier
+                open_file_widget_recent.update_buttons(file_path)
+        
         # Gérer la sélection générale de ligne
         def on_recent_item_selection_changed():
             """Gère la sélection des éléments du tableau récent"""
@@ -619,7 +749,7 @@ class ContentMigrator:
                     if item:
                         file_path = item.data(32)
                         
-                        if file_path and os.path.isfile(file_path):
+                        if file_path and not recent_file_table.is_unreachable(file_path) and os.path.isfile(file_path):
                             open_file_widget_recent.update_buttons(file_path)
             except Exception as e:
                 print(f"Erreur lors de la sélection récente: {e}")
@@ -663,6 +793,7 @@ class ContentMigrator:
         # Connecter les signaux du menu contextuel
         search_file_table.file_renamed.connect(lambda old_path, new_path: on_file_renamed_search(old_path, new_path))
         search_file_table.file_duplicated.connect(lambda old_path, new_path: on_file_duplicated_search(old_path, new_path))
+        search_file_table.files_changed.connect(lambda changes: print(f"{len(changes)} fichier(s) modifié(s) dans Search"))
         search_file_table.open_in_explorer.connect(lambda file_path: on_open_in_explorer_search(file_path))
         
         # Créer le widget OpenFileWidget pour l'ouverture de fichiers
@@ -824,14 +955,14 @@ class ContentMigrator:
     
     @staticmethod
     def create_crash_content(parent):
-        """Crée le contenu Crash avec les fichiers du dossier temp"""
+        """Crée le contenu Crash avec les fichiers crash et autosave des logiciels"""
         import json
         import os
-        import tempfile
         from PySide2.QtWidgets import QVBoxLayout, QWidget, QLabel
         from PySide2.QtCore import Qt
         from Packages.ui.widgets.custom_table_widget import CustomTableWidget
         from Packages.ui.widgets.open_file_widget import OpenFileWidget
+        from Packages.logic.crash_finder import CrashFileFinder
         
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -846,6 +977,7 @@ class ContentMigrator:
         # Connecter les signaux du menu contextuel
         crash_file_table.file_renamed.connect(lambda old_path, new_path: on_file_renamed_crash(old_path, new_path))
         crash_file_table.file_duplicated.connect(lambda old_path, new_path: on_file_duplicated_crash(old_path, new_path))
+        crash_file_table.files_changed.connect(lambda changes: load_crash_files())
         crash_file_table.open_in_explorer.connect(lambda file_path: on_open_in_explorer_crash(file_path))
         
         # Créer le widget OpenFileWidget pour l'ouverture de fichiers
@@ -853,8 +985,9 @@ class ContentMigrator:
         open_file_widget_crash.setObjectName("_open_file_widget_crash")
         open_file_widget_crash.prefs_button.hide()
         
-        # Extensions de fichiers compatibles avec PipeZer
-        compatible_extensions = ['.ma', '.mb', '.hip', '.hipnc', '.nk', '.blend', '.kra', '.fbx', '.obj', '.psd', '.drp', '.uasset', '.zpr']
+        # Recherche ciblée des fichiers crash (dossiers connus de chaque logiciel, avec cache)
+        crash_finder = CrashFileFinder()
+        displayed_crash_files = []
         
         # Fonctions de gestion des signaux du menu contextuel pour Crash
         def on_file_renamed_crash(old_path, new_path):
@@ -883,27 +1016,18 @@ class ContentMigrator:
                 # Ne pas afficher d'erreur, l'explorateur s'ouvre quand même
                 print(f"Erreur lors de l'ouverture de l'explorateur: {str(e)}")
         
-        # Fonction pour charger les fichiers du dossier temp
-        def load_crash_files():
-            """Charge les fichiers compatibles du dossier temp"""
+        # Fonction pour remplir le tableau avec les fichiers crash trouvés
+        def show_crash_files(results):
+            """Affiche les fichiers crash, du plus récent au plus ancien"""
             try:
-                crash_file_table.setRowCount(0)
-                
-                # Obtenir le dossier temp
-                temp_dir = tempfile.gettempdir()
-                
-                if not os.path.exists(temp_dir):
+                file_paths = [file_path for file_path, mtime in results]
+                if file_paths == displayed_crash_files:
                     return
+                displayed_crash_files[:] = file_paths
                 
-                # Parcourir récursivement le dossier temp
-                for root, dirs, files in os.walk(temp_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        file_ext = os.path.splitext(file)[1].lower()
-                        
-                        # Vérifier si l'extension est compatible
-                        if file_ext in compatible_extensions:
-                            crash_file_table.add_item(file_path)
+                crash_file_table.setRowCount(0)
+                for file_path in file_paths:
+                    crash_file_table.add_item(file_path)
                 
                 # Sélectionner automatiquement le premier fichier
                 if crash_file_table.rowCount() > 0:
@@ -920,6 +1044,20 @@ class ContentMigrator:
             except Exception as e:
                 print(f"Erreur lors du chargement des fichiers crash: {e}")
         
+        # Fonction pour charger les fichiers crash
+        def load_crash_files():
+            """Affiche les résultats en cache puis relance la recherche en arrière-plan"""
+            show_crash_files(crash_finder.cached_results())
+            
+            scan_thread = getattr(widget, 'crash_scan_thread', None)
+            if scan_thread is not None and scan_thread.isRunning():
+                return
+            
+            scan_thread = CrashScanThread(crash_finder, widget)
+            scan_thread.crash_files_found.connect(show_crash_files)
+            widget.crash_scan_thread = scan_thread
+            scan_thread.start()
+        
         # Gérer la sélection générale de ligne
         def on_crash_item_selection_changed():
             """Gère la sélection des éléments du tableau crash"""
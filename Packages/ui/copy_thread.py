@@ -0,0 +1,79 @@
+"""
+Copie de fichiers en arrière-plan avec progression et annulation (voir Packages/utils/copy_engine.py)
+"""
+
+import os
+from PySide2.QtCore import Qt, QThread, Signal
+from PySide2.QtWidgets import QProgressDialog
+from Packages.utils.copy_engine import copy_file, CopyCancelled
+from Packages.utils.listing_cache import listing_cache
+
+
+class CopyThread(QThread):
+    """Copie un fichier sans bloquer l'interface"""
+    progress = Signal(int)  # pourcentage
+    copied = Signal(str, str)  # source, destination
+    failed = Signal(str, str)  # source, message d'erreur
+    cancelled = Signal(str)
+
+    def __init__(self, source, destination, overwrite=False, preserve_stat=False, parent=None):
+        super(CopyThread, self).__init__(parent)
+        self.source = source
+        self.destination = destination
+        self.overwrite = overwrite
+        self.preserve_stat = preserve_stat
+        self._cancelled = False
+        self._last_percent = -1
+
+    def cancel(self):
+        self._cancelled = True
+
+    def _on_progress(self, copied, total):
+        percent = int(copied * 100 / total) if total else 100
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.progress.emit(percent)
+
+    def run(self):
+        try:
+            destination = copy_file(
+                self.source, self.destination,
+                progress=self._on_progress, cancelled=lambda: self._cancelled,
+                overwrite=self.overwrite, preserve_stat=self.preserve_stat
+            )
+        except CopyCancelled:
+            self.cancelled.emit(self.source)
+        except Exception as e:
+            self.failed.emit(self.source, str(e))
+        else:
+            listing_cache.invalidate(os.path.dirname(destination))
+            self.copied.emit(self.source, destination)
+
+
+def start_copy(parent, source, destination, on_copied=None, on_failed=None, preserve_stat=False):
+    """
+    Lance la copie en arrière-plan. Une fenêtre de progression (avec bouton d'annulation)
+    s'affiche si la copie dure plus d'une demi-seconde.
+    """
+    thread = CopyThread(source, destination, preserve_stat=preserve_stat, parent=parent)
+
+    dialog = QProgressDialog(f"Copie de {os.path.basename(source)}...", "Annuler", 0, 100, parent)
+    dialog.setWindowTitle("PipeZer")
+    dialog.setWindowModality(Qt.WindowModal)
+    dialog.setMinimumDuration(500)
+    dialog.setAutoClose(False)
+    dialog.setAutoReset(False)
+    dialog.setValue(0)
+
+    thread.progress.connect(dialog.setValue)
+    dialog.canceled.connect(thread.cancel)
+    if on_copied is not None:
+        thread.copied.connect(on_copied)
+    if on_failed is not None:
+        thread.failed.connect(on_failed)
+    thread.finished.connect(dialog.close)
+    thread.finished.connect(dialog.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+
+    thread.start()
+    return thread
@@ -1,5 +1,23 @@
-from Packages.ui.dialogs.text_entry_dialog import TextEntryDialog
-from Packages.ui.dialogs.create_software_project_dialog import CreateSoftProjectDialog
-from Packages.ui.dialogs.loading_dialog import LoadingDialog
-from Packages.ui.dialogs.preferences_dialog import PreferencesDialog
-from Packages.ui.dialogs.settings_dialog import SettingsDialog
+import importlib
+
+# Les dialogs sont importés à la première utilisation : importer un seul dialog
+# (ex: loading_dialog au démarrage) ne charge plus tous les autres.
+_LAZY_DIALOGS = {
+    'TextEntryDialog': 'Packages.ui.dialogs.text_entry_dialog',
+    'CreateSoftProjectDialog': 'Packages.ui.dialogs.create_software_project_dialog',
+    'LoadingDialog': 'Packages.ui.dialogs.loading_dialog',
+    'PreferencesDialog': 'Packages.ui.dialogs.preferences_dialog',
+    'SettingsDialog': 'Packages.ui.dialogs.settings_dialog',
+}
+
+__all__ = list(_LAZY_DIALOGS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_DIALOGS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,8 +1,9 @@
 import os
 import shutil
-import time
 from PySide2.QtCore import QThread, Signal
 from Packages.utils.translation import translation_manager
+from Packages.utils.task_graph import TaskGraph
+from Packages.utils.logger import init_logger
 from Packages.utils.constants.preferences import USER_PREFS, BLANK_PREFS
 from Packages.utils.constants.maya_pref import (
     ICONS, ICONS_PATHS_SOURCE,
@@ -18,6 +19,9 @@ from Packages.utils.constants.houdini_pref import (
 )
 
 
+logger = init_logger(__file__)
+
+
 class LoadingThread(QThread):
     """
     Thread pour gérer l'initialisation de PipeZer en arrière-plan
@@ -28,46 +32,43 @@ class LoadingThread(QThread):
     
     def __init__(self):
         super().__init__()
-        self.total_steps = 8
-        self.current_step = 0
+        self.graph = self.build_graph()
+        
+    def build_graph(self):
+        """
+        Tâches de démarrage et leurs dépendances.
+        Les préférences PipeZer doivent exister avant d'écrire apps.json ou de lire le projet courant,
+        les préférences Maya et Houdini sont indépendantes.
+        """
+        graph = TaskGraph('startup')
+        graph.add('pipezer_pref', self.check_pipezer_pref)
+        graph.add('maya_pref', self.check_maya_pref)
+        graph.add('houdini_pref', self.check_houdini_pref)
+        graph.add('find_apps', self.find_apps, depends=('pipezer_pref',))
+        graph.add('check_project', self.check_project, depends=('pipezer_pref',))
+        return graph
         
     def run(self):
         """Exécute l'initialisation avec mise à jour de la progression"""
-        
-        # Étape 1: Vérification des préférences PipeZer
-        self.update_progress(10, translation_manager.get_text("app.loading"))
-        self.check_pipezer_pref()
-        
-        # Étape 2: Vérification des préférences Maya
-        self.update_progress(25, translation_manager.get_text("app.loading"))
-        self.check_maya_pref()
-        
-        # Étape 3: Vérification des préférences Houdini
-        self.update_progress(40, translation_manager.get_text("app.loading"))
-        self.check_houdini_pref()
-        
-        # Étape 4: Recherche des applications
-        self.update_progress(55, translation_manager.get_text("app.loading"))
-        self.find_apps()
-        
-        # Étape 5: Vérification du projet
-        self.update_progress(70, translation_manager.get_text("app.loading"))
-        self.check_project()
-        
-        # Étape 6: Finalisation
-        self.update_progress(85, translation_manager.get_text("app.loading"))
-        time.sleep(0.5)  # Petite pause pour l'effet visuel
-        
-        # Étape 7: Terminé
+        self.update_progress(0, translation_manager.get_text("app.loading"))
+        first_launch = not os.path.exists(USER_PREFS)
+
+        try:
+            total_time = self.graph.run(self.on_task_done)
+            logger.info(f'Startup tasks done in {total_time * 1000:.0f} ms ({"first launch" if first_launch else "existing prefs"})')
+        except Exception as e:
+            logger.error(f'Startup failed: {e}')
+
         self.update_progress(100, translation_manager.get_text("app.ready"))
-        time.sleep(0.3)
-        
         self.finished_loading.emit()
         
+    def on_task_done(self, done, total, name):
+        """La progression suit le nombre de tâches réellement terminées"""
+        self.update_progress(int(done * 100 / total), translation_manager.get_text("app.loading"))
+        
     def update_progress(self, value, message):
         """Met à jour la progression"""
         self.progress_updated.emit(value, message)
-        time.sleep(0.1)  # Petite pause pour l'effet visuel
         
     def check_pipezer_pref(self):
         """Vérifie et initialise les préférences PipeZer"""
@@ -104,14 +105,14 @@ class LoadingThread(QThread):
             shutil.copy(H_MENU_PIPEZER_SOURCE, HOUDINI_MENU_PATH)
             
     def find_apps(self):
-        """Recherche les applications installées"""
+        """Recherche les applications installées (seulement celles dont l'installation a changé)"""
         from Packages.utils.app_finder import AppFinder
-        from Packages.utils.constants.preferences import APPS_JSON_PATH
-        import json
+        from Packages.utils.constants.preferences import APPS_JSON_PATH, APP_FINDER_CACHE_JSON_PATH
         
-        apps_dict = AppFinder().app_dict
-        with open(APPS_JSON_PATH, 'w', encoding='utf-8') as file:
-            json.dump(apps_dict, file, indent=4, ensure_ascii=False)
+        app_finder = AppFinder(cache_path=APP_FINDER_CACHE_JSON_PATH)
+        if app_finder.probed_vendors:
+            logger.info(f"Applications searched again for: {', '.join(app_finder.probed_vendors)}")
+        app_finder.update_apps_json(APPS_JSON_PATH)
             
     def check_project(self):
         """Vérifie la configuration du projet"""
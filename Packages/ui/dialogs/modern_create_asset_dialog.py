@@ -3,19 +3,22 @@ Modern dialog for creating assets
 """
 
 import os
-import shutil
 import json
 from datetime import datetime
 from PySide2.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QPushButton, QMessageBox, QComboBox, QFormLayout, QGroupBox,
-    QWidget, QGridLayout, QCheckBox, QRadioButton
+    QWidget, QGridLayout, QCheckBox, QRadioButton, QFileDialog
 )
 from PySide2.QtCore import Qt, Signal
 from PySide2.QtGui import QFont, QIcon
 
 from Packages.utils.constants.project_pipezer_data import CURRENT_PROJECT
 from Packages.utils.translations import translation_manager
+from Packages.utils.theme_engine import theme_engine
+from Packages.logic.layout_spec import LayoutPlanner
+from Packages.logic.batch_assets import AssetBatch, SOFTWARES, department_folder, plan_asset
+from Packages.ui.plan_thread import start_plan
 
 class ModernCreateAssetDialog(QDialog):
     """Modern dialog for creating pipeline assets with software-specific project structures"""
@@ -125,7 +128,7 @@ class ModernCreateAssetDialog(QDialog):
         self.geo_cb.setMinimumWidth(100)
         self.geo_combo = QComboBox()
         self.geo_combo.setObjectName("combo_box")
-        self.geo_combo.addItems(['None', 'Maya', 'Houdini', 'Blender', 'ZBrush', 'Cinema 4D'])
+        self.geo_combo.addItems(SOFTWARES)
         self.geo_combo.setCurrentText('Maya')
         self.geo_combo.setMinimumWidth(150)
         geo_layout.addWidget(self.geo_cb)
@@ -141,7 +144,7 @@ class ModernCreateAssetDialog(QDialog):
         self.ldv_cb.setMinimumWidth(100)
         self.ldv_combo = QComboBox()
         self.ldv_combo.setObjectName("combo_box")
-        self.ldv_combo.addItems(['None', 'Maya', 'Houdini', 'Blender', 'ZBrush', 'Cinema 4D'])
+        self.ldv_combo.addItems(SOFTWARES)
         self.ldv_combo.setCurrentText('Maya')
         self.ldv_combo.setMinimumWidth(150)
         ldv_layout.addWidget(self.ldv_cb)
@@ -156,7 +159,7 @@ class ModernCreateAssetDialog(QDialog):
         self.rig_cb.setMinimumWidth(100)
         self.rig_combo = QComboBox()
         self.rig_combo.setObjectName("combo_box")
-        self.rig_combo.addItems(['None', 'Maya', 'Houdini', 'Blender', 'ZBrush', 'Cinema 4D'])
+        self.rig_combo.addItems(SOFTWARES)
         self.rig_combo.setCurrentText('Maya')
         self.rig_combo.setMinimumWidth(150)
         rig_layout.addWidget(self.rig_cb)
@@ -190,6 +193,13 @@ class ModernCreateAssetDialog(QDialog):
         
         button_layout.addStretch()
         
+        self.import_button = QPushButton('Import List...')
+        self.import_button.setObjectName("cancel_button")
+        self.import_button.setFixedSize(140, 45)
+        self.import_button.setToolTip("Create several assets from a CSV or JSON list")
+        self.import_button.clicked.connect(self.import_asset_list)
+        button_layout.addWidget(self.import_button)
+        
         self.run_button = QPushButton('Create')
         self.run_button.setObjectName("create_button")
         self.run_button.setFixedSize(120, 45)
@@ -203,9 +213,10 @@ class ModernCreateAssetDialog(QDialog):
             self.apply_dark_theme()
         else:
             self.apply_light_theme()
+        theme_engine.apply()
     
     def apply_dark_theme(self):
-        self.setStyleSheet("""
+        theme_engine.set_section('create_asset_dialog', """
             QDialog {
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
                     stop:0 #0D1117, stop:1 #161B22);
@@ -416,11 +427,11 @@ class ModernCreateAssetDialog(QDialog):
             QMessageBox QPushButton:hover {
                 background-color: #5B5BD6;
             }
-        """)
+        """, scope='ModernCreateAssetDialog', root_type='QDialog', widget=self)
     
     def apply_light_theme(self):
         """Applique le thème clair"""
-        self.setStyleSheet("""
+        theme_engine.set_section('create_asset_dialog', """
             QDialog {
                 background-color: #FFFFFF;
                 color: #1E1E2E;
@@ -524,7 +535,7 @@ class ModernCreateAssetDialog(QDialog):
                 background-color: #F3F4F6;
                 border-color: #6366F1;
             }
-        """)
+        """, scope='ModernCreateAssetDialog', root_type='QDialog', widget=self)
     
     def set_theme(self, theme):
         self.current_theme = theme
@@ -543,7 +554,13 @@ class ModernCreateAssetDialog(QDialog):
             QMessageBox.warning(self, "Error", "Please select at least one asset type.")
             return
         
+        departments = {
+            department_folder(dept_cb.text()): dept_combo.currentText()
+            for dept_cb, dept_combo in self.department_list if dept_cb.isChecked()
+        }
+        
         try:
+            planner = LayoutPlanner()
             created_assets = []
             
             for type_cb in selected_types:
@@ -554,142 +571,85 @@ class ModernCreateAssetDialog(QDialog):
                     QMessageBox.warning(self, "Error", f"Asset '{asset_name}' already exists in '{asset_type_folder}'.")
                     continue
                 
-                os.makedirs(asset_path, exist_ok=True)
-                
-                dept_folder_mapping = {
-                    'Geometry': 'geo',
-                    'LookDev': 'ldv',
-                    'Rigging': 'rig'
-                }
-                
-                for dept_cb, dept_combo in self.department_list:
-                    if dept_cb.isChecked():
-                        dept_display_name = dept_cb.text()
-                        dept_folder_name = dept_folder_mapping.get(dept_display_name, dept_display_name.lower())
-                        dept_path = os.path.join(asset_path, dept_folder_name)
-                        os.makedirs(dept_path, exist_ok=True)
-                
-                self.copy_software_templates(asset_name, asset_path)
+                plan_asset(planner, CURRENT_PROJECT, asset_name, asset_type_folder, departments)
                 created_assets.append(f"{asset_type_folder}/{asset_name}")
             
-            if created_assets:
-                from Packages.utils.notification_utils import add_notification, get_username
-                username = get_username()
-                add_notification(username, "create_asset", asset_name)
-                
-                success_msg = f"Asset '{asset_name}' created successfully in:\n\n" + "\n".join(created_assets)
-                QMessageBox.information(self, "Success", success_msg)
-                
-                self.asset_created.emit(asset_name)
-                self.accept()
+            if not created_assets:
+                return
+            
+            result = planner.plan.execute()
+            if result['errors']:
+                raise OSError("\n".join(f"{path}: {error}" for path, error in result['errors'].items()))
+            
+            if planner.missing_sources:
+                QMessageBox.warning(
+                    self,
+                    "Template Missing",
+                    "Template files not found:\n" + "\n".join(planner.missing_sources) +
+                    "\n\nDepartments created without template."
+                )
+            
+            from Packages.utils.notification_utils import add_notification, get_username
+            username = get_username()
+            add_notification(username, "create_asset", asset_name)
+            
+            success_msg = f"Asset '{asset_name}' created successfully in:\n\n" + "\n".join(created_assets)
+            QMessageBox.information(self, "Success", success_msg)
+            
+            self.asset_created.emit(asset_name)
+            self.accept()
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error creating asset: {str(e)}")
     
-    def create_software_project_structure(self, dept_path, software_name):
-        """Creates software-specific folder structures (Maya workspace, Houdini hip/geo, etc.)"""
-        software_structures = {
-            'Maya': [
-                'scenes',
-                'sourceimages',
-                'images',
-                'data',
-                'movies',
-                'scripts',
-                'sound',
-                'clips',
-                'cache',
-                'assets'
-            ],
-            'Houdini': [
-                'hip',
-                'geo',
-                'sim',
-                'render',
-                'comp',
-                'scripts',
-                'otls',
-                'backup',
-                'tex'
-            ],
-            'Blender': [
-                'blend',
-                'textures',
-                'renders',
-                'cache',
-                'scripts',
-                'libraries'
-            ],
-            'ZBrush': [
-                'projects',
-                'exports',
-                'references'
-            ],
-            'Cinema 4D': [
-                'scenes',
-                'tex',
-                'lib',
-                'render',
-                'scripts'
-            ]
-        }
+    def import_asset_list(self):
+        """Creates every asset of a CSV/JSON list in one batch (see Packages/logic/batch_assets.py)"""
+        path, _ = QFileDialog.getOpenFileName(self, "Import Asset List", CURRENT_PROJECT, "Asset lists (*.csv *.json)")
+        if not path:
+            return
         
-        if software_name in software_structures:
-            for subfolder in software_structures[software_name]:
-                subfolder_path = os.path.join(dept_path, subfolder)
-                os.makedirs(subfolder_path, exist_ok=True)
-    
-    def copy_software_templates(self, asset_name, asset_path):
-        """Copies template files for selected software per department"""
-        pipezer_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-        template_dir = os.path.join(pipezer_root, "template")
+        try:
+            batch = AssetBatch.from_file(path, CURRENT_PROJECT)
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "Error", f"Cannot read asset list: {str(e)}")
+            return
         
-        if not os.path.exists(template_dir):
-            print(f"Template directory not found: {template_dir}")
+        if not batch.assets:
+            QMessageBox.warning(self, "Import Asset List", batch.summary())
             return
         
-        software_mapping = {
-            'Maya': ('maya_template.ma', '.ma', 'scenes'),
-            'Houdini': ('houdini_template.hiplc', '.hiplc', 'hip'),
-            'Blender': ('blender_template.blend', '.blend', 'blend'),
-            'ZBrush': ('zbrush_template.zbr', '.zbr', 'projects'),
-            'Cinema 4D': ('cinema4D_template.c4d', '.c4d', 'scenes'),
-            'None': (None, None, None)
-        }
+        answer = QMessageBox.question(self, "Import Asset List", batch.summary() + "\n\nCreate these assets?")
+        if answer != QMessageBox.Yes:
+            return
         
-        dept_folder_mapping = {
-            'Geometry': 'geo',
-            'LookDev': 'ldv',
-            'Rigging': 'rig'
-        }
+        self.import_button.setEnabled(False)
+        self.run_button.setEnabled(False)
+        self._batch_thread = start_plan(
+            self, f"Creating {len(batch.assets)} assets...", batch.execute, len(batch.plan),
+            on_done=self._on_batch_done, on_failed=self._on_batch_failed
+        )
+    
+    def _on_batch_done(self, result):
+        self.import_button.setEnabled(True)
+        self.run_button.setEnabled(True)
+        
+        message = f"{len(result['created'])} asset(s) created in {result['seconds']:.1f} s."
+        if result['errors']:
+            message += f"\n\n{len(result['errors'])} error(s):\n" + "\n".join(
+                f"{path}: {error}" for path, error in list(result['errors'].items())[:20])
+            QMessageBox.warning(self, "Import Asset List", message)
+        else:
+            QMessageBox.information(self, "Import Asset List", message)
         
-        for dept_cb, dept_combo in self.department_list:
-            if dept_cb.isChecked():
-                dept_display_name = dept_cb.text()
-                dept_folder_name = dept_folder_mapping.get(dept_display_name, dept_display_name.lower())
-                software_name = dept_combo.currentText()
-                
-                if software_name in software_mapping and software_name != 'None':
-                    template_file, extension, target_subfolder = software_mapping[software_name]
-                    
-                    if template_file and target_subfolder:
-                        dept_path = os.path.join(asset_path, dept_folder_name)
-                        self.create_software_project_structure(dept_path, software_name)
-                        source_path = os.path.join(template_dir, template_file)
-                        
-                        if os.path.exists(source_path):
-                            target_folder = os.path.join(dept_path, target_subfolder)
-                            dest_filename = f"{asset_name}_{dept_folder_name}_E_001{extension}"
-                            dest_path = os.path.join(target_folder, dest_filename)
-                            shutil.copy(source_path, dest_path)
-                            print(f"Template copied: {source_path} → {dest_path}")
-                        else:
-                            print(f"Template file not found: {source_path}")
-                            QMessageBox.warning(
-                                self,
-                                "Template Missing",
-                                f"Template file for {software_name} not found:\n{template_file}\n\nDepartment '{dept_folder_name}' created without template."
-                            )
+        for asset in result['created']:
+            self.asset_created.emit(asset.split('/', 1)[1])
+        if not result['errors']:
+            self.accept()
+    
+    def _on_batch_failed(self, error):
+        self.import_button.setEnabled(True)
+        self.run_button.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Error creating assets: {error}")
     
     def center_on_screen(self):
         from PySide2.QtWidgets import QApplication
@@ -2,12 +2,14 @@
 Modern dialog for creating shots
 """
 
-import os
 from PySide2.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox, QWidget
 from PySide2.QtCore import Qt, Signal
 from PySide2.QtGui import QFont
 
 from Packages.utils.constants.project_pipezer_data import CURRENT_PROJECT
+from Packages.utils.theme_engine import theme_engine
+from Packages.logic.shot_range import ShotRange, shot_numbers
+from Packages.ui.plan_thread import start_plan
 
 
 class ModernCreateShotDialog(QDialog):
@@ -24,7 +26,7 @@ class ModernCreateShotDialog(QDialog):
         
     def setup_ui(self):
         self.setWindowTitle("Create Shot")
-        self.setFixedSize(600, 450)
+        self.setFixedSize(600, 500)
         self.setModal(True)
         self.setWindowFlags(Qt.Dialog | Qt.WindowTitleHint | Qt.WindowCloseButtonHint)
         
@@ -36,7 +38,7 @@ class ModernCreateShotDialog(QDialog):
         title.setObjectName("dialog_title")
         main_layout.addWidget(title)
         
-        desc = QLabel("Create a new shot with its sequence and number")
+        desc = QLabel("Create a new shot, or a range of shots, with its sequence and number")
         desc.setObjectName("dialog_description")
         main_layout.addWidget(desc)
         
@@ -67,6 +69,24 @@ class ModernCreateShotDialog(QDialog):
         shot_layout.addWidget(self.shot_input)
         form_layout.addLayout(shot_layout)
         
+        # Plage de shots : dernier shot (optionnel) et pas
+        range_layout = QHBoxLayout()
+        self.last_shot_label = QLabel('TO:')
+        self.last_shot_label.setObjectName("section_label")
+        self.last_shot_input = QLineEdit()
+        self.last_shot_input.setObjectName("input_field")
+        self.last_shot_input.setPlaceholderText('Optional (ex: 0400)')
+        self.step_label = QLabel('STEP:')
+        self.step_label.setObjectName("section_label")
+        self.step_input = QLineEdit('10')
+        self.step_input.setObjectName("input_field")
+        self.step_input.setFixedWidth(80)
+        range_layout.addWidget(self.last_shot_label)
+        range_layout.addWidget(self.last_shot_input)
+        range_layout.addWidget(self.step_label)
+        range_layout.addWidget(self.step_input)
+        form_layout.addLayout(range_layout)
+        
         main_layout.addWidget(form_widget)
         
         # Boutons
@@ -95,10 +115,11 @@ class ModernCreateShotDialog(QDialog):
             self.apply_dark_theme()
         else:
             self.apply_light_theme()
+        theme_engine.apply()
     
     def apply_dark_theme(self):
         """Applique le thème sombre"""
-        self.setStyleSheet("""
+        theme_engine.set_section('create_shot_dialog', """
             QDialog {
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
                     stop:0 #0D1117, stop:1 #161B22);
@@ -217,11 +238,11 @@ class ModernCreateShotDialog(QDialog):
             QMessageBox QPushButton:hover {
                 background-color: #5B5BD6;
             }
-        """)
+        """, scope='ModernCreateShotDialog', root_type='QDialog', widget=self)
     
     def apply_light_theme(self):
         """Applique le thème clair"""
-        self.setStyleSheet("""
+        theme_engine.set_section('create_shot_dialog', """
             QDialog {
                 background-color: #FFFFFF;
                 color: #1E1E2E;
@@ -263,7 +284,7 @@ class ModernCreateShotDialog(QDialog):
             QPushButton#create_button:pressed {
                 background-color: #4F46E5;
             }
-        """)
+        """, scope='ModernCreateShotDialog', root_type='QDialog', widget=self)
     
     def set_theme(self, theme):
         """Change le thème du dialogue"""
@@ -271,117 +292,69 @@ class ModernCreateShotDialog(QDialog):
         self.setup_theme()
     
     def create_shot(self):
-        """Crée le shot"""
-        sequence_number = self.sequence_input.text().strip()
-        shot_number = self.shot_input.text().strip()
-
-        if not self.validate_input(sequence_number, shot_number):
+        """Crée le shot, ou tous les shots de la plage si un dernier shot est indiqué"""
+        step_text = self.step_input.text().strip() or "10"
+        if not step_text.isdigit():
+            QMessageBox.warning(self, "Error", "Step must be a number (e.g., 10).")
             return
 
-        sequence = f"sq{sequence_number}"
-        shot = f"sh{shot_number}"
-
         try:
-            # Chercher le dossier qui contient "shot" à la racine du projet
-            shot_folder_base = None
-            if os.path.exists(CURRENT_PROJECT):
-                for folder in os.listdir(CURRENT_PROJECT):
-                    folder_path = os.path.join(CURRENT_PROJECT, folder)
-                    if os.path.isdir(folder_path) and "shot" in folder.lower():
-                        shot_folder_base = folder_path
-                        break
-            
-            # Si le dossier "shot" n'existe pas, créer "05_shot" par défaut
-            if not shot_folder_base:
-                shot_folder_base = os.path.join(CURRENT_PROJECT, "05_shot")
-                os.makedirs(shot_folder_base, exist_ok=True)
-            
-            # Créer les chemins pour la séquence et le shot
-            sequence_folder = os.path.join(shot_folder_base, sequence)
-            shot_folder = os.path.join(sequence_folder, f"{sequence}_{shot}")
-            
-            # Vérifier si le shot existe déjà
-            if os.path.exists(shot_folder):
-                QMessageBox.warning(
-                    self, 
-                    "Already Exists", 
-                    f"Shot '{sequence}_{shot}' already exists!\n\nPath: {shot_folder}"
-                )
-                return
-            
-            # Vérifier si la séquence existe déjà (pour information)
-            sequence_already_exists = os.path.exists(sequence_folder)
-            
-            # Créer les dossiers nécessaires
-            if not sequence_already_exists:
-                # Créer la séquence avec ses dossiers master et multiShot
-                self.create_sequence_folders(sequence_folder)
-            
-            # Créer le dossier du shot (sq[XXXX]_sh[XXXX])
-            os.makedirs(shot_folder, exist_ok=True)
-            self.create_shot_subfolders(shot_folder)
+            numbers = shot_numbers(self.shot_input.text(), self.last_shot_input.text().strip(), int(step_text))
+            self.shot_range = ShotRange(self.sequence_input.text(), numbers, CURRENT_PROJECT)
+        except ValueError as e:
+            QMessageBox.warning(self, "Error", str(e))
+            return
 
-            # Ajouter une notification (commenté temporairement)
-            # username = get_username()
-            # add_notification(username, "create_shot", f"{shot} in {sequence}")
+        if not self.shot_range.shots:
+            shots = ", ".join(self.shot_range.skipped)
+            QMessageBox.warning(self, "Already Exists", f"Shot '{shots}' already exists!\n\nPath: {self.shot_range.sequence_folder}")
+            return
 
-            # Message de succès avec information sur la séquence
-            success_message = f"Shot '{sequence}_{shot}' created successfully!"
-            if sequence_already_exists:
-                success_message += f"\n\nAdded to existing sequence '{sequence}'."
-            else:
-                success_message += f"\n\nNew sequence '{sequence}' created."
-            
-            QMessageBox.information(self, "Success", success_message)
-            
-            # Émettre le signal
-            self.shot_created.emit(f"{sequence}_{shot}")
-            self.accept()
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error creating shot: {str(e)}")
+        if len(numbers) > 1:
+            answer = QMessageBox.question(self, "Create Shots", self.shot_range.summary() + "\n\nCreate these shots?")
+            if answer != QMessageBox.Yes:
+                return
 
-    def validate_input(self, sequence_number, shot_number):
-        if not sequence_number.isdigit() or len(sequence_number) != 4:
-            QMessageBox.warning(self, "Error", "Sequence number must be a 4-digit number (e.g., 0020).")
-            return False
-        if not shot_number.isdigit() or len(shot_number) != 4:
-            QMessageBox.warning(self, "Error", "Shot number must be a 4-digit number (e.g., 0010).")
-            return False
-        return True
+        self.create_button.setEnabled(False)
+        self._plan_thread = start_plan(
+            self, f"Creating {len(self.shot_range.shots)} shot(s)...",
+            # Notification désactivée comme pour un shot seul
+            lambda progress: self.shot_range.execute(progress=progress, notify=False),
+            len(self.shot_range.plan),
+            on_done=self._on_shots_created, on_failed=self._on_shots_failed
+        )
 
-    def create_sequence_folders(self, sequence_folder):
-        master_folder = os.path.join(sequence_folder, f"{os.path.basename(sequence_folder)}_master")
-        multi_shot_folder = os.path.join(sequence_folder, f"{os.path.basename(sequence_folder)}_multiShot")
+    def _on_shots_created(self, result):
+        self.create_button.setEnabled(True)
+        shot_range = self.shot_range
 
-        if not os.path.exists(master_folder):
-            os.makedirs(master_folder)
-            self.create_master_subfolders(master_folder)
+        if result['rolled_back']:
+            errors = "\n".join(f"{path}: {error}" for path, error in list(result['errors'].items())[:10])
+            QMessageBox.critical(self, "Error", f"Error creating shots, nothing was created:\n\n{errors}")
+            return
 
-        if not os.path.exists(multi_shot_folder):
-            os.makedirs(multi_shot_folder)
-            self.create_multi_shot_subfolders(multi_shot_folder)
+        # Message de succès avec information sur la séquence
+        if len(shot_range.shots) == 1:
+            success_message = f"Shot '{shot_range.shots[0]}' created successfully!"
+        else:
+            success_message = f"{len(shot_range.shots)} shots created successfully ({result['seconds']:.1f} s)!"
+            if shot_range.skipped:
+                success_message += f"\n\n{len(shot_range.skipped)} existing shot(s) skipped."
+        if shot_range.sequence_exists:
+            success_message += f"\n\nAdded to existing sequence '{shot_range.sequence}'."
+        else:
+            success_message += f"\n\nNew sequence '{shot_range.sequence}' created."
 
-    def create_master_subfolders(self, master_folder):
-        subfolders = [
-            "01_animation", "02_lighting", "03_compositing", "04_fx", "05_render"
-        ]
-        for subfolder in subfolders:
-            os.makedirs(os.path.join(master_folder, subfolder), exist_ok=True)
+        QMessageBox.information(self, "Success", success_message)
 
-    def create_multi_shot_subfolders(self, multi_shot_folder):
-        subfolders = [
-            "01_animation", "02_lighting", "03_compositing", "04_fx", "05_render"
-        ]
-        for subfolder in subfolders:
-            os.makedirs(os.path.join(multi_shot_folder, subfolder), exist_ok=True)
+        # Émettre le signal
+        for shot in result['created']:
+            self.shot_created.emit(shot)
+        self.accept()
 
-    def create_shot_subfolders(self, shot_folder):
-        subfolders = [
-            "01_animation", "02_lighting", "03_compositing", "04_fx", "05_render"
-        ]
-        for subfolder in subfolders:
-            os.makedirs(os.path.join(shot_folder, subfolder), exist_ok=True)
+    def _on_shots_failed(self, error):
+        self.create_button.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Error creating shot: {error}")
     
     def center_on_screen(self):
         """Centre la fenêtre sur l'écran"""
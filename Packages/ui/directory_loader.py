@@ -0,0 +1,156 @@
+"""
+Listing des dossiers en arrière-plan pour le navigateur, à travers le cache de listings
+"""
+
+import os
+from PySide2.QtCore import QObject, QRunnable, QThreadPool, QFileSystemWatcher, Signal
+from Packages.utils.listing_cache import listing_cache
+from Packages.utils import tracing
+from Packages.utils.copy_engine import is_temp_file
+
+
+def split_entries(entries: list) -> tuple:
+    """Sépare les entrées d'un listing en (dossiers, fichiers), sans les fichiers temporaires"""
+    directories = [entry.name for entry in entries if entry.is_dir]
+    files = [entry.name for entry in entries if not entry.is_dir and not is_temp_file(entry.name)]
+    return directories, files
+
+
+def list_directory(directory: str) -> tuple:
+    """Retourne les sous-dossiers et les fichiers (triés) d'un répertoire"""
+    return split_entries(listing_cache.list_directory(directory))
+
+
+class ListingCacheWatcher(QObject):
+    """Invalide le cache de listings quand un dossier local surveillé change"""
+
+    MAX_WATCHED = 256
+
+    _watch_requested = Signal(str)
+
+    def __init__(self, parent=None):
+        super(ListingCacheWatcher, self).__init__(parent)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        # Le cache peut être rempli depuis n'importe quel thread : passage par un signal
+        self._watch_requested.connect(self._watch)
+        listing_cache.watch_handler = self._watch_requested.emit
+
+    def _watch(self, directory):
+        if len(self._watcher.directories()) >= self.MAX_WATCHED:
+            return
+        if self._watcher.addPath(directory):
+            listing_cache.mark_watched(directory)
+
+    def _on_directory_changed(self, directory):
+        listing_cache.invalidate(directory)
+        if not os.path.isdir(directory):
+            listing_cache.mark_watched(directory, False)
+
+
+_listing_cache_watcher = None
+
+
+def install_listing_cache_watcher():
+    """Crée (une seule fois) le watcher du cache de listings, dans le thread de l'interface"""
+    global _listing_cache_watcher
+    if _listing_cache_watcher is None:
+        _listing_cache_watcher = ListingCacheWatcher()
+    return _listing_cache_watcher
+
+
+class _ListingSignals(QObject):
+    listed = Signal(str, object)
+
+
+class _ListingTask(QRunnable):
+
+    def __init__(self, directory: str, signals: _ListingSignals):
+        super(_ListingTask, self).__init__()
+        self.directory = directory
+        self.signals = signals
+
+    def run(self):
+        try:
+            listing = list_directory(self.directory)
+        except OSError as e:
+            print(f"Erreur lors du listing de {self.directory}: {e}")
+            listing = None
+
+        self.signals.listed.emit(self.directory, listing)
+
+
+class DirectoryLoader(QObject):
+    """
+    Liste les dossiers sur un pool de threads, à travers le cache de listings partagé.
+    Les callbacks sont appelés dans le thread de l'interface avec (dossiers, fichiers),
+    ou None si le dossier n'a pas pu être lu.
+    """
+
+    MAX_THREADS = 4
+
+    def __init__(self, parent=None):
+        super(DirectoryLoader, self).__init__(parent)
+
+        install_listing_cache_watcher()
+
+        self._pending = set()
+        self._callbacks = {}
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(self.MAX_THREADS)
+
+        self._signals = _ListingSignals(self)
+        self._signals.listed.connect(self._on_listed)
+
+        # Files d'attente visibles dans le panneau de performances
+        tracing.register_gauge('directory_loader.pending', lambda: len(self._pending))
+        tracing.register_gauge('directory_loader.active_threads', self._pool.activeThreadCount)
+
+    def cached(self, directory: str):
+        """Listing en cache (dossiers, fichiers), sans accès disque, ou None"""
+        entries = listing_cache.cached(directory)
+        if entries is None:
+            return None
+        return split_entries(entries)
+
+    def request(self, directory: str, callback=None, prefetch: bool = False):
+        """
+        Demande le listing d'un dossier, le callback est appelé tout de suite s'il est en cache.
+        Un listing en cache expiré est tout de même servi, et revalidé sur le pool de threads.
+        """
+        directory = os.path.normpath(directory)
+
+        listing = self.cached(directory)
+        if listing is not None:
+            if callback:
+                callback(listing)
+            if listing_cache.expired(directory) and directory not in self._pending:
+                self._pending.add(directory)
+                self._pool.start(_ListingTask(directory, self._signals), -1)
+            return
+
+        if callback:
+            self._callbacks.setdefault(directory, []).append(callback)
+
+        if directory in self._pending:
+            return
+
+        self._pending.add(directory)
+        # Les prefetch passent après les clics de l'utilisateur
+        self._pool.start(_ListingTask(directory, self._signals), -1 if prefetch else 1)
+
+    def prefetch(self, directory: str):
+        self.request(directory, prefetch=True)
+
+    def invalidate(self, directory: str = None):
+        """Oublie le listing d'un dossier, ou de tous les dossiers"""
+        listing_cache.invalidate(directory)
+
+    def _on_listed(self, directory, listing):
+        self._pending.discard(directory)
+
+        for callback in self._callbacks.pop(directory, []):
+            callback(listing)
@@ -4,25 +4,35 @@ Modern main window with expandable sidebar and themes
 
 import os
 import json
+import time
 from PySide2.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QLabel, QFrame, QStackedWidget, QSizePolicy
 )
-from PySide2.QtCore import Qt, Signal
+from PySide2.QtCore import Qt, Signal, QTimer
 from PySide2.QtGui import QFont, QIcon, QPalette, QColor
 
 from Packages.utils.translations import translation_manager
+from Packages.utils.theme_engine import theme_engine
+from Packages.utils.logger import init_logger
 from Packages.ui.widgets.draggable_nav_button import DraggableNavButton
 from Packages.ui.widgets.draggable_sidebar_container import DraggableSidebarContainer
 
 
+logger = init_logger(__file__)
+
 class ModernMainWindow(QMainWindow):
     """Modern main window with expandable sidebar and themes"""
     
     browser_navigation_requested = Signal(str)
+    
+    # Construction des pages pas encore ouvertes quand l'application est inactive
+    PREWARM_DELAY_MS = 2000
+    PREWARM_INTERVAL_MS = 150
     language_changed = Signal(str)
     
     def __init__(self, parent=None):
+        construction_start = time.perf_counter()
         super().__init__(parent)
         
         self.sidebar_width = 210
@@ -32,6 +42,8 @@ class ModernMainWindow(QMainWindow):
         self.setup_theme()
         self.load_custom_shortcuts()
         
+        logger.info(f'Main window built in {(time.perf_counter() - construction_start) * 1000:.1f} ms')
+        
     def setup_ui(self):
         self.setWindowTitle("PipeZer")
         self.setMinimumSize(1200, 800)
@@ -201,6 +213,69 @@ class ModernMainWindow(QMainWindow):
         # Créer les pages de contenu
         self.create_content_pages()
         
+        # Les pages sont construites à la première navigation (voir register_page_builder)
+        self.page_builders = {}
+        self.page_placeholders = {}
+        self.prewarm_queue = []
+        self.prewarm_timer = QTimer(self)
+        self.prewarm_timer.setSingleShot(True)
+        self.prewarm_timer.timeout.connect(self.prewarm_next_page)
+        self.stacked_widget.currentChanged.connect(lambda index: self.ensure_page_built(self.stacked_widget.widget(index)))
+        
+    def get_page_layout(self, page):
+        """Layout vertical d'une page (sans marges), créé si besoin"""
+        layout = page.layout()
+        if layout is None:
+            layout = QVBoxLayout(page)
+            layout.setContentsMargins(0, 0, 0, 0)
+        return layout
+        
+    def register_page_builder(self, page, builder):
+        """La page affiche un placeholder léger jusqu'à ce que builder() soit appelé à la première navigation"""
+        placeholder = QLabel(translation_manager.get_text('loading'))
+        placeholder.setObjectName("page_placeholder")
+        placeholder.setAlignment(Qt.AlignCenter)
+        self.get_page_layout(page).addWidget(placeholder)
+        
+        self.page_placeholders[page] = placeholder
+        self.page_builders[page] = builder
+        
+    def ensure_page_built(self, page):
+        """Construit le contenu d'une page s'il ne l'est pas encore"""
+        builder = self.page_builders.pop(page, None)
+        if builder is None:
+            return
+        
+        placeholder = self.page_placeholders.pop(page, None)
+        if placeholder is not None:
+            self.get_page_layout(page).removeWidget(placeholder)
+            placeholder.deleteLater()
+        
+        start = time.perf_counter()
+        builder()
+        logger.debug(f'Page {page.objectName()} built in {(time.perf_counter() - start) * 1000:.1f} ms')
+        self.on_page_built(page)
+        
+    def on_page_built(self, page):
+        """Appelé après la construction différée d'une page"""
+        pass
+        
+    def schedule_prewarm(self, pages):
+        """Construit ces pages une par une quand l'application est inactive, après l'affichage de la fenêtre"""
+        self.prewarm_queue = [page for page in pages if page in self.page_builders]
+        if self.prewarm_queue:
+            self.prewarm_timer.start(self.PREWARM_DELAY_MS)
+        
+    def prewarm_next_page(self):
+        while self.prewarm_queue:
+            page = self.prewarm_queue.pop(0)
+            if page in self.page_builders:
+                self.ensure_page_built(page)
+                break
+        
+        if self.prewarm_queue:
+            self.prewarm_timer.start(self.PREWARM_INTERVAL_MS)
+        
     def create_content_pages(self):
         """Crée les différentes pages de contenu"""
         # Page Browser (contenu actuel des onglets)
@@ -439,6 +514,9 @@ class ModernMainWindow(QMainWindow):
         # Synchroniser le thème avec les paramètres si ils existent
         if hasattr(self, 'settings_widget'):
             self.settings_widget.set_theme(self.current_theme)
+        
+        # Une seule feuille de style globale, appliquée en une fois
+        theme_engine.apply()
     
     def set_theme(self, theme):
         """Change le thème de l'interface"""
@@ -447,7 +525,7 @@ class ModernMainWindow(QMainWindow):
             
     def apply_dark_theme(self):
         """Applique le thème sombre moderne et sobre"""
-        self.setStyleSheet("""
+        theme_engine.set_section('main_window', """
             /* === PALETTE MODERNE SOMBRE === */
             QMainWindow {
                 background-color: #0D1117;
@@ -897,7 +975,7 @@ class ModernMainWindow(QMainWindow):
             QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
                 background: none;
             }
-        """)
+        """, scope='ModernMainWindow', root_type='QMainWindow', widget=self)
         
     def apply_light_theme(self):
         """Light theme removed - only dark theme available"""
@@ -909,6 +987,7 @@ class ModernMainWindow(QMainWindow):
         """Apply dark theme (light theme removed)"""
         self.current_theme = "dark"  # Force dark theme
         self.apply_dark_theme()
+        theme_engine.apply()
             
     def set_username(self, username):
         """Met à jour le nom d'utilisateur affiché"""
@@ -958,6 +1037,7 @@ class ModernMainWindow(QMainWindow):
                 break
         
         # Afficher les résultats dans la page search
+        self.ensure_page_built(self.search_page)
         if hasattr(self, 'search_content') and hasattr(self.search_content, 'update_search_results'):
             # Basculer vers la page search (index 2)
             self.stacked_widget.setCurrentIndex(2)
@@ -13,6 +13,7 @@ from PySide2.QtCore import Qt, Signal
 from PySide2.QtGui import QFont
 
 from Packages.utils.translations import translation_manager
+from Packages.utils.theme_engine import theme_engine
 from Packages.ui.widgets.language_selector import LanguageSelector
 
 
@@ -750,7 +751,7 @@ class ModernSettingsWidget(QWidget):
     
     def apply_dark_theme(self):
         """Applique le thème sombre aux paramètres"""
-        self.setStyleSheet("""
+        theme_engine.set_section('settings_widget', """
             QFrame#settings_sidebar {
                 background-color: #161B22;
                 border-right: 1px solid #30363D;
@@ -961,7 +962,7 @@ class ModernSettingsWidget(QWidget):
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                     stop:0 #6366F1, stop:1 #4F46E5);
             }
-        """)
+        """, scope='ModernSettingsWidget', widget=self)
     
     def apply_light_theme(self):
         """Light theme removed - only dark theme available"""
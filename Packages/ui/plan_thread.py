@@ -0,0 +1,56 @@
+"""
+Exécution d'un plan de création en masse (assets, shots...) en arrière-plan, avec progression
+(voir Packages/utils/fs_plan.py)
+"""
+
+from PySide2.QtCore import Qt, QThread, Signal
+from PySide2.QtWidgets import QProgressDialog
+from Packages.utils.listing_cache import listing_cache
+
+
+class PlanThread(QThread):
+    """Lance execute(progress=...) sans bloquer l'interface"""
+    progress = Signal(int, int)  # fait, total
+    done = Signal(dict)  # résultat de execute
+    failed = Signal(str)
+
+    def __init__(self, execute, parent=None, invalidate: bool = True):
+        super(PlanThread, self).__init__(parent)
+        self.execute = execute
+        # Un plan qui ne fait que lire le disque (ex: vérification d'un lot) garde le cache de listings
+        self.invalidate = invalidate
+
+    def run(self):
+        try:
+            result = self.execute(progress=self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            if self.invalidate:
+                listing_cache.invalidate()
+            self.done.emit(result)
+
+
+def start_plan(parent, label, execute, total, on_done=None, on_failed=None, invalidate: bool = True):
+    """Lance le plan avec une fenêtre de progression"""
+    thread = PlanThread(execute, parent, invalidate)
+
+    dialog = QProgressDialog(label, None, 0, max(total, 1), parent)
+    dialog.setWindowTitle("PipeZer")
+    dialog.setWindowModality(Qt.WindowModal)
+    dialog.setMinimumDuration(300)
+    dialog.setAutoClose(False)
+    dialog.setAutoReset(False)
+    dialog.setValue(0)
+
+    thread.progress.connect(lambda done, _total: dialog.setValue(done))
+    if on_done is not None:
+        thread.done.connect(on_done)
+    if on_failed is not None:
+        thread.failed.connect(on_failed)
+    thread.finished.connect(dialog.close)
+    thread.finished.connect(dialog.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+
+    thread.start()
+    return thread
@@ -1,22 +1,24 @@
 import os
 import re
-import concurrent.futures
-from PySide2.QtCore import Qt, Signal, QRect
-from PySide2.QtGui import QFont, QIcon, QPainter, QPen, QColor
+from PySide2.QtCore import Qt, Signal, QRect, QThread, QTimer
+from PySide2.QtGui import QFont, QPainter, QPen, QColor, QBrush
 from PySide2.QtWidgets import (QTableWidget, QTableWidgetItem, QAbstractItemView, 
-                               QHeaderView, QMenu, QAction, QInputDialog, QMessageBox)
+                               QHeaderView, QMenu, QAction, QInputDialog, QMessageBox, QApplication)
 from Packages.utils.translations import translation_manager
 from Packages.logic.filefunc import get_version_num, get_file_modification_date_time
 from Packages.logic.json_funcs import get_file_data
 from Packages.logic.filefunc import get_files
 from Packages.ui.widgets.image_widget import ImageWidget
 from Packages.utils.funcs import get_size, forward_slash
-from Packages.utils.constants.project_files import ICON_PATH
+from Packages.utils.icon_registry import icon_registry
+from Packages.utils.theme_engine import theme_engine
+from Packages.utils import tracing
 from Packages.utils.constants.preferences import UI_PREFS_JSON_PATH
 from Packages.utils.funcs import get_current_value
-from PySide2.QtGui import QBrush, QColor, QIcon, QPixmap
+from Packages.utils.logger import init_logger
 
 
+logger = init_logger(__file__)
 
 
 def extract_version_from_filename(filename):
@@ -27,11 +29,60 @@ def extract_version_from_filename(filename):
     return None
 
 
+class LazyColumnsThread(QThread):
+    """Computes the expensive columns (comment, user, date, size) for a list of files"""
+    batch_ready = Signal(int, list)
+
+    def __init__(self, generation, file_paths, batch_size=8, parent=None):
+        super(LazyColumnsThread, self).__init__(parent)
+        self.generation = generation
+        self.file_paths = file_paths
+        self.batch_size = batch_size
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        with tracing.span('table.lazy_columns', rows=len(self.file_paths)):
+            self._compute()
+
+    def _compute(self):
+        batch = []
+        for filepath in self.file_paths:
+            if self._cancelled:
+                return
+
+            try:
+                file_data = get_file_data(filepath)
+                comment = file_data['comment']
+                infos = f"{file_data['user']}\n{get_file_modification_date_time(filepath)}\n{get_size(filepath)}"
+            except Exception as e:
+                logger.warning(f"Could not read infos of {filepath}: {e}")
+                comment, infos = '', ''
+
+            batch.append((filepath, comment, infos))
+            if len(batch) >= self.batch_size:
+                self.batch_ready.emit(self.generation, batch)
+                batch = []
+
+        if batch and not self._cancelled:
+            self.batch_ready.emit(self.generation, batch)
+
+
 class CustomTableWidget(QTableWidget):
     file_renamed = Signal(str, str)
     file_duplicated = Signal(str, str)
+    # Opération en masse terminée : [(ancien chemin, nouveau chemin)], émis une seule fois
+    files_changed = Signal(list)
     open_in_explorer = Signal(str)
 
+    UNREACHABLE_COLOR = QColor(110, 110, 110)
+
+    # Nombre de lignes chargées au-dessus / en-dessous de la zone visible
+    LAZY_ROW_MARGIN = 4
+    LAZY_BATCH_SIZE = 8
+
     def __init__(self, parent=None):
         super(CustomTableWidget, self).__init__(parent)
 
@@ -39,6 +90,20 @@ class CustomTableWidget(QTableWidget):
         
         self._hovered_row = -1
         self._user_has_selected = False
+
+        # Colonnes coûteuses calculées uniquement pour les lignes visibles
+        self._lazy_generation = 0
+        self._lazy_thread = None
+        # Threads annulés encore en cours : gardés jusqu'à leur signal finished
+        self._lazy_threads = set()
+        self._lazy_loaded = set()
+        # Fichiers sur un partage injoignable : affichés grisés, jamais lus
+        self._unreachable = {}
+        self._lazy_timer = QTimer(self)
+        self._lazy_timer.setSingleShot(True)
+        self._lazy_timer.setInterval(50)
+        self._lazy_timer.timeout.connect(self._load_visible_rows)
+        self.verticalScrollBar().valueChanged.connect(self._schedule_lazy_load)
         
         self.cellClicked.connect(self.onCellClicked)
         self.itemSelectionChanged.connect(self.onSelectionChanged)
@@ -49,18 +114,33 @@ class CustomTableWidget(QTableWidget):
     def onCellClicked(self, row, column):
         """Forces row selection when clicking on a cell"""
         self._user_has_selected = True
-        self.selectRow(row)
-        self._apply_row_selection_style(row)
+        # Ctrl / Maj : sélection multiple gérée par Qt
+        if not QApplication.keyboardModifiers() & (Qt.ControlModifier | Qt.ShiftModifier):
+            self.selectRow(row)
+            self._apply_row_selection_style(row)
     
     def onSelectionChanged(self):
         """Handles selection change to clean old selections"""
+        selected_rows = set(self.selected_rows())
         for row in range(self.rowCount()):
-            if row != self.currentRow():
+            if row not in selected_rows:
                 self._clear_row_selection_style(row)
         
-        current_row = self.currentRow()
-        if current_row >= 0:
-            self._apply_row_selection_style(current_row)
+        for row in selected_rows:
+            self._apply_row_selection_style(row)
+
+    def selected_rows(self) -> list:
+        return sorted(index.row() for index in self.selectionModel().selectedRows())
+
+    def selected_file_paths(self) -> list:
+        """Chemins des fichiers des lignes sélectionnées"""
+        file_paths = []
+        for row in self.selected_rows():
+            item = self.item(row, 0)
+            file_path = item.data(32) if item else None
+            if file_path:
+                file_paths.append(file_path)
+        return file_paths
     
     def _apply_row_selection_style(self, row):
         """Applies selection style to all cells in the row"""
@@ -97,7 +177,8 @@ class CustomTableWidget(QTableWidget):
             if item:
                 item.setSelected(False)
                 item.setBackground(QBrush(QColor(28, 28, 28)))
-                item.setForeground(QBrush(QColor(255, 255, 255)))
+                item.setForeground(QBrush(self.UNREACHABLE_COLOR if self.is_unreachable(item.data(32))
+                                          else QColor(255, 255, 255)))
             
             widget = self.cellWidget(row, col)
             if widget:
@@ -147,58 +228,51 @@ class CustomTableWidget(QTableWidget):
         
         self.viewport().update()
     
+    def _row_rect(self, row):
+        first_col_rect = self.visualRect(self.model().index(row, 0))
+        last_col_rect = self.visualRect(self.model().index(row, self.columnCount() - 1))
+        
+        return QRect(
+            first_col_rect.left(),
+            first_col_rect.top(),
+            last_col_rect.right() - first_col_rect.left(),
+            first_col_rect.height()
+        )
+
     def paintEvent(self, event):
-        """Draws table and adds border and background for selected row"""
-        current_row = self.currentRow()
-        if current_row >= 0 and self._user_has_selected:
+        """Draws table and adds border and background for selected rows"""
+        selected_rows = self.selected_rows() if self._user_has_selected else []
+        if selected_rows:
             painter = QPainter(self.viewport())
             painter.setRenderHint(QPainter.Antialiasing)
-            
-            first_col_rect = self.visualRect(self.model().index(current_row, 0))
-            last_col_rect = self.visualRect(self.model().index(current_row, self.columnCount() - 1))
-            
-            row_rect = QRect(
-                first_col_rect.left(),
-                first_col_rect.top(),
-                last_col_rect.right() - first_col_rect.left(),
-                first_col_rect.height()
-            )
-            
             painter.setPen(Qt.NoPen)
             painter.setBrush(QColor(70, 70, 80))
-            painter.drawRoundedRect(row_rect, 4, 4)
+            for row in selected_rows:
+                painter.drawRoundedRect(self._row_rect(row), 4, 4)
             
             painter.end()
         
         super().paintEvent(event)
         
         # Enfin, dessiner la bordure PAR-DESSUS tout
-        if current_row >= 0 and self._user_has_selected:
+        if selected_rows:
             painter = QPainter(self.viewport())
             painter.setRenderHint(QPainter.Antialiasing)
             
-            # Recalculer le rectangle
-            first_col_rect = self.visualRect(self.model().index(current_row, 0))
-            last_col_rect = self.visualRect(self.model().index(current_row, self.columnCount() - 1))
-            
-            row_rect = QRect(
-                first_col_rect.left(),
-                first_col_rect.top(),
-                last_col_rect.right() - first_col_rect.left(),
-                first_col_rect.height()
-            )
-            
             # Dessiner la bordure
             pen = QPen(QColor(99, 102, 241))  # Couleur bleue
             pen.setWidth(2)
             painter.setPen(pen)
             painter.setBrush(Qt.NoBrush)  # Pas de remplissage
-            painter.drawRoundedRect(row_rect, 4, 4)
+            for row in selected_rows:
+                painter.drawRoundedRect(self._row_rect(row), 4, 4)
             
             painter.end()
 
     def clear_table(self):
         """Clears all table rows"""
+        self._cancel_lazy_load()
+        self._lazy_loaded.clear()
         while self.rowCount() > 0:
             self.removeRow(0)
 
@@ -219,7 +293,7 @@ class CustomTableWidget(QTableWidget):
         self.setShowGrid(False)
         self.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.setAlternatingRowColors(False)
-        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.setSortingEnabled(True)
         self.horizontalHeader().setCascadingSectionResizes(False)
@@ -231,7 +305,7 @@ class CustomTableWidget(QTableWidget):
         self.verticalHeader().setHighlightSections(False)
         self.setFocusPolicy(Qt.StrongFocus)
         
-        self.setStyleSheet("""
+        theme_engine.set_section('custom_table', """
             QTableWidget {
                 background-color: #1C1C1C;
                 alternate-background-color: #1C1C1C;
@@ -268,7 +342,7 @@ class CustomTableWidget(QTableWidget):
                 border: none;
                 outline: none;
             }
-        """)
+        """, scope='CustomTableWidget', root_type='QTableWidget', widget=self)
 
         column_count = len(columns)
         self.setColumnCount(column_count)
@@ -281,17 +355,16 @@ class CustomTableWidget(QTableWidget):
             # Utiliser QHeaderView.Stretch pour faire en sorte que toutes les colonnes prennent la largeur disponible
             self.horizontalHeader().setSectionResizeMode(index, QHeaderView.Stretch)
 
-    from PySide2.QtGui import QBrush, QColor, QIcon, QPixmap, QFont
-
-    from PySide2.QtGui import QBrush, QColor, QFont
-
-    def add_item(self, filepath: str, parallel: bool = True):
+    def add_item(self, filepath: str, lazy: bool = True):
         """
         Ajoute un élément dans le tableau avec les informations du fichier.
+        Le nom et la version sont affichés tout de suite, l'image, le commentaire
+        et les infos sont calculés quand la ligne devient visible (sauf si lazy=False).
         """
 
         filepath = forward_slash(filepath)
         filename = os.path.basename(filepath)
+        tracing.count('table.rows')
 
         row_position = self.rowCount()
         self.insertRow(row_position)
@@ -301,14 +374,6 @@ class CustomTableWidget(QTableWidget):
         file_name_item.setData(32, filepath)
         file_name_item.setFlags(Qt.ItemIsEnabled)
 
-        def _image_item():
-            img_exts = ['.png', '.jpg', '.tex', '.exr']
-            ext = os.path.splitext(filename)[-1]
-
-            image_item = ImageWidget(filepath=filepath, image=ext in img_exts)
-            image_item.setData(32, filepath)
-            return image_item
-
         def _version_item():
             version_item = QTableWidgetItem()
             version_item.setData(32, filepath)
@@ -354,48 +419,170 @@ class CustomTableWidget(QTableWidget):
             return version_item
 
         # 3 - Comment
-        def _comment_item():
-            comment_item = QTableWidgetItem()
-            comment_item.setData(32, filepath)
-            comment_item.setFlags(Qt.ItemIsEnabled)
-            comment_data = get_file_data(filepath)['comment']
-            comment_item.setText(comment_data)
-            return comment_item
+        comment_item = QTableWidgetItem()
+        comment_item.setData(32, filepath)
+        comment_item.setFlags(Qt.ItemIsEnabled)
 
         # 4 - Infos
-        def _user_item():
-            user_item = QTableWidgetItem()
-            user_item.setData(32, filepath)
-            user_item.setFlags(Qt.ItemIsEnabled)
-            user_item.setTextAlignment(Qt.AlignCenter)
-            user_data = f"{get_file_data(filepath)['user']}\n{get_file_modification_date_time(filepath)}\n{get_size(filepath)}"
-            user_item.setText(user_data)
-            return user_item
-
-        if parallel:
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                version_item = executor.submit(_version_item)
-                comment_item = executor.submit(_comment_item)
-                user_item = executor.submit(_user_item)
-
-                version_item = version_item.result()
-                comment_item = comment_item.result()
-                user_item = user_item.result()
-
-            image_item = _image_item()
-
-        else:
-            image_item = _image_item()
-            version_item = _version_item()
-            comment_item = _comment_item()
-            user_item = _user_item()
+        user_item = QTableWidgetItem()
+        user_item.setData(32, filepath)
+        user_item.setFlags(Qt.ItemIsEnabled)
+        user_item.setTextAlignment(Qt.AlignCenter)
 
         self.setItem(row_position, 0, file_name_item)  # Colonne "File Name"
-        self.setCellWidget(row_position, 1, image_item)  # Colonne "Image"
-        self.setItem(row_position, 2, version_item)  # Colonne "Version"
+        self.setItem(row_position, 2, _version_item())  # Colonne "Version"
         self.setItem(row_position, 3, comment_item)  # Colonne "Comment"
         self.setItem(row_position, 4, user_item)  # Colonne "Infos"
 
+        if lazy:
+            self._schedule_lazy_load()
+            return
+
+        file_data = get_file_data(filepath)
+        self._fill_lazy_columns(
+            row_position,
+            filepath,
+            file_data['comment'],
+            f"{file_data['user']}\n{get_file_modification_date_time(filepath)}\n{get_size(filepath)}"
+        )
+
+    def add_unreachable_item(self, filepath: str, status: str):
+        """
+        Ajoute une ligne grisée pour un fichier dont le partage ne répond pas
+        (status 'unreachable' ou 'timeout', voir Packages/utils/path_checker.py), sans accès disque.
+        """
+        filepath = forward_slash(filepath)
+        self._unreachable[filepath] = status
+        self._lazy_loaded.add(filepath)
+
+        row_position = self.rowCount()
+        self.insertRow(row_position)
+        self.setRowHeight(row_position, 101)
+
+        message = "Partage injoignable" if status == 'unreachable' else "Délai dépassé"
+        texts = {0: os.path.basename(filepath), 2: status.upper(), 4: message}
+        for column in (0, 2, 3, 4):
+            item = QTableWidgetItem(texts.get(column, ''))
+            item.setData(32, filepath)
+            item.setFlags(Qt.ItemIsEnabled)
+            item.setForeground(QBrush(self.UNREACHABLE_COLOR))
+            item.setToolTip(f"{message} : {filepath}")
+            if column:
+                item.setTextAlignment(Qt.AlignCenter)
+            self.setItem(row_position, column, item)
+
+    def is_unreachable(self, filepath) -> bool:
+        return bool(filepath) and forward_slash(filepath) in self._unreachable
+
+    def _fill_lazy_columns(self, row, filepath, comment, infos):
+        """Remplit l'image, le commentaire et les infos d'une ligne"""
+        img_exts = ['.png', '.jpg', '.tex', '.exr']
+        ext = os.path.splitext(filepath)[-1]
+
+        image_item = ImageWidget(filepath=filepath, image=ext in img_exts)
+        image_item.setData(32, filepath)
+        self.setCellWidget(row, 1, image_item)  # Colonne "Image"
+
+        comment_item = self.item(row, 3)
+        if comment_item:
+            comment_item.setText(comment)
+
+        user_item = self.item(row, 4)
+        if user_item:
+            user_item.setText(infos)
+
+        self._lazy_loaded.add(filepath)
+
+    def _schedule_lazy_load(self, *args):
+        """Regroupe les demandes de chargement (scroll, ajout de lignes) en une seule"""
+        self._lazy_timer.start()
+
+    def _cancel_lazy_load(self):
+        """Annule le chargement en cours, les lots déjà en route seront ignorés"""
+        self._lazy_generation += 1
+        self._lazy_timer.stop()
+        if self._lazy_thread is not None:
+            self._lazy_thread.cancel()
+            self._lazy_thread = None
+
+    def _visible_row_range(self):
+        """Retourne la première et la dernière ligne visibles"""
+        first_row = self.rowAt(0)
+        last_row = self.rowAt(self.viewport().height() - 1)
+        if first_row < 0:
+            first_row = 0
+        if last_row < 0:
+            last_row = self.rowCount() - 1
+        return first_row, last_row
+
+    def _load_visible_rows(self):
+        """Lance le calcul des colonnes coûteuses pour les lignes visibles, puis les voisines"""
+        row_count = self.rowCount()
+        if not row_count or not self.isVisible():
+            return
+
+        first_row, last_row = self._visible_row_range()
+
+        # Priorité : lignes visibles, puis celles en-dessous, puis celles au-dessus
+        rows = list(range(first_row, last_row + 1))
+        rows += range(last_row + 1, min(last_row + 1 + self.LAZY_ROW_MARGIN, row_count))
+        rows += range(first_row - 1, max(first_row - 1 - self.LAZY_ROW_MARGIN, -1), -1)
+
+        file_paths = []
+        for row in rows:
+            item = self.item(row, 0)
+            if item is None:
+                continue
+            filepath = item.data(32)
+            if filepath and filepath not in self._lazy_loaded:
+                file_paths.append(filepath)
+
+        self._cancel_lazy_load()
+        if not file_paths:
+            return
+
+        thread = LazyColumnsThread(self._lazy_generation, file_paths, self.LAZY_BATCH_SIZE, self)
+        thread.batch_ready.connect(self._on_lazy_batch_ready)
+        thread.finished.connect(lambda thread=thread: self._lazy_threads.discard(thread))
+        thread.finished.connect(thread.deleteLater)
+        self._lazy_threads.add(thread)
+        self._lazy_thread = thread
+        thread.start()
+
+    def _on_lazy_batch_ready(self, generation, batch):
+        """Applique un lot calculé en arrière-plan, si le tableau n'a pas changé entre-temps"""
+        if generation != self._lazy_generation:
+            return
+
+        # Les lignes peuvent avoir bougé (tri), on les retrouve par chemin
+        rows = {}
+        for row in range(self.rowCount()):
+            item = self.item(row, 0)
+            if item is not None:
+                rows[item.data(32)] = row
+
+        with tracing.span('table.lazy_batch', rows=len(batch)):
+            for filepath, comment, infos in batch:
+                row = rows.get(filepath)
+                if row is not None and filepath not in self._lazy_loaded:
+                    self._fill_lazy_columns(row, filepath, comment, infos)
+
+    def setRowCount(self, rows):
+        """Annule le chargement des colonnes quand le tableau est vidé (changement de dossier)"""
+        if rows == 0:
+            self._cancel_lazy_load()
+            self._lazy_loaded.clear()
+            self._unreachable.clear()
+        super(CustomTableWidget, self).setRowCount(rows)
+
+    def resizeEvent(self, event):
+        super(CustomTableWidget, self).resizeEvent(event)
+        self._schedule_lazy_load()
+
+    def showEvent(self, event):
+        super(CustomTableWidget, self).showEvent(event)
+        self._schedule_lazy_load()
+
     def update_file_items(self, directory):
         """Updates file items in table from directory"""
 
@@ -432,13 +619,10 @@ class CustomTableWidget(QTableWidget):
     def _add_icon(self, widget, text="", bw: bool = False):
         """Adds icon to table widget"""
 
-        bw_dict = {True: '_bw', False: ''}
-
-        icon_file_path = os.path.join(ICON_PATH, f'{text.lower()}{bw_dict[bw]}_icon.ico')
-        if not os.path.exists(icon_file_path):
+        icon = icon_registry.get_app_icon(text, bw)
+        if icon is None:
             return
 
-        icon = QIcon(icon_file_path)
         widget.setIcon(icon)
 
     def filter_files_by_name(self, name):
@@ -456,6 +640,10 @@ class CustomTableWidget(QTableWidget):
     
     def show_context_menu(self, position):
         """Shows context menu on right click"""
+        if len(self.selected_rows()) > 1:
+            self.show_batch_context_menu(position)
+            return
+
         current_row = self.currentRow()
         if current_row < 0:
             return
@@ -465,7 +653,7 @@ class CustomTableWidget(QTableWidget):
             return
         
         file_path = file_path_item.data(32)
-        if not file_path or not os.path.exists(file_path):
+        if not file_path or self.is_unreachable(file_path) or not os.path.exists(file_path):
             return
         
         context_menu = QMenu(self)
@@ -555,15 +743,20 @@ class CustomTableWidget(QTableWidget):
                 new_path = os.path.join(directory, new_filename)
                 counter += 1
             
-            import shutil
-            shutil.copy2(file_path, new_path)
-            
-            self.file_duplicated.emit(file_path, new_path)
-            
-            QMessageBox.information(self, "Succès", f"Le fichier a été dupliqué en '{os.path.basename(new_path)}'.")
+            # Copie en arrière-plan (scènes volumineuses, souvent sur le réseau)
+            from Packages.ui.copy_thread import start_copy
+            start_copy(self, file_path, new_path, on_copied=self._on_file_duplicated,
+                       on_failed=self._on_duplicate_failed, preserve_stat=True)
             
         except Exception as e:
             QMessageBox.critical(self, "Erreur", f"Impossible de dupliquer le fichier: {str(e)}")
+
+    def _on_file_duplicated(self, file_path, new_path):
+        self.file_duplicated.emit(file_path, new_path)
+        QMessageBox.information(self, "Succès", f"Le fichier a été dupliqué en '{os.path.basename(new_path)}'.")
+
+    def _on_duplicate_failed(self, file_path, error):
+        QMessageBox.critical(self, "Erreur", f"Impossible de dupliquer le fichier: {error}")
     
     def open_in_explorer_action(self, file_path):
         """Ouvre l'explorateur Windows à l'emplacement du fichier"""
@@ -573,3 +766,80 @@ class CustomTableWidget(QTableWidget):
         except Exception as e:
             print(f"Erreur lors de l'ouverture de l'explorateur: {str(e)}")
 
+    #batch ------------------------------------------------------------------------------
+
+    def show_batch_context_menu(self, position):
+        """Menu des opérations en masse sur les fichiers sélectionnés"""
+        # Les fichiers disparus sont signalés par le plan du lot, sans accès disque ici
+        file_paths = [file_path for file_path in self.selected_file_paths() if not self.is_unreachable(file_path)]
+        if not file_paths:
+            return
+
+        context_menu = QMenu(self)
+        count = len(file_paths)
+
+        version_up_action = QAction(f"{translation_manager.get_text('version_up_selection')} ({count})", self)
+        version_up_action.triggered.connect(lambda: self.batch_version_up(file_paths))
+        context_menu.addAction(version_up_action)
+
+        rename_action = QAction(f"{translation_manager.get_text('rename_selection')} ({count})", self)
+        rename_action.triggered.connect(lambda: self.batch_rename(file_paths))
+        context_menu.addAction(rename_action)
+
+        move_action = QAction(f"{translation_manager.get_text('move_to_old')} ({count})", self)
+        move_action.triggered.connect(lambda: self.batch_move_to_old(file_paths))
+        context_menu.addAction(move_action)
+
+        context_menu.exec_(self.mapToGlobal(position))
+
+    def batch_version_up(self, file_paths):
+        from Packages.logic.batch_files import FileBatch
+        self._plan_batch(file_paths, lambda: FileBatch.version_up(file_paths))
+
+    def batch_rename(self, file_paths):
+        """Renomme les fichiers sélectionnés en remplaçant un texte de leur nom"""
+        from Packages.logic.batch_files import FileBatch
+
+        find, ok = QInputDialog.getText(self, "Renommer la sélection", "Texte à remplacer :")
+        if not ok or not find:
+            return
+        replace, ok = QInputDialog.getText(self, "Renommer la sélection", f"Remplacer '{find}' par :")
+        if not ok:
+            return
+        self._plan_batch(file_paths, lambda: FileBatch.rename(file_paths, find, replace))
+
+    def batch_move_to_old(self, file_paths):
+        from Packages.logic.batch_files import FileBatch
+        self._plan_batch(file_paths, lambda: FileBatch.move_to_old(file_paths))
+
+    def _plan_batch(self, file_paths, build):
+        """Construit le lot en arrière-plan (un listing par dossier, souvent sur le réseau) puis demande confirmation"""
+        from Packages.ui.plan_thread import start_plan
+        start_plan(self, f"Checking {len(file_paths)} file(s)...", lambda progress=None: {'batch': build()}, 0,
+                   on_done=lambda result: self._run_batch(result['batch']),
+                   on_failed=lambda error: QMessageBox.critical(self, "Erreur", error),
+                   invalidate=False)
+
+    def _run_batch(self, batch):
+        """Une seule confirmation, exécution en arrière-plan, un seul compte rendu"""
+        if not batch.operations:
+            QMessageBox.warning(self, "PipeZer", batch.summary())
+            return
+
+        reply = QMessageBox.question(self, "PipeZer", batch.summary(), QMessageBox.Ok | QMessageBox.Cancel)
+        if reply != QMessageBox.Ok:
+            return
+
+        from Packages.ui.plan_thread import start_plan
+        start_plan(self, f"{len(batch)} file(s)...", batch.execute, len(batch),
+                   on_done=lambda result: self._on_batch_done(batch, result),
+                   on_failed=lambda error: QMessageBox.critical(self, "Erreur", error))
+
+    def _on_batch_done(self, batch, result):
+        if result['done']:
+            self.files_changed.emit(list(result['done']))
+
+        if result['errors']:
+            QMessageBox.warning(self, "PipeZer", batch.report(result))
+        else:
+            QMessageBox.information(self, "PipeZer", batch.report(result))
@@ -5,6 +5,7 @@ from PySide2.QtWidgets import *
 from Packages.logic.json_funcs import json_to_dict, dict_to_json
 from Packages.utils.constants.preferences import USER_PREFS, APPS_JSON_PATH
 from Packages.logic.filefunc import open_explorer
+from Packages.ui.widgets.performance_panel import PerformancePanel
         
 class devModeWidget(QWidget):
     
@@ -19,6 +20,10 @@ class devModeWidget(QWidget):
         
     def create_widget(self):
     
+        self.path_label = QLabel(USER_PREFS)
+        self.path_label.setObjectName("path_label")
+        self.path_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+
         self.prefs_button = QPushButton()
         self.prefs_button.setObjectName("prefs_button")
         self.prefs_button.setFocusPolicy(Qt.NoFocus)
@@ -32,17 +37,23 @@ class devModeWidget(QWidget):
         self.open_pipezer_user_button.setMaximumSize(QSize(150, 50))
         self.open_pipezer_user_button.setMinimumSize(QSize(50, 50))
         self.open_pipezer_user_button.setText("open .pipezer")
+
+        self.performance_panel = PerformancePanel(self)
         
 
     def create_layout(self):
         self.setMinimumSize(QSize(50, 50))
-        self._main_layout = QHBoxLayout(self)
+        self._main_layout = QVBoxLayout(self)
         self._main_layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(self._main_layout)
         
-        self._main_layout.addWidget(self.path_label)
-        self._main_layout.addWidget(self.prefs_button)
-        self._main_layout.addWidget(self.open_pipezer_user_button)
+        self._buttons_layout = QHBoxLayout()
+        self._buttons_layout.addWidget(self.path_label)
+        self._buttons_layout.addWidget(self.prefs_button)
+        self._buttons_layout.addWidget(self.open_pipezer_user_button)
+
+        self._main_layout.addLayout(self._buttons_layout)
+        self._main_layout.addWidget(self.performance_panel)
 
         
 
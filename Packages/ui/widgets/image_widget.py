@@ -1,11 +1,17 @@
 import os
 import sys
-from PIL import Image
+from collections import OrderedDict
 from PySide2.QtCore import Qt
 from PySide2.QtGui import QPixmap, QDropEvent, QImageReader
 from PySide2.QtWidgets import QMenu, QLabel, QFileDialog, QAction
 from Packages.utils.constants.constants_old import NO_PREVIEW_FILEPATH, SITE_PACKAGES_PATH
 from Packages.utils.constants.project_pipezer_data import pipezer_data_PREVIEW
+from Packages.utils import tracing
+
+
+# Vignettes déjà décodées et redimensionnées : (chemin, mtime) -> QPixmap
+_THUMBNAIL_CACHE = OrderedDict()
+THUMBNAIL_CACHE_SIZE = 256
 
 class ImageWidget(QLabel):
 
@@ -83,14 +89,31 @@ class ImageWidget(QLabel):
 
     def _set_pixmap(self, image_filepath):
         """ Charger l'image sélectionnée dans le QLabel """
-        pixmap = QPixmap(image_filepath)
+        try:
+            cache_key = (image_filepath, os.path.getmtime(image_filepath))
+        except OSError:
+            cache_key = None
+
+        pixmap = _THUMBNAIL_CACHE.get(cache_key) if cache_key else None
+        if pixmap is not None:
+            tracing.count('thumbnail.hits')
+            _THUMBNAIL_CACHE.move_to_end(cache_key)
+        else:
+            tracing.count('thumbnail.misses')
+            with tracing.span('thumbnail.decode', path=image_filepath):
+                pixmap = QPixmap(image_filepath)
+
+                # Taille maximale que vous souhaitez définir
+                max_width = 180
+                max_height = 101
 
-        # Taille maximale que vous souhaitez définir
-        max_width = 180
-        max_height = 101
+                # Redimensionner l'image pour s'adapter à la taille maximale tout en préservant l'aspect
+                pixmap = pixmap.scaled(max_width, max_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
-        # Redimensionner l'image pour s'adapter à la taille maximale tout en préservant l'aspect
-        pixmap = pixmap.scaled(max_width, max_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            if cache_key:
+                _THUMBNAIL_CACHE[cache_key] = pixmap
+                if len(_THUMBNAIL_CACHE) > THUMBNAIL_CACHE_SIZE:
+                    _THUMBNAIL_CACHE.popitem(last=False)
 
         self.setPixmap(pixmap)
         self.setText("")
@@ -5,7 +5,7 @@ from PySide2.QtGui import Qt
 from PySide2.QtWidgets import QPushButton, QWidget, QHBoxLayout, QFileDialog
 from Packages.logic.json_funcs import json_to_dict, dict_to_json
 from Packages.logic.file_opener import FileOpener
-from Packages.utils.constants.project_files import ICON_PATH
+from Packages.utils.icon_registry import icon_registry
 from Packages.utils.constants.preferences import APPS_JSON_PATH
 
 EXTS = {
@@ -152,11 +152,8 @@ class OpenFileWidget(QWidget):
             icon_app_name = 'none.ico'
             icon_pref_name = 'none.ico'
         
-        icon_app_file_path = os.path.join(ICON_PATH, icon_app_name)
-        icon_pref_file_path = os.path.join(ICON_PATH, icon_pref_name)
-        
-        icon_app = QIcon(icon_app_file_path)
-        icon_pref = QIcon(icon_pref_file_path)
+        icon_app = icon_registry.get_icon(icon_app_name) or QIcon()
+        icon_pref = icon_registry.get_icon(icon_pref_name) or QIcon()
         
         self.open_file_button.setIcon(icon_app)
         self.prefs_button.setIcon(icon_pref)
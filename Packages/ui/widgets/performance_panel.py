@@ -0,0 +1,162 @@
+import time
+from PySide2.QtCore import QObject, QTimer, QSize
+from PySide2.QtGui import Qt
+from PySide2.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                               QTableWidget, QTableWidgetItem, QAbstractItemView, QHeaderView)
+from Packages.utils import tracing
+from Packages.utils.listing_cache import listing_cache
+
+
+class EventLoopStallDetector(QObject):
+    """
+    Détecte les blocages de la boucle d'événements : un timer doit se déclencher
+    toutes les INTERVAL_MS, tout retard au-delà de STALL_THRESHOLD_MS est un blocage.
+    """
+
+    INTERVAL_MS = 50
+    STALL_THRESHOLD_MS = 150
+
+    def __init__(self, parent=None):
+        super(EventLoopStallDetector, self).__init__(parent)
+
+        self.stalls = 0
+        self.max_stall_ms = 0.0
+        self.last_stall_ms = 0.0
+        self.last_stall_time = None
+
+        self._last_tick = time.perf_counter()
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._on_tick)
+        self._timer.start(self.INTERVAL_MS)
+
+    def _on_tick(self):
+        now = time.perf_counter()
+        late_ms = (now - self._last_tick) * 1000 - self.INTERVAL_MS
+        self._last_tick = now
+
+        if late_ms < self.STALL_THRESHOLD_MS:
+            return
+
+        self.stalls += 1
+        self.last_stall_ms = late_ms
+        self.last_stall_time = time.strftime('%H:%M:%S')
+        self.max_stall_ms = max(self.max_stall_ms, late_ms)
+        tracing.observe('gui.stall', late_ms)
+
+    def reset(self):
+        self.stalls = 0
+        self.max_stall_ms = 0.0
+        self.last_stall_ms = 0.0
+        self.last_stall_time = None
+
+
+class PerformancePanel(QWidget):
+    """Panneau du mode développeur : derniers spans, taux de cache, files d'attente et blocages de l'interface"""
+
+    MAX_SPANS = 50
+    REFRESH_MS = 1000
+
+    def __init__(self, parent=None) -> None:
+        super(PerformancePanel, self).__init__(parent)
+
+        # Le panneau n'a de sens qu'avec les traces activées
+        tracing.set_enabled(True)
+        self.stall_detector = EventLoopStallDetector(self)
+
+        self.create_widget()
+        self.create_layout()
+        self.create_connections()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(self.REFRESH_MS)
+        self.refresh()
+
+    def create_widget(self):
+        self.spans_table = QTableWidget(0, 4)
+        self.spans_table.setHorizontalHeaderLabels(['Time', 'Span', 'ms', 'Details'])
+        self.spans_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.spans_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.spans_table.verticalHeader().setVisible(False)
+        self.spans_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
+        self.spans_table.setMinimumSize(QSize(400, 120))
+
+        self.caches_label = QLabel()
+        self.caches_label.setObjectName("perf_caches_label")
+        self.queues_label = QLabel()
+        self.queues_label.setObjectName("perf_queues_label")
+        self.stalls_label = QLabel()
+        self.stalls_label.setObjectName("perf_stalls_label")
+
+        for label in (self.caches_label, self.queues_label, self.stalls_label):
+            label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+
+        self.reset_button = QPushButton("Reset")
+        self.reset_button.setFocusPolicy(Qt.NoFocus)
+        self.reset_button.setMaximumWidth(80)
+
+    def create_layout(self):
+        self._main_layout = QHBoxLayout(self)
+        self._main_layout.setContentsMargins(0, 0, 0, 0)
+
+        stats_layout = QVBoxLayout()
+        stats_layout.addWidget(self.caches_label)
+        stats_layout.addWidget(self.queues_label)
+        stats_layout.addWidget(self.stalls_label)
+        stats_layout.addStretch()
+        stats_layout.addWidget(self.reset_button)
+
+        self._main_layout.addWidget(self.spans_table, 3)
+        self._main_layout.addLayout(stats_layout, 1)
+
+    def create_connections(self):
+        self.reset_button.clicked.connect(self.reset)
+
+#utils -----------------------------------------------------------------------------
+
+    @staticmethod
+    def _format_rate(hits: int, misses: int) -> str:
+        total = hits + misses
+        rate = hits / total * 100 if total else 0.0
+        return f'{rate:.0f}% ({hits}/{total})'
+
+    def refresh(self):
+        if not self.isVisible():
+            return
+
+        # Derniers spans
+        spans = tracing.recent_spans(self.MAX_SPANS)
+        self.spans_table.setRowCount(len(spans))
+        for row, (span_time, name, duration_ms, details) in enumerate(spans):
+            for column, text in enumerate((span_time, name, f'{duration_ms:.1f}', details)):
+                self.spans_table.setItem(row, column, QTableWidgetItem(text))
+
+        # Caches
+        listing_stats = listing_cache.stats()
+        self.caches_label.setText('\n'.join([
+            'Caches',
+            f"  listing : {self._format_rate(listing_stats['hits'], listing_stats['misses'])}, {listing_stats['directories']} dossiers",
+            f"  metadata : {self._format_rate(*tracing.hit_rate('metadata'))}",
+            f"  thumbnails : {self._format_rate(*tracing.hit_rate('thumbnail'))}",
+        ]))
+
+        # Files d'attente des workers
+        queue_lines = ['Workers']
+        queue_lines += [f'  {name} : {value}' for name, value in sorted(tracing.gauges().items())]
+        self.queues_label.setText('\n'.join(queue_lines))
+
+        # Blocages de l'interface
+        detector = self.stall_detector
+        last_stall = f'{detector.last_stall_ms:.0f} ms à {detector.last_stall_time}' if detector.last_stall_time else '-'
+        self.stalls_label.setText('\n'.join([
+            f'Interface (blocages > {detector.STALL_THRESHOLD_MS} ms)',
+            f'  nombre : {detector.stalls}',
+            f'  max : {detector.max_stall_ms:.0f} ms',
+            f'  dernier : {last_stall}',
+        ]))
+
+    def reset(self):
+        tracing.reset()
+        self.stall_detector.reset()
+        self.refresh()
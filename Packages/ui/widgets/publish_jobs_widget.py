@@ -0,0 +1,120 @@
+import os
+import time
+from PySide2.QtCore import QTimer, QSize
+from PySide2.QtGui import Qt, QColor
+from PySide2.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                               QTableWidget, QTableWidgetItem, QAbstractItemView, QHeaderView)
+from Packages.logic import publish_jobs
+from Packages.utils.job_queue import PENDING, RUNNING, DONE, FAILED
+
+
+class PublishJobsWidget(QWidget):
+    """État des traitements de publication (suppression des deux-points, miniatures, notifications...)"""
+
+    REFRESH_MS = 2000
+    # Les travaux terminés sont gardés un jour
+    KEEP_DONE_SECONDS = 24 * 3600
+
+    STATUS_COLORS = {PENDING: '#c9a227', RUNNING: '#3d8fd1', DONE: '#4caf50', FAILED: '#e05252'}
+
+    def __init__(self, parent=None) -> None:
+        super(PublishJobsWidget, self).__init__(parent)
+
+        self.queue = publish_jobs.get_queue()
+        self.queue.clear(older_than=self.KEEP_DONE_SECONDS)
+
+        self.create_widget()
+        self.create_layout()
+        self.create_connections()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(self.REFRESH_MS)
+        self.refresh()
+
+    def create_widget(self):
+        self.title_label = QLabel("Publish jobs")
+        self.title_label.setObjectName("section_label")
+        self.summary_label = QLabel()
+
+        self.jobs_table = QTableWidget(0, 5)
+        self.jobs_table.setHorizontalHeaderLabels(['Date', 'Job', 'File', 'Status', 'Error'])
+        self.jobs_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.jobs_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.jobs_table.verticalHeader().setVisible(False)
+        self.jobs_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.jobs_table.setMinimumSize(QSize(400, 150))
+
+        self.retry_button = QPushButton("Retry failed")
+        self.retry_button.setFocusPolicy(Qt.NoFocus)
+        self.clear_button = QPushButton("Clear finished")
+        self.clear_button.setFocusPolicy(Qt.NoFocus)
+
+    def create_layout(self):
+        self._main_layout = QVBoxLayout(self)
+        self._main_layout.setContentsMargins(0, 10, 0, 0)
+
+        header_layout = QHBoxLayout()
+        header_layout.addWidget(self.title_label)
+        header_layout.addWidget(self.summary_label)
+        header_layout.addStretch()
+        header_layout.addWidget(self.retry_button)
+        header_layout.addWidget(self.clear_button)
+
+        self._main_layout.addLayout(header_layout)
+        self._main_layout.addWidget(self.jobs_table)
+
+    def create_connections(self):
+        self.retry_button.clicked.connect(self.retry_failed)
+        self.clear_button.clicked.connect(self.clear_finished)
+
+#utils -----------------------------------------------------------------------------
+
+    @staticmethod
+    def _job_file(job: dict) -> str:
+        payload = job['payload']
+        path = payload.get('file_path') or payload.get('destination') or payload.get('file_name') or ''
+        return os.path.basename(path)
+
+    def refresh(self):
+        if not self.isVisible():
+            return
+
+        try:
+            jobs = self.queue.jobs()[::-1]
+        except OSError:
+            return
+
+        counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        self.jobs_table.setRowCount(len(jobs))
+        for row, job in enumerate(jobs):
+            counts[job['status']] = counts.get(job['status'], 0) + 1
+            status = job['status']
+            if status == PENDING and job['attempts']:
+                status = f"{status} ({job['attempts']}/{job['max_attempts']})"
+
+            texts = (time.strftime('%d/%m %H:%M', time.localtime(job['created'])), job['type'],
+                     self._job_file(job), status, job['error'])
+            for column, text in enumerate(texts):
+                item = QTableWidgetItem(text)
+                if column == 3:
+                    item.setForeground(QColor(self.STATUS_COLORS.get(job['status'], '#999999')))
+                if column == 4:
+                    item.setToolTip(job['error'])
+                self.jobs_table.setItem(row, column, item)
+
+        self.summary_label.setText(f"{counts[PENDING] + counts[RUNNING]} en cours, {counts[FAILED]} en échec")
+
+        # Travaux en attente sans worker (ex: logiciel fermé avant son lancement)
+        if counts[PENDING] and not self.queue.is_worker_running():
+            publish_jobs.start_worker()
+
+    def retry_failed(self):
+        for job in self.queue.jobs(FAILED):
+            self.queue.retry(job['id'])
+        publish_jobs.start_worker()
+        self.refresh()
+
+    def clear_finished(self):
+        self.queue.clear(statuses=(DONE, FAILED))
+        self.refresh()
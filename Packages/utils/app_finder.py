@@ -1,4 +1,7 @@
 import os
+import copy
+import json
+import concurrent.futures
 
 
 class AppFinder:
@@ -24,28 +27,137 @@ class AppFinder:
     }
     
     
-    def __init__(self) -> None:
-            
-        self.app_dict['blender']['path'] = self.find_blender()
-        self.app_dict['krita']['path'] = self.find_krita()
-        self.app_dict['houdini']['path'] = self.find_houdini()
-        self.app_dict['mari']['path'] = self.find_mari()
-        self.app_dict['maya']['path'] = self.find_maya()
-        self.app_dict['nuke']['path'] = self.find_nuke()
-        self.app_dict['photoshop']['path'] = self.find_photoshop()
-        self.app_dict['zbrush']['path'] = self.find_zbrush()
-        self.app_dict['unreal']['path'] = self.find_unreal()
-        self.app_dict['resolve']['path'] = self.find_resolve()
-        self.app_dict['mudbox']['path'] = self.find_mudbox()
-        self.app_dict['embergen']['path'] = self.find_embergen()
-        self.app_dict['substance_designer']['path'] = self.find_substance_designer()
-        self.app_dict['substance_painter']['path'] = self.find_substance_painter()
-        
-        self.app_dict['houdini']['pref'] = self.find_houdini_pref()
-        self.app_dict['mari']['pref'] = self.find_mari_pref()
-        self.app_dict['maya']['pref'] = self.find_maya_pref()
-        self.app_dict['nuke']['pref'] = self.find_nuke_pref()
-        
+    def __init__(self, cache_path: str = None) -> None:
+        """
+        Sans cache, toutes les applications sont recherchées.
+        Avec un fichier de cache, seuls les éditeurs dont l'empreinte (dates des dossiers d'installation) a changé sont recherchés à nouveau.
+        """
+
+        self.app_dict = copy.deepcopy(AppFinder.app_dict)
+        self.cache_path = cache_path
+        self.probed_vendors = []
+
+        cache_data = self._load_cache()
+        cache = cache_data.get('vendors', {})
+        # Dernières valeurs trouvées, pour reconnaître celles modifiées par l'utilisateur dans apps.json
+        self.previous_app_dict = cache_data.get('app_dict', {})
+        vendors = self.get_vendors()
+
+        fingerprints = {vendor: self.get_fingerprint(directories) for vendor, (directories, _) in vendors.items()}
+        to_probe = [vendor for vendor in vendors if cache.get(vendor, {}).get('fingerprint') != fingerprints[vendor]]
+
+        # Rechercher les éditeurs modifiés en parallèle
+        if to_probe:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(to_probe))) as executor:
+                results = dict(zip(to_probe, executor.map(lambda vendor: self.probe_vendor(vendors[vendor][1]), to_probe)))
+            for vendor, vendor_results in results.items():
+                cache[vendor] = {'fingerprint': fingerprints[vendor], 'results': vendor_results}
+            self.probed_vendors = to_probe
+
+        for vendor in vendors:
+            for app, keys in cache[vendor]['results'].items():
+                self.app_dict.setdefault(app, {'path': None, 'pref': None}).update(keys)
+
+        if to_probe:
+            self._save_cache(cache)
+    
+    
+    def get_vendors(self) -> dict:
+        """éditeur -> (dossiers dont la date sert d'empreinte, [(application, clé, fonction de recherche)])"""
+        documents_path = os.path.join(os.path.expanduser("~"), 'Documents')
+        adobe_dir = os.path.join(self.PROGRAM_FILES, 'Adobe')
+
+        return {
+            'blender': ([os.path.join(self.PROGRAM_FILES, 'Blender Foundation')], [('blender', 'path', self.find_blender)]),
+            'krita': ([os.path.join(self.PROGRAM_FILES, 'Krita (x64)')], [('krita', 'path', self.find_krita)]),
+            'sidefx': ([os.path.join(self.PROGRAM_FILES, 'Side Effects Software')], [('houdini', 'path', self.find_houdini)]),
+            'foundry': ([self.PROGRAM_FILES], [('mari', 'path', self.find_mari), ('nuke', 'path', self.find_nuke)]),
+            'autodesk': ([os.path.join(self.PROGRAM_FILES, 'Autodesk')], [('maya', 'path', self.find_maya), ('mudbox', 'path', self.find_mudbox)]),
+            'adobe': (
+                [adobe_dir, os.path.join(adobe_dir, 'Adobe Substance 3D Designer'), os.path.join(adobe_dir, 'Adobe Substance 3D Painter')],
+                [('photoshop', 'path', self.find_photoshop), ('substance_designer', 'path', self.find_substance_designer), ('substance_painter', 'path', self.find_substance_painter)]
+            ),
+            'pixologic': ([self.PROGRAM_FILES], [('zbrush', 'path', self.find_zbrush)]),
+            'epic': ([os.path.join(self.PROGRAM_FILES, 'Epic Games')], [('unreal', 'path', self.find_unreal)]),
+            'blackmagic': ([os.path.join(self.PROGRAM_FILES, 'Blackmagic Design')], [('resolve', 'path', self.find_resolve)]),
+            'jangafx': ([os.path.join(self.PROGRAM_FILES, 'JangaFX')], [('embergen', 'path', self.find_embergen)]),
+            'prefs': (
+                [documents_path, os.path.expanduser("~")],
+                [('houdini', 'pref', self.find_houdini_pref), ('mari', 'pref', self.find_mari_pref), ('maya', 'pref', self.find_maya_pref), ('nuke', 'pref', self.find_nuke_pref)]
+            ),
+        }
+    
+    
+    @staticmethod
+    def get_fingerprint(directories: list) -> list:
+        """Dates de modification des dossiers (None si le dossier n'existe pas)"""
+        fingerprint = []
+        for directory in directories:
+            try:
+                fingerprint.append(os.stat(directory).st_mtime)
+            except OSError:
+                fingerprint.append(None)
+        return fingerprint
+    
+    
+    @staticmethod
+    def probe_vendor(probes: list) -> dict:
+        results = {}
+        for app, key, find_function in probes:
+            results.setdefault(app, {})[key] = find_function()
+        return results
+    
+    
+    def _load_cache(self) -> dict:
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+    
+    
+    def _save_cache(self, cache: dict):
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as file:
+                json.dump({'vendors': cache, 'app_dict': self.app_dict}, file, indent=4, ensure_ascii=False)
+        except OSError as e:
+            print(f"Impossible d'écrire le cache des applications: {e}")
+    
+    
+    def update_apps_json(self, apps_json_path: str) -> bool:
+        """
+        Fusionne les applications trouvées avec apps.json, qui n'est réécrit que s'il change.
+        Une valeur d'apps.json différente de la précédente valeur trouvée a été modifiée par l'utilisateur :
+        elle est gardée tant que le chemin existe.
+        """
+
+        try:
+            with open(apps_json_path, 'r', encoding='utf-8') as file:
+                current = json.load(file)
+        except (OSError, ValueError):
+            current = {}
+
+        merged = copy.deepcopy(current)
+
+        for app, keys in self.app_dict.items():
+            merged_keys = merged.setdefault(app, {})
+            for key, found_value in keys.items():
+                user_value = current.get(app, {}).get(key)
+                previous_value = self.previous_app_dict.get(app, {}).get(key)
+                is_override = user_value and user_value != previous_value and os.path.exists(user_value)
+                merged_keys[key] = user_value if is_override else found_value
+
+        if merged == current:
+            return False
+
+        with open(apps_json_path, 'w', encoding='utf-8') as file:
+            json.dump(merged, file, indent=4, ensure_ascii=False)
+        return True
+    
     
     def find_directory(self, parent_directory: str, directory_string: str, return_type: str = 'str', exclude_strings = []):
         try:
@@ -35,6 +35,7 @@ STYLE_PATH = os.path.join(PROJECT_FILES_PATH, "Styles")
 DARK_STYLE = os.path.join(STYLE_PATH, 'dark.css')
 
 WORKSPACE_MEL_PATH = os.path.join(PROJECT_FILES_PATH, "Workspaces", "workspace.mel")
+LAYOUTS_PATH = os.path.join(PROJECT_FILES_PATH, "Templates", "layouts.json")
 
 PIPEZER_APP_ICON_PATH = os.path.join(ROOT_PATH, 'pipezer_app_icon.py')
 QRC_PATH = os.path.join(ROOT_PATH, 'ressources.qrc')
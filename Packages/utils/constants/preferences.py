@@ -38,6 +38,9 @@ CURRENT_PROJECT_JSON_PATH = os.path.join(USER_PREFS, 'current_project.json')
 RECENT_FILES_JSON_PATH = os.path.join(USER_PREFS, 'recent_files.json')
 UI_PREFS_JSON_PATH = os.path.join(USER_PREFS, 'ui_prefs.json')
 VERSION_JSON_PATH = os.path.join(USER_PREFS, 'version.json')
+CRASH_FILES_JSON_PATH = os.path.join(USER_PREFS, 'crash_files.json')
+APP_FINDER_CACHE_JSON_PATH = os.path.join(USER_PREFS, 'app_finder_cache.json')
+PUBLISH_JOBS_PATH = os.path.join(USER_PREFS, 'jobs')
 
 CURRENT_PROJECT = get_current_value(json_file=CURRENT_PROJECT_JSON_PATH, key='current_project', fail_return='str')
 RECENT_FILES = get_current_value(json_file=RECENT_FILES_JSON_PATH, key='recent_files', fail_return='str')
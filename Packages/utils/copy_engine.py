@@ -0,0 +1,326 @@
+"""
+Copie de fichiers volumineux (scènes .ma/.hip de plusieurs Go, souvent sur le réseau).
+
+La copie passe par le chemin le plus rapide disponible :
+    1. reflink (clone copy-on-write, Linux btrfs/xfs) : instantané, aucune donnée copiée
+    2. os.copy_file_range puis os.sendfile : copie dans le noyau, sans passer par Python
+    3. lecture / écriture avec un grand tampon
+
+Le fichier est écrit sous un nom temporaire puis renommé : une version à moitié
+copiée n'apparaît jamais dans les listings. La progression est signalée et la
+copie peut être annulée entre deux blocs.
+
+Les templates (scènes vides des nouveaux assets et shots) peuvent être instanciés
+sans copier de données (mode 'lazy', sur demande) : clone reflink, sinon lien physique
+vers une copie du template mise en cache dans le projet, en lecture seule. Jamais vers
+le template installé : une écriture sur place ne peut pas le modifier. Un lien physique
+est remplacé par une vraie copie à la première ouverture (materialize_file, appelé par
+FileOpener) s'il pointe vers le cache de templates du projet ; les autres liens physiques
+(NAS, caches) ne sont jamais touchés.
+"""
+
+import os
+import sys
+import stat
+import shutil
+import threading
+from Packages.utils import tracing
+
+
+# Suffixe des copies en cours (ignorées par les listings)
+TEMP_SUFFIX = '.pipezer_part'
+
+CHUNK_SIZE = 64 * 1024 * 1024
+BUFFER_SIZE = 8 * 1024 * 1024
+
+# ioctl FICLONE (linux/fs.h)
+_FICLONE = 0x40049409
+
+
+class CopyCancelled(Exception):
+    pass
+
+
+def temp_path_for(destination: str) -> str:
+    directory, name = os.path.split(destination)
+    return os.path.join(directory, f'.{name}{TEMP_SUFFIX}')
+
+
+def is_temp_file(file_name: str) -> bool:
+    return file_name.endswith(TEMP_SUFFIX)
+
+
+def _reflink(source_fd: int, destination_fd: int) -> bool:
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        import fcntl
+        fcntl.ioctl(destination_fd, _FICLONE, source_fd)
+        return True
+    except (ImportError, OSError):
+        return False
+
+
+def _copy_chunks(source_fd, destination_fd, size, progress, cancelled):
+    """Copie par blocs, retourne la méthode utilisée"""
+    copied = 0
+
+    def step(length):
+        nonlocal copied
+        copied += length
+        if progress is not None:
+            progress(copied, size)
+        if cancelled is not None and cancelled():
+            raise CopyCancelled()
+
+    # Copie dans le noyau (copy_file_range, puis sendfile qui accepte un fichier en sortie sous Linux)
+    for method in ('copy_file_range', 'sendfile'):
+        kernel_copy = getattr(os, method, None)
+        if kernel_copy is None or (method == 'sendfile' and not sys.platform.startswith('linux')):
+            continue
+        try:
+            while copied < size:
+                if method == 'copy_file_range':
+                    length = kernel_copy(source_fd, destination_fd, min(CHUNK_SIZE, size - copied))
+                else:
+                    length = kernel_copy(destination_fd, source_fd, copied, min(CHUNK_SIZE, size - copied))
+                if length == 0:
+                    # Certains noyaux / systèmes de fichiers renvoient 0 avant la fin : méthode suivante
+                    break
+                step(length)
+            if copied == size:
+                return method
+        except OSError:
+            # Non supporté par ce système de fichiers (ex: partage réseau)
+            pass
+        # Les blocs déjà copiés sont conservés
+        os.lseek(source_fd, copied, os.SEEK_SET)
+        os.lseek(destination_fd, copied, os.SEEK_SET)
+
+    buffer = bytearray(BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(source_fd, 'rb', buffering=0, closefd=False) as source, \
+            open(destination_fd, 'wb', buffering=0, closefd=False) as destination:
+        source.seek(copied)
+        destination.seek(copied)
+        while True:
+            length = source.readinto(buffer)
+            if not length:
+                break
+            destination.write(view[:length])
+            step(length)
+    return 'buffer'
+
+
+def _publish(temp_path: str, destination: str, overwrite: bool):
+    """Renomme la copie terminée (atomique), sans écraser un fichier apparu entre temps sauf si overwrite"""
+    if overwrite:
+        os.replace(temp_path, destination)
+        return
+
+    if os.name == 'nt':
+        # os.rename échoue si la destination existe
+        os.rename(temp_path, destination)
+        return
+
+    try:
+        os.link(temp_path, destination)
+    except FileExistsError:
+        raise
+    except OSError:
+        # Liens physiques non supportés (ex: partage SMB)
+        if os.path.exists(destination):
+            raise FileExistsError(destination)
+        os.rename(temp_path, destination)
+    else:
+        os.unlink(temp_path)
+
+
+def copy_file(source: str, destination: str, progress=None, cancelled=None,
+              overwrite: bool = False, preserve_stat: bool = False) -> str:
+    """
+    Copie source vers destination et retourne destination.
+
+    Args:
+    - progress (callable, optional): appelé avec (octets copiés, taille totale).
+    - cancelled (callable, optional): retourne True pour annuler la copie (CopyCancelled).
+    - overwrite (bool): remplacer la destination si elle existe (FileExistsError sinon).
+    - preserve_stat (bool): conserver les dates en plus des permissions (comme shutil.copy2).
+    """
+    if os.path.isdir(destination):
+        destination = os.path.join(destination, os.path.basename(source))
+    if not overwrite and os.path.exists(destination):
+        raise FileExistsError(destination)
+
+    temp_path = temp_path_for(destination)
+
+    with tracing.span('copy.file', source=source) as copy_span:
+        try:
+            with open(source, 'rb') as source_file, open(temp_path, 'wb') as destination_file:
+                source_fd = source_file.fileno()
+                destination_fd = destination_file.fileno()
+                size = os.fstat(source_fd).st_size
+
+                if size and _reflink(source_fd, destination_fd):
+                    method = 'reflink'
+                    if progress is not None:
+                        progress(size, size)
+                else:
+                    method = _copy_chunks(source_fd, destination_fd, size, progress, cancelled)
+                copy_span.set(method=method, size=size)
+
+            if preserve_stat:
+                shutil.copystat(source, temp_path)
+            else:
+                shutil.copymode(source, temp_path)
+
+            _publish(temp_path, destination, overwrite)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    return destination
+
+
+#templates ------------------------------------------------------------------------
+
+TEMPLATE_MODES = ('copy', 'lazy')
+
+_template_cache_lock = threading.Lock()
+
+# Copies en cache partagées par les scènes liées : toute écriture sur place doit échouer
+CACHED_TEMPLATE_MODE = 0o444
+
+# Cache des templates d'un projet, relatif à la racine du projet
+TEMPLATE_CACHE_FOLDER = os.path.join('.pipezer_data', 'templates')
+
+
+def template_cache_directory(project_path: str) -> str:
+    return os.path.join(project_path, TEMPLATE_CACHE_FOLDER)
+
+
+def _find_template_cache(file_path: str):
+    """Cache de templates du projet qui contient file_path (premier parent qui en a un), ou None"""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    while True:
+        cache_directory = template_cache_directory(directory)
+        if os.path.isdir(cache_directory):
+            return cache_directory
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def clone_file(source: str, destination: str, overwrite: bool = False) -> bool:
+    """Clone reflink uniquement (aucune donnée copiée), retourne False si le système de fichiers ne le permet pas"""
+    if not sys.platform.startswith('linux'):
+        return False
+    if not overwrite and os.path.exists(destination):
+        raise FileExistsError(destination)
+
+    temp_path = temp_path_for(destination)
+    try:
+        with open(source, 'rb') as source_file, open(temp_path, 'wb') as destination_file:
+            cloned = _reflink(source_file.fileno(), destination_file.fileno())
+        if cloned:
+            shutil.copymode(source, temp_path)
+            _publish(temp_path, destination, overwrite)
+            return True
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    os.remove(temp_path)
+    return False
+
+
+def link_file(source: str, destination: str, overwrite: bool = False) -> bool:
+    """Lien physique vers source, retourne False si impossible (autre volume, système de fichiers, Windows)"""
+    if os.name == 'nt':
+        # Un fichier en lecture seule ne peut pas être remplacé par materialize_file
+        return False
+    temp_path = temp_path_for(destination)
+    try:
+        os.link(source, temp_path)
+    except (OSError, NotImplementedError):
+        return False
+    try:
+        _publish(temp_path, destination, overwrite)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return True
+
+
+def _cached_template(source: str, cache_directory: str) -> str:
+    """Copie en lecture seule du template dans cache_directory (une fois par version du template)"""
+    source_stat = os.stat(source)
+    name, extension = os.path.splitext(os.path.basename(source))
+    cache_path = os.path.join(cache_directory, f'{name}_{source_stat.st_size}_{int(source_stat.st_mtime)}{extension}')
+
+    with _template_cache_lock:
+        if not os.path.exists(cache_path):
+            os.makedirs(cache_directory, exist_ok=True)
+            copy_file(source, cache_path, overwrite=True)
+            os.chmod(cache_path, CACHED_TEMPLATE_MODE)
+    return cache_path
+
+
+def instantiate_template(source: str, destination: str, mode: str = 'copy', overwrite: bool = False,
+                         cache_directory: str = None) -> str:
+    """
+    Crée destination à partir du template source et retourne la méthode utilisée :
+    'copy' (copie normale, reflink si possible) ou, en mode 'lazy', 'reflink' puis 'hardlink'
+    (vers la copie en lecture seule du template dans cache_directory), sinon 'copy'.
+    """
+    if mode == 'lazy':
+        with tracing.span('copy.template', source=source) as template_span:
+            if clone_file(source, destination, overwrite):
+                method = 'reflink'
+            elif cache_directory and link_file(_cached_template(source, cache_directory), destination, overwrite):
+                method = 'hardlink'
+            else:
+                method = None
+            template_span.set(method=method or 'copy')
+        if method:
+            return method
+
+    copy_file(source, destination, overwrite=overwrite)
+    return 'copy'
+
+
+def is_linked_file(file_path: str) -> bool:
+    """Lien physique vers une copie du cache de templates du projet (template instancié en mode 'lazy')"""
+    try:
+        file_stat = os.stat(file_path)
+        if file_stat.st_nlink < 2:
+            return False
+
+        cache_directory = _find_template_cache(file_path)
+        if cache_directory is None:
+            return False
+        with os.scandir(cache_directory) as entries:
+            return any(os.path.samestat(os.stat(entry.path), file_stat) for entry in entries if entry.is_file())
+    except OSError:
+        return False
+
+
+def materialize_file(file_path: str) -> bool:
+    """
+    Remplace un lien physique par sa propre copie avant ouverture, pour qu'une sauvegarde
+    ne modifie jamais le template. Retourne True si le fichier a été copié.
+    """
+    if not is_linked_file(file_path):
+        return False
+    with tracing.span('copy.materialize', path=file_path):
+        copy_file(file_path, file_path, overwrite=True, preserve_stat=True)
+        # La copie reprend le mode lecture seule du cache
+        os.chmod(file_path, stat.S_IMODE(os.stat(file_path).st_mode) | stat.S_IWUSR)
+    return True
@@ -0,0 +1,306 @@
+"""
+Création de dossiers et copies de fichiers en masse (assets, shots...), calculée
+d'abord puis exécutée par un pool de threads borné.
+
+Sur un partage réseau chaque mkdir/copie coûte surtout de la latence : les
+opérations indépendantes sont lancées en parallèle. Les dossiers sont créés
+niveau par niveau (un parent est toujours créé avant ses enfants), avec un seul
+os.mkdir par dossier.
+
+En mode transactionnel, la première erreur arrête le plan et tout ce qui a été
+créé est supprimé (fichiers copiés, puis dossiers créés, du plus profond au plus
+haut) : rien de ce qui existait avant n'est touché.
+
+Exemple :
+    plan = FileSystemPlan()
+    plan.add_directory(asset_path, owner='chr_hero')
+    plan.add_copy(template_path, scene_path, owner='chr_hero')
+    result = plan.execute()
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from Packages.utils import tracing
+from Packages.utils.copy_engine import instantiate_template
+from Packages.utils.listing_cache import is_network_path
+from Packages.utils.logger import init_logger
+
+
+logger = init_logger(__file__)
+
+LOCAL_WORKERS = 8
+# Beaucoup plus de requêtes en vol sur le réseau : le temps est passé à attendre le serveur
+NETWORK_WORKERS = 32
+
+NETWORK_FILE_SYSTEMS = ('nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'fuse.sshfs', 'afpfs')
+
+
+def is_remote_file_system(path: str) -> bool:
+    """Chemin UNC, lecteur réseau Windows ou montage réseau Linux"""
+    if is_network_path(path):
+        return True
+    path = os.path.abspath(path)
+
+    if os.name == 'nt':
+        try:
+            import ctypes
+            drive = os.path.splitdrive(path)[0] + '\\'
+            return ctypes.windll.kernel32.GetDriveTypeW(drive) == 4  # DRIVE_REMOTE
+        except (ImportError, AttributeError, OSError):
+            return False
+
+    try:
+        with open('/proc/mounts', 'r') as file:
+            mounts = [line.split()[1:3] for line in file]
+    except OSError:
+        return False
+
+    best_mount, best_type = '', ''
+    for mount_point, file_system in mounts:
+        if (path == mount_point or path.startswith(mount_point.rstrip('/') + '/')) and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, file_system
+    return best_type in NETWORK_FILE_SYSTEMS
+
+
+def default_workers(path: str) -> int:
+    return NETWORK_WORKERS if is_remote_file_system(path) else LOCAL_WORKERS
+
+
+class FileSystemPlan:
+    """Dossiers à créer et fichiers à copier, chacun rattaché à un propriétaire (asset, shot...)"""
+
+    def __init__(self):
+        # Dictionnaires : ordre d'ajout conservé et doublons ignorés
+        self.directories = {}  # chemin: propriétaire
+        self.copies = {}  # destination: (source, propriétaire)
+        # Copies des templates : 'copy', ou 'lazy' (reflink / lien physique, voir copy_engine.instantiate_template)
+        self.template_mode = 'copy'
+        # Copies des templates sur le volume du projet, pour les liens physiques
+        self.template_cache = None
+
+    def __len__(self):
+        return len(self.directories) + len(self.copies)
+
+    def add_directory(self, path: str, owner: str = None):
+        """Ajoute un dossier, et ses parents intermédiaires s'il est sous un dossier déjà prévu (ex: 'usd/anim')"""
+        path = os.path.normpath(path)
+        chain = [path]
+        parent = os.path.dirname(path)
+        while parent not in self.directories and os.path.dirname(parent) != parent:
+            chain.append(parent)
+            parent = os.path.dirname(parent)
+        if parent not in self.directories:
+            chain = [path]
+
+        for directory in reversed(chain):
+            self.directories.setdefault(directory, owner)
+
+    def add_copy(self, source: str, destination: str, owner: str = None):
+        destination = os.path.normpath(destination)
+        self.add_directory(os.path.dirname(destination), owner)
+        self.copies[destination] = (source, owner)
+
+    def directory_levels(self) -> list:
+        """Dossiers groupés par profondeur : chaque groupe peut être créé en parallèle"""
+        levels = {}
+        for path in self.directories:
+            levels.setdefault(path.count(os.sep), []).append(path)
+        return [levels[depth] for depth in sorted(levels)]
+
+    def owners(self) -> list:
+        owners = dict.fromkeys(owner for owner in self.directories.values() if owner is not None)
+        owners.update(dict.fromkeys(owner for _, owner in self.copies.values() if owner is not None))
+        return list(owners)
+
+    #diff ---------------------------------------------------------------------------
+
+    def missing(self, max_workers: int = None):
+        """
+        Plan réduit à ce qui n'existe pas encore sur le disque : retourne (plan, stats).
+        Un dossier est listé une seule fois (os.scandir) et seulement si son parent existe :
+        sous un dossier manquant, tout est manquant sans aucun accès disque. Un niveau de
+        profondeur = un lot de listings en parallèle.
+        """
+        if max_workers is None:
+            max_workers = default_workers(next(iter(self.directories), os.getcwd()))
+
+        listings = {}  # dossier: noms existants
+        missing_directories = set()
+
+        def list_names(directory):
+            try:
+                return directory, {entry.name for entry in os.scandir(directory)}
+            except (FileNotFoundError, NotADirectoryError):
+                return directory, None
+
+        def scan(directories, executor):
+            to_scan = [directory for directory in dict.fromkeys(directories)
+                       if directory not in listings and directory not in missing_directories]
+            for directory, names in executor.map(list_names, to_scan):
+                listings[directory] = names
+
+        def exists(path):
+            parent = os.path.dirname(path)
+            if parent in missing_directories or listings.get(parent) is None:
+                return False
+            return os.path.basename(path) in listings[parent]
+
+        with tracing.span('fs_plan.missing', directories=len(self.directories), copies=len(self.copies)), \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for level in self.directory_levels():
+                scan([os.path.dirname(path) for path in level], executor)
+                for path in level:
+                    if not exists(path):
+                        missing_directories.add(path)
+
+            scan([os.path.dirname(destination) for destination in self.copies], executor)
+
+        plan = FileSystemPlan()
+        plan.template_mode = self.template_mode
+        plan.template_cache = self.template_cache
+        for path, owner in self.directories.items():
+            if path in missing_directories:
+                plan.directories[path] = owner
+        for destination, (source, owner) in self.copies.items():
+            if not exists(destination):
+                plan.copies[destination] = (source, owner)
+
+        stats = {'existing': len(self) - len(plan), 'missing': len(plan), 'scans': len(listings)}
+        return plan, stats
+
+    #execution ----------------------------------------------------------------------
+
+    @staticmethod
+    def _make_directory(path: str) -> list:
+        """Retourne les dossiers créés : [] si le dossier existait déjà, ses parents absents (hors du plan) compris"""
+        try:
+            os.mkdir(path)
+            return [path]
+        except FileExistsError:
+            return []
+        except FileNotFoundError:
+            pass
+
+        # Parent absent et hors du plan : chaque dossier créé est gardé pour l'annulation
+        parents = []
+        parent = os.path.dirname(path)
+        while not os.path.isdir(parent) and os.path.dirname(parent) != parent:
+            parents.append(parent)
+            parent = os.path.dirname(parent)
+
+        created = []
+        for directory in list(reversed(parents)) + [path]:
+            try:
+                os.mkdir(directory)
+                created.append(directory)
+            except FileExistsError:
+                pass
+        return created
+
+    @staticmethod
+    def rollback(directories: list, copies: list) -> list:
+        """Supprime les fichiers copiés puis les dossiers créés (vides), retourne ce qui n'a pas pu l'être"""
+        remaining = []
+        for path in copies:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                remaining.append(path)
+
+        for path in sorted(directories, key=lambda path: path.count(os.sep), reverse=True):
+            try:
+                # rmdir seulement : un dossier où quelqu'un a ajouté un fichier entre-temps est gardé
+                os.rmdir(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                remaining.append(path)
+
+        if remaining:
+            logger.warning(f'Rollback incomplete, {len(remaining)} path(s) kept: {remaining[:10]}')
+        return remaining
+
+    def execute(self, max_workers: int = None, progress=None, transactional: bool = False) -> dict:
+        """
+        Crée les dossiers puis copie les fichiers.
+        progress(fait, total) est appelé après chaque opération (depuis les threads du pool).
+        transactional : arrêt à la première erreur et suppression de tout ce qui a été créé ;
+        les fichiers existants ne sont jamais écrasés.
+        Retourne {'directories': [créés], 'copies': [copiés], 'errors': {chemin: message},
+                  'failed_owners': [...], 'copy_methods': {méthode: nombre}, 'rolled_back': bool, 'seconds'}.
+        """
+        total = len(self)
+        if max_workers is None:
+            first_path = next(iter(self.directories), None) or next(iter(self.copies), os.getcwd())
+            max_workers = default_workers(first_path)
+
+        created, copied, errors = [], [], {}
+        methods = {}
+        failed_owners = {}
+        done = 0
+        start = time.perf_counter()
+
+        def report(path, owner, error):
+            errors[path] = f'{type(error).__name__}: {error}'
+            if owner is not None:
+                failed_owners[owner] = None
+
+        def step():
+            nonlocal done
+            done += 1
+            if progress is not None:
+                progress(done, total)
+
+        with tracing.span('fs_plan.execute', directories=len(self.directories), copies=len(self.copies),
+                          workers=max_workers), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for level in self.directory_levels():
+                futures = [(path, executor.submit(self._make_directory, path)) for path in level]
+                for path, future in futures:
+                    try:
+                        created.extend(future.result())
+                    except OSError as e:
+                        report(path, self.directories[path], e)
+                    step()
+                if transactional and errors:
+                    break
+
+            overwrite = not transactional
+            copies = [] if transactional and errors else self.copies.items()
+            futures = [(destination, source, owner,
+                        executor.submit(instantiate_template, source, destination, self.template_mode,
+                                        overwrite, self.template_cache))
+                       for destination, (source, owner) in copies]
+            for index, (destination, source, owner, future) in enumerate(futures):
+                if future.cancelled():
+                    continue
+                try:
+                    method = future.result()
+                    methods[method] = methods.get(method, 0) + 1
+                    copied.append(destination)
+                except OSError as e:
+                    report(destination, owner, e)
+                    if transactional:
+                        for *_, pending in futures[index + 1:]:
+                            pending.cancel()
+                step()
+
+            rolled_back = transactional and bool(errors)
+            if rolled_back:
+                logger.warning(f'{len(errors)} error(s), rolling back {len(created)} folder(s) and {len(copied)} file(s)')
+                self.rollback(created, copied)
+
+        seconds = time.perf_counter() - start
+        logger.info(f'{len(created)} folder(s) and {len(copied)} file(s) created in {seconds:.2f} s '
+                    f'({max_workers} workers, {len(errors)} error(s), {methods})')
+        return {
+            'directories': created,
+            'copies': copied,
+            'errors': errors,
+            'failed_owners': list(failed_owners),
+            'copy_methods': methods,
+            'rolled_back': rolled_back,
+            'seconds': seconds,
+        }
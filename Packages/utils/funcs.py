@@ -141,6 +141,13 @@ def format_size(size_bytes):
 
 def get_size(path):
     
+    from Packages.utils.listing_cache import listing_cache
+
+    # Taille du cache de listings si le dossier a déjà été listé
+    entry = listing_cache.get_entry(path)
+    if entry is not None and not entry.is_dir:
+        return format_size(entry.size)
+
     return format_size(os.path.getsize(path))
 
 def add_text_to_line_edit(line_edit_name,text):
@@ -148,20 +155,13 @@ def add_text_to_line_edit(line_edit_name,text):
 
 def set_style_sheet(window,style,palette_path):
 
-    palette = read_json_file(palette_path)
-    style_path = style 
+    from Packages.utils.theme_engine import theme_engine
 
-    with open(style_path, "r") as file:
-        style_sheet = file.read()
-    style_sheet = style_sheet.replace("MAIN_COLOR", palette["MAIN_COLOR"])
-    style_sheet = style_sheet.replace("SECONDARY_COLOR", palette["SECONDARY_COLOR"])
-    style_sheet = style_sheet.replace("TERTEARY_COLOR", palette["TERTEARY_COLOR"])
-    style_sheet = style_sheet.replace("CUTE_COLOR", palette["CUTE_COLOR"])
-    style_sheet = style_sheet.replace("COLOR_4", palette["COLOR_4"])
-    style_sheet = style_sheet.replace("BORDER_SIZE", palette["BORDER_SIZE"])
-    style_sheet = style_sheet.replace("BORDER_RADIUS", palette["BORDER_RADIUS"])
+    # Compilé une seule fois (palette + template), puis réutilisé
+    style_sheet = theme_engine.compile_file(style, palette_path)
 
-    window.setStyleSheet(style_sheet)
+    if window.styleSheet() != style_sheet:
+        window.setStyleSheet(style_sheet)
 
 def read_json_file(json_file_path):
     """This function read a json file and return all his variables"""
@@ -0,0 +1,96 @@
+"""
+Registre des icônes de PipeZer : le dossier ProjectFiles/Icons est lu une seule
+fois et les QIcon sont partagés entre tous les widgets.
+"""
+
+import os
+from PySide2.QtGui import QIcon
+from Packages.utils.constants.project_files import ICON_PATH
+
+
+# Nom du logiciel ('<nom>[_bw]') -> fichier réel, pour les icônes qui ne suivent pas la convention '<nom>[_bw]_icon.ico'
+ALIASES = {
+    'resolve': 'DaVinci_Resolve_Studio.png',
+    'krita': 'krita-seeklogo.png',
+    'mudbox': 'autodesk-mudbox.png',
+    'embergen': '673677416f5ca83f2530cc7d_embergen-icon.png',
+    'mari_bw': 'mari_bw_logo.ico',
+}
+
+
+class IconRegistry:
+    """Gestionnaire des icônes (chemins et QIcon en cache)"""
+
+    def __init__(self, icon_dir=ICON_PATH):
+        self.icon_dir = icon_dir
+        self._files = None
+        self._stems = None
+        self._icons = {}
+
+    def _scan(self):
+        """Liste le dossier d'icônes une seule fois"""
+        self._files = {}
+        self._stems = {}
+
+        try:
+            file_names = os.listdir(self.icon_dir)
+        except OSError as e:
+            print(f"Impossible de lire le dossier d'icônes {self.icon_dir}: {e}")
+            file_names = []
+
+        for file_name in sorted(file_names):
+            file_path = os.path.join(self.icon_dir, file_name)
+            self._files[self._normalize(file_name)] = file_path
+            self._stems.setdefault(self._normalize(os.path.splitext(file_name)[0]), file_path)
+
+        for alias, file_name in ALIASES.items():
+            file_path = self._files.get(self._normalize(file_name))
+            if file_path:
+                self._stems.setdefault(self._normalize(alias), file_path)
+
+    @staticmethod
+    def _normalize(name):
+        return name.lower().replace('-', '_').replace(' ', '_')
+
+    def refresh(self):
+        """Relit le dossier d'icônes et vide le cache"""
+        self._files = None
+        self._stems = None
+        self._icons.clear()
+
+    def get_path(self, name):
+        """Retourne le chemin de l'icône ('maya_icon.ico', 'maya_icon' ou un alias), ou None"""
+        if not name:
+            return None
+        if self._files is None:
+            self._scan()
+
+        if os.path.splitext(name)[-1]:
+            return self._files.get(self._normalize(name))
+
+        return self._stems.get(self._normalize(name))
+
+    def has_icon(self, name):
+        return self.get_path(name) is not None
+
+    def get_icon(self, name):
+        """Retourne le QIcon partagé correspondant au nom, ou None s'il n'existe pas"""
+        file_path = self.get_path(name)
+        if file_path is None:
+            return None
+
+        icon = self._icons.get(file_path)
+        if icon is None:
+            icon = QIcon(file_path)
+            self._icons[file_path] = icon
+        return icon
+
+    def get_app_icon(self, text, bw: bool = False):
+        """Icône '<text>[_bw]_icon' d'un logiciel ou d'un département, sinon l'alias '<text>[_bw]'"""
+        bw_dict = {True: '_bw', False: ''}
+        name = f'{self._normalize(text)}{bw_dict[bw]}'
+        return self.get_icon(f'{name}_icon') or self.get_icon(name)
+
+
+# Instance globale du registre d'icônes
+icon_registry = IconRegistry()
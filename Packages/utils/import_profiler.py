@@ -0,0 +1,124 @@
+"""
+Mesure du temps d'import des modules de PipeZer (équivalent de python -X importtime).
+
+Usage :
+    python -m Packages.utils.import_profiler Packages.ui.base_main_window
+    python -m Packages.utils.import_profiler Packages.ui.base_main_window --budget --report import_report.json
+
+Avec --budget (en ms, IMPORT_BUDGET_MS si aucune valeur), le code de retour est 1
+si le temps d'import total du module dépasse le budget ou si un module de
+HEAVY_MODULES est importé au démarrage : à lancer avant une release pour repérer
+les imports lourds. Le même contrôle est fait par tests/test_import_profiler.py.
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+
+
+PIPEZER_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_MODULE = 'Packages.ui.base_main_window'
+
+# Temps d'import maximum de DEFAULT_MODULE (ms)
+IMPORT_BUDGET_MS = 1500
+
+# Modules à n'importer qu'au moment de s'en servir
+HEAVY_MODULES = ('PIL', 'requests', 'numpy', 'urllib3')
+
+# import time: self [us] | cumulative | imported package
+_IMPORT_TIME_PATTERN = re.compile(r'^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)')
+
+
+def parse_import_times(output: str) -> list:
+    """Retourne [{'module', 'self_ms', 'cumulative_ms', 'depth'}] à partir de la sortie de -X importtime"""
+    entries = []
+    for line in output.splitlines():
+        match = _IMPORT_TIME_PATTERN.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        entries.append({
+            'module': module,
+            'self_ms': int(self_us) / 1000,
+            'cumulative_ms': int(cumulative_us) / 1000,
+            'depth': (len(indent) - 1) // 2,
+        })
+    return entries
+
+
+def profile_import(module: str) -> dict:
+    """Importe un module dans un nouvel interpréteur et retourne le rapport des temps d'import"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [PIPEZER_ROOT, env.get('PYTHONPATH')]))
+
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PIPEZER_ROOT, env=env, capture_output=True, text=True
+    )
+    if process.returncode != 0:
+        errors = [line for line in process.stderr.splitlines() if not line.startswith('import time:')]
+        raise RuntimeError(f"Import of {module} failed:\n" + '\n'.join(errors[-20:]))
+
+    entries = parse_import_times(process.stderr)
+    total = next((entry['cumulative_ms'] for entry in entries if entry['module'] == module), 0.0)
+
+    return {
+        'module': module,
+        'python': sys.version.split()[0],
+        'total_ms': total,
+        'modules': sorted(entries, key=lambda entry: entry['self_ms'], reverse=True),
+    }
+
+
+def eager_heavy_imports(report: dict, heavy_modules=HEAVY_MODULES) -> list:
+    """Modules lourds (ou leurs sous-modules) importés par le module profilé"""
+    return sorted({
+        entry['module'] for entry in report['modules']
+        if entry['module'].split('.')[0] in heavy_modules
+    })
+
+
+def format_report(report: dict, top: int = 25) -> str:
+    lines = [f"{report['module']}: {report['total_ms']:.1f} ms ({len(report['modules'])} modules)", '']
+    lines.append(f"{'self ms':>10} {'cumul ms':>10}  module")
+    for entry in report['modules'][:top]:
+        lines.append(f"{entry['self_ms']:>10.1f} {entry['cumulative_ms']:>10.1f}  {entry['module']}")
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Temps d'import d'un module de PipeZer")
+    parser.add_argument('module', nargs='?', default=DEFAULT_MODULE)
+    parser.add_argument('--budget', type=float, nargs='?', const=IMPORT_BUDGET_MS, default=None,
+                        help=f"Temps d'import maximum en ms ({IMPORT_BUDGET_MS} si aucune valeur)")
+    parser.add_argument('--report', default=None, help='Fichier JSON où écrire le rapport complet')
+    parser.add_argument('--top', type=int, default=25, help='Nombre de modules affichés')
+    args = parser.parse_args(argv)
+
+    report = profile_import(args.module)
+    print(format_report(report, args.top))
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=4)
+
+    if args.budget is None:
+        return 0
+
+    exceeded = False
+    if report['total_ms'] > args.budget:
+        print(f"\nImport budget exceeded: {report['total_ms']:.1f} ms > {args.budget:.1f} ms")
+        exceeded = True
+    heavy = eager_heavy_imports(report)
+    if heavy:
+        print(f"\nHeavy modules imported eagerly: {', '.join(heavy)}")
+        exceeded = True
+    return 1 if exceeded else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+File d'attente de travaux persistante sur disque, partagée entre processus
+(Maya, Houdini, l'application standalone et le worker).
+
+Chaque travail est un fichier JSON dans le dossier de la file, réécrit de façon
+atomique à chaque changement d'état :
+    pending -> running -> done
+                       -> pending (nouvel essai après un délai) -> ... -> failed
+
+Un seul worker traite la file à la fois (verrou de fichier libéré par le système
+si le worker meurt). Les travaux restés 'running' après un plantage sont relancés.
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+from Packages.utils.logger import init_logger
+
+
+logger = init_logger(__file__)
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+WORKER_LOCK_NAME = 'worker.lock'
+
+
+class JobQueue:
+    """File de travaux stockée dans un dossier"""
+
+    MAX_ATTEMPTS = 3
+    RETRY_DELAY = 10.0  # secondes, doublé à chaque essai
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(self.path, exist_ok=True)
+
+    def _job_path(self, job_id: str) -> str:
+        return os.path.join(self.path, f'{job_id}.json')
+
+    def _write(self, job: dict):
+        job['updated'] = time.time()
+        temp_path = f"{self._job_path(job['id'])}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(job, file, indent=4)
+        os.replace(temp_path, self._job_path(job['id']))
+
+    def _read(self, job_id: str):
+        try:
+            with open(self._job_path(job_id), 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def submit(self, job_type: str, payload: dict, max_attempts: int = None) -> str:
+        """Ajoute un travail et retourne son identifiant"""
+        now = time.time()
+        job = {
+            'id': f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}",
+            'type': job_type,
+            'payload': payload,
+            'status': PENDING,
+            'attempts': 0,
+            'max_attempts': max_attempts or self.MAX_ATTEMPTS,
+            'created': now,
+            'next_run': now,
+            'host': socket.gethostname(),
+            'error': '',
+        }
+        self._write(job)
+        logger.info(f"Job {job['id']} submitted ({job_type})")
+        return job['id']
+
+    def get(self, job_id: str):
+        return self._read(job_id)
+
+    def jobs(self, status: str = None) -> list:
+        """Travaux du plus ancien au plus récent"""
+        jobs = []
+        for file_name in os.listdir(self.path):
+            if not file_name.endswith('.json'):
+                continue
+            job = self._read(file_name[:-len('.json')])
+            if job is not None and (status is None or job['status'] == status):
+                jobs.append(job)
+        return sorted(jobs, key=lambda job: job['created'])
+
+    def counts(self) -> dict:
+        counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        for job in self.jobs():
+            counts[job['status']] = counts.get(job['status'], 0) + 1
+        return counts
+
+    def next_job(self):
+        """Prochain travail à lancer (en attente et dont le délai est passé), ou None"""
+        now = time.time()
+        for job in self.jobs(PENDING):
+            if job['next_run'] <= now:
+                return job
+        return None
+
+    def start(self, job: dict):
+        job['status'] = RUNNING
+        job['attempts'] += 1
+        job['started'] = time.time()
+        self._write(job)
+
+    def finish(self, job: dict, error: str = None):
+        """Termine un travail : réussi, ou relancé plus tard tant qu'il reste des essais"""
+        if error is None:
+            job['status'] = DONE
+            job['error'] = ''
+        elif job['attempts'] < job['max_attempts']:
+            job['status'] = PENDING
+            job['error'] = error
+            job['next_run'] = time.time() + self.RETRY_DELAY * 2 ** (job['attempts'] - 1)
+            logger.warning(f"Job {job['id']} failed (attempt {job['attempts']}/{job['max_attempts']}): {error}")
+        else:
+            job['status'] = FAILED
+            job['error'] = error
+            logger.error(f"Job {job['id']} failed: {error}")
+        self._write(job)
+
+    def retry(self, job_id: str) -> bool:
+        """Relance un travail en échec"""
+        job = self._read(job_id)
+        if job is None or job['status'] != FAILED:
+            return False
+        job.update(status=PENDING, attempts=0, next_run=time.time(), error='')
+        self._write(job)
+        return True
+
+    def requeue_interrupted(self) -> int:
+        """Remet en attente les travaux 'running' (worker arrêté pendant le traitement)"""
+        jobs = self.jobs(RUNNING)
+        for job in jobs:
+            job['status'] = PENDING
+            self._write(job)
+        return len(jobs)
+
+    def clear(self, older_than: float = 0.0, statuses=(DONE,)) -> int:
+        """Supprime les travaux terminés depuis plus de older_than secondes"""
+        limit = time.time() - older_than
+        removed = 0
+        for job in self.jobs():
+            if job['status'] in statuses and job['updated'] <= limit:
+                try:
+                    os.remove(self._job_path(job['id']))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    #worker -------------------------------------------------------------------------
+
+    def acquire_worker_lock(self):
+        """Verrou exclusif du worker : retourne le fichier verrouillé (à garder ouvert), ou None s'il est déjà pris"""
+        lock_file = open(os.path.join(self.path, WORKER_LOCK_NAME), 'a+')
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return None
+        return lock_file
+
+    def is_worker_running(self) -> bool:
+        lock_file = self.acquire_worker_lock()
+        if lock_file is None:
+            return True
+        lock_file.close()
+        return False
+
+    def run_worker(self, handlers: dict, idle_timeout: float = 60.0, poll_interval: float = 1.0) -> int:
+        """
+        Traite la file jusqu'à ce qu'elle reste vide pendant idle_timeout secondes.
+        handlers : {type de travail: fonction(payload)}. Retourne le nombre de travaux traités.
+        """
+        processed = 0
+        while True:
+            lock_file = self.acquire_worker_lock()
+            if lock_file is None:
+                if not processed:
+                    logger.info('A worker is already running')
+                return processed
+
+            try:
+                processed += self._work(handlers, idle_timeout, poll_interval)
+            finally:
+                lock_file.close()
+
+            # Un travail déposé pendant le dernier tour a vu le verrou pris et n'a lancé
+            # aucun worker : on le reprend au lieu de le laisser en attente
+            if self.next_job() is None:
+                return processed
+
+    def _work(self, handlers: dict, idle_timeout: float, poll_interval: float) -> int:
+        """Boucle du worker (verrou déjà pris)"""
+        processed = 0
+        requeued = self.requeue_interrupted()
+        if requeued:
+            logger.warning(f'{requeued} interrupted job(s) requeued')
+
+        idle_since = time.monotonic()
+        while time.monotonic() - idle_since < idle_timeout:
+            job = self.next_job()
+            if job is None:
+                if self.jobs(PENDING):
+                    # Nouvel essai programmé : le worker l'attend
+                    idle_since = time.monotonic()
+                time.sleep(poll_interval)
+                continue
+
+            self.start(job)
+            start = time.perf_counter()
+            handler = handlers.get(job['type'])
+            try:
+                if handler is None:
+                    raise ValueError(f"Unknown job type: {job['type']}")
+                handler(job['payload'])
+            except Exception as e:
+                self.finish(job, f'{type(e).__name__}: {e}')
+            else:
+                self.finish(job)
+                logger.info(f"Job {job['id']} ({job['type']}) done in {time.perf_counter() - start:.2f} s")
+
+            processed += 1
+            idle_since = time.monotonic()
+
+        return processed
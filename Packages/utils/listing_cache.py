@@ -0,0 +1,195 @@
+"""
+Cache des listings de dossiers (noms, types, stat) partagé par tout le processus.
+
+Les dossiers locaux sont invalidés par l'interface (QFileSystemWatcher, voir
+Packages/ui/directory_loader.py). Les dossiers sans watcher (chemins réseau, et
+tous les dossiers dans Maya / Houdini) sont revalidés après TTL secondes : le
+dossier n'est relu que si sa date de modification a changé. cached() ne touche
+jamais au disque : le navigateur affiche le listing en cache et fait la
+revalidation en arrière-plan.
+
+Ce qui calcule un nom de version passe fresh=True : le dossier est toujours relu.
+"""
+
+import os
+import time
+import threading
+from collections import namedtuple
+from Packages.utils import tracing
+
+
+ListingEntry = namedtuple('ListingEntry', ['name', 'is_dir', 'size', 'mtime'])
+
+
+def is_network_path(path: str) -> bool:
+    """Chemin UNC (\\\\serveur\\partage ou //serveur/partage)"""
+    return str(path).startswith(('\\\\', '//'))
+
+
+def scan_directory(directory: str) -> tuple:
+    """Liste un dossier : retourne (mtime du dossier, entrées triées par nom)"""
+    with tracing.span('listing.scan', directory=directory) as scan_span:
+        dir_mtime = os.stat(directory).st_mtime
+        entries = []
+
+        # scandir donne le type (et le stat sous Windows) sans appel réseau par élément
+        with os.scandir(directory) as items:
+            for item in items:
+                try:
+                    if item.is_dir():
+                        entries.append(ListingEntry(item.name, True, 0, 0.0))
+                    elif item.is_file():
+                        item_stat = item.stat()
+                        entries.append(ListingEntry(item.name, False, item_stat.st_size, item_stat.st_mtime))
+                except OSError:
+                    continue
+        scan_span.set(entries=len(entries))
+
+    entries.sort(key=lambda entry: entry.name)
+    return dir_mtime, entries
+
+
+class ListingCache:
+    """Cache des listings de dossiers"""
+
+    TTL = 10.0
+    MAX_DIRECTORIES = 2048
+
+    def __init__(self):
+        self._listings = {}
+        self._watched = set()
+        self._lock = threading.Lock()
+
+        # Installé par l'interface : appelé avec le chemin d'un dossier local à surveiller
+        self.watch_handler = None
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.relists = 0
+
+    @staticmethod
+    def _key(directory: str) -> str:
+        return os.path.normcase(os.path.normpath(directory))
+
+    def list_directory(self, directory: str, fresh: bool = False) -> list:
+        """
+        Retourne les entrées d'un dossier, depuis le cache si possible (OSError si illisible).
+        fresh : relit le dossier dans tous les cas (ex: calcul de la version suivante).
+        """
+        key = self._key(directory)
+
+        with self._lock:
+            cached = None if fresh else self._listings.get(key)
+            if cached is not None:
+                self.hits += 1
+                tracing.count('listing.hits')
+                expired = key not in self._watched and time.monotonic() - cached[1] > self.TTL
+            else:
+                self.misses += 1
+                tracing.count('listing.misses')
+
+        if cached is not None:
+            if expired:
+                return self._revalidate(directory, key)
+            return cached[2]
+
+        dir_mtime, entries = scan_directory(directory)
+        self._store(key, dir_mtime, entries)
+        self._request_watch(directory)
+        return entries
+
+    def cached(self, directory: str):
+        """Entrées en cache d'un dossier (même expirées) sans accès disque, ou None"""
+        with self._lock:
+            cached = self._listings.get(self._key(directory))
+            if cached is None:
+                return None
+            self.hits += 1
+            tracing.count('listing.hits')
+            return cached[2]
+
+    def expired(self, directory: str) -> bool:
+        """Le listing en cache d'un dossier sans watcher a plus de TTL secondes (à revalider)"""
+        key = self._key(directory)
+        with self._lock:
+            cached = self._listings.get(key)
+            return cached is not None and key not in self._watched and time.monotonic() - cached[1] > self.TTL
+
+    def get_entry(self, file_path: str):
+        """Entrée en cache d'un fichier (taille, date) si son dossier a été listé il y a moins de TTL secondes, sinon None"""
+        parent_key = self._key(os.path.dirname(file_path))
+        name = os.path.basename(file_path)
+
+        with self._lock:
+            cached = self._listings.get(parent_key)
+        # Un fichier modifié sur place ne change ni le dossier ni son watcher : taille et date
+        # ne sont fiables que juste après le listing
+        if cached is None or time.monotonic() - cached[4] > self.TTL:
+            return None
+
+        return cached[3].get(name)
+
+    def invalidate(self, directory: str = None):
+        """Oublie le listing d'un dossier, ou de tous les dossiers"""
+        with self._lock:
+            if directory is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(self._key(directory), None)
+
+    def mark_watched(self, directory: str, watched: bool = True):
+        """Un dossier surveillé reste valide jusqu'à son invalidation"""
+        with self._lock:
+            if watched:
+                self._watched.add(self._key(directory))
+            else:
+                self._watched.discard(self._key(directory))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidations': self.revalidations,
+                'relists': self.relists,
+                'directories': len(self._listings),
+                'watched': len(self._watched),
+            }
+
+    def _store(self, key, dir_mtime, entries):
+        with self._lock:
+            if key not in self._listings and len(self._listings) >= self.MAX_DIRECTORIES:
+                self._listings.pop(next(iter(self._listings)))
+            now = time.monotonic()
+            # [mtime du dossier, date de validation, entrées, entrées par nom, date du listing]
+            self._listings[key] = [dir_mtime, now, entries, {entry.name: entry for entry in entries}, now]
+
+    def _request_watch(self, directory):
+        if self.watch_handler is not None and not is_network_path(directory):
+            self.watch_handler(directory)
+
+    def _revalidate(self, directory, key) -> list:
+        """Relit le dossier seulement si sa date de modification a changé"""
+        try:
+            dir_mtime = os.stat(directory).st_mtime
+            with self._lock:
+                cached = self._listings.get(key)
+                if cached is not None and cached[0] == dir_mtime:
+                    cached[1] = time.monotonic()
+                    self.revalidations += 1
+                    return cached[2]
+
+            dir_mtime, entries = scan_directory(directory)
+        except OSError:
+            self.invalidate(directory)
+            raise
+
+        self._store(key, dir_mtime, entries)
+        with self._lock:
+            self.relists += 1
+        return entries
+
+
+# Instance globale du cache de listings
+listing_cache = ListingCache()
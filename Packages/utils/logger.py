@@ -1,24 +1,138 @@
 import datetime
 import logging
+import logging.handlers
+import atexit
+import json
 import os
+import queue
 import sys
-from Packages.utils.constants.preferences import LOGS_PATH
+import threading
+from Packages.utils.constants.preferences import LOGS_PATH, UI_PREFS_JSON_PATH
 date = str(datetime.date.today()).replace("-", "_")
 
+# Rotation du fichier de log du jour
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_FORMAT = "[%(asctime)s][%(name)s][%(levelname)s] %(message)s"
+
+
+class _LoggerLevelFilter(logging.Filter):
+    """Niveau d'écriture de chaque logger dans un fichier partagé : {nom du logger: niveau}"""
+
+    def __init__(self):
+        super().__init__()
+        self.levels = {}
+
+    def filter(self, record):
+        level = self.levels.get(record.name)
+        return level is not None and record.levelno >= level
+
+
+class _LogQueue:
+    """
+    File d'attente partagée par tous les loggers de PipeZer.
+    Les loggers ne font que déposer les messages (QueueHandler) : l'écriture dans
+    la console et dans le fichier (qui peut être sur un profil réseau) est faite
+    par le thread du QueueListener, jamais par le thread de l'interface.
+    """
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._file_handlers = {}
+        self._listener = None
+
+        self.queue_handler = logging.handlers.QueueHandler(self._queue)
+
+        self.stream_handler = logging.StreamHandler(sys.stderr)
+        self.stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    def start(self):
+        with self._lock:
+            if self._listener is not None:
+                return
+            handlers = (self.stream_handler, *self._file_handlers.values())
+            self._listener = logging.handlers.QueueListener(self._queue, *handlers, respect_handler_level=True)
+            self._listener.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Écrit les messages en attente et arrête le thread d'écriture"""
+        with self._lock:
+            listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+
+    def add_file(self, path: str, logger_name: str, level: int, file_format: str):
+        """
+        Fichier de log partagé (un seul handler par fichier, avec rotation par taille).
+        Le niveau est celui du logger qui s'enregistre, pas celui du handler.
+        """
+        path = os.path.normcase(os.path.abspath(path))
+        with self._lock:
+            file_handler = self._file_handlers.get(path)
+            if file_handler is not None:
+                file_handler.filters[0].levels[logger_name] = level
+                return
+            file_handler = logging.handlers.RotatingFileHandler(
+                path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8', delay=True
+            )
+            level_filter = _LoggerLevelFilter()
+            level_filter.levels[logger_name] = level
+            file_handler.addFilter(level_filter)
+            file_handler.setFormatter(logging.Formatter(file_format))
+            self._file_handlers[path] = file_handler
+
+            # Lu par le thread d'écriture à chaque message : le remplacement du tuple est atomique
+            if self._listener is not None:
+                self._listener.handlers = self._listener.handlers + (file_handler,)
+
+
+# Instance globale de la file d'attente des logs
+log_queue = _LogQueue()
+
+
+_log_levels = None
+
+
+def get_log_levels() -> dict:
+    """
+    Niveaux par module de la clé "log_levels" de ui_prefs.json, ex :
+        "log_levels": {"default": "INFO", "tracing.py": "DEBUG"}
+    """
+    global _log_levels
+    if _log_levels is None:
+        try:
+            with open(UI_PREFS_JSON_PATH, 'r') as file:
+                _log_levels = json.load(file).get('log_levels') or {}
+        except (OSError, ValueError, AttributeError):
+            _log_levels = {}
+    return _log_levels
+
+
+def reload_log_levels():
+    """Relit ui_prefs.json et applique les niveaux aux loggers existants"""
+    global _log_levels
+    _log_levels = None
+    for name in list(Logger.LOGGERS):
+        logging.getLogger(name).setLevel(Logger.configured_level(name, Logger.LOGGERS[name]))
+
 
 class Logger:
 
+    # Loggers créés par PipeZer : {nom: niveau par défaut}
+    LOGGERS = {}
 
     def __init__(self, 
                  logger_name = "Logger name", 
-                 format_default = "[%(asctime)s][%(name)s][%(levelname)s] %(message)s",
-                 file_format_default = "[%(asctime)s][%(name)s][%(levelname)s] %(message)s",
+                 format_default = LOG_FORMAT,
+                 file_format_default = LOG_FORMAT,
                  level_default = logging.DEBUG,
                  level_write_default = logging.WARNING,
                  propagate_default = False
     ):
         
-        self.LOGGER_NAME = logger_name if '\\' not in logger_name else os.path.basename(logger_name)
+        self.LOGGER_NAME = os.path.basename(logger_name.replace('\\', '/'))
         self.FORMAT_DEFAULT = format_default
         self.FILE_FORMAT_DEFAULT = file_format_default
         self.LEVEL_DEFAULT = level_default
@@ -29,18 +143,28 @@ class Logger:
         self.init_logger()
 
 
+    @staticmethod
+    def configured_level(name: str, default: int) -> int:
+        log_levels = get_log_levels()
+        level = log_levels.get(name, log_levels.get(os.path.splitext(name)[0], log_levels.get('default')))
+        if level is None:
+            return default
+        if isinstance(level, str):
+            level = logging.getLevelName(level.upper())
+        return level if isinstance(level, int) else default
+
+
     def init_logger(self):
         if self.logger_exists():
             self._logger = logging.getLogger(self.LOGGER_NAME)
         else:
             self._logger = logging.getLogger(self.LOGGER_NAME)
-            self._logger.setLevel(self.LEVEL_DEFAULT)
+            self._logger.setLevel(self.configured_level(self.LOGGER_NAME, self.LEVEL_DEFAULT))
             self._logger.propagate = self.PROPAGATE_DEFAULT
+            Logger.LOGGERS[self.LOGGER_NAME] = self.LEVEL_DEFAULT
 
-            formatter = logging.Formatter(self.FORMAT_DEFAULT)
-            handler = logging.StreamHandler(sys.stderr)
-            handler.setFormatter(formatter)
-            self._logger.addHandler(handler)
+            log_queue.start()
+            self._logger.addHandler(log_queue.queue_handler)
 
 
     def logger_exists(self):
@@ -86,13 +210,7 @@ class Logger:
     def write_to_file(self, path, level=None):
         if level is None:
             level = self.LEVEL_WRITE_DEFAULT
-        file_handler = logging.FileHandler(path)
-        file_handler.setLevel(level)
-
-        formatter = logging.Formatter(self.FILE_FORMAT_DEFAULT)
-        file_handler.setFormatter(formatter)
-
-        self._logger.addHandler(file_handler)
+        log_queue.add_file(path, self.LOGGER_NAME, level, self.FILE_FORMAT_DEFAULT)
 
 
 def init_logger(file_name: str):
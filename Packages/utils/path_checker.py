@@ -0,0 +1,160 @@
+"""
+Vérification groupée de l'existence de fichiers, pensée pour les partages réseau.
+
+Les chemins sont regroupés par racine de partage : chaque racine est testée une
+seule fois, puis les fichiers des racines joignables sont vérifiés en parallèle
+avec un timeout par appel. Une racine injoignable est marquée comme telle et ses
+fichiers ne sont pas testés un par un. Les résultats négatifs sont gardés en
+cache quelques secondes.
+"""
+
+import os
+import time
+import threading
+import concurrent.futures
+
+
+STATUS_OK = 'ok'
+STATUS_MISSING = 'missing'
+STATUS_UNREACHABLE = 'unreachable'
+STATUS_TIMEOUT = 'timeout'
+
+
+def get_share_root(path: str) -> str:
+    """
+    Racine de partage d'un chemin.
+
+    Exemple :
+    get_share_root('//server/projects/film/shot.ma') -> '//server/projects'
+    get_share_root('Z:/film/shot.ma') -> 'Z:/'
+    """
+
+    path = path.replace('\\', '/')
+
+    if path.startswith('//'):
+        parts = path[2:].split('/')[:-1]
+        return '//' + '/'.join(parts[:2])
+
+    drive, _ = os.path.splitdrive(path)
+    if drive:
+        return f'{drive}/'
+
+    parts = [part for part in path.split('/')[:-1] if part]
+    return '/' + '/'.join(parts[:2]) if parts else '/'
+
+
+class PathChecker:
+    """Vérifie l'existence d'une liste de fichiers sans bloquer sur un serveur tombé"""
+
+    ROOT_TIMEOUT = 2.0
+    CALL_TIMEOUT = 2.0
+    NEGATIVE_TTL = 30.0
+    MAX_WORKERS = 8
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._missing = {}
+        self._unreachable_roots = {}
+
+    def _is_cached(self, cache: dict, key: str) -> bool:
+        with self._lock:
+            expiry = cache.get(key)
+            if expiry is None:
+                return False
+            if expiry < time.monotonic():
+                del cache[key]
+                return False
+            return True
+
+    def _cache(self, cache: dict, key: str):
+        with self._lock:
+            cache[key] = time.monotonic() + self.NEGATIVE_TTL
+
+    def unreachable_roots(self) -> list:
+        with self._lock:
+            now = time.monotonic()
+            return [root for root, expiry in self._unreachable_roots.items() if expiry >= now]
+
+    def forget(self, path: str):
+        """Oublie un résultat négatif (fichier qui vient d'être créé ou renommé)"""
+        with self._lock:
+            self._missing.pop(path, None)
+            self._unreachable_roots.pop(get_share_root(path), None)
+
+    def clear_cache(self):
+        with self._lock:
+            self._missing.clear()
+            self._unreachable_roots.clear()
+
+    def iter_check(self, paths: list, cancelled=None):
+        """
+        Génère (chemin, existe, statut) dans l'ordre de la liste, dès que chaque résultat est connu.
+        'cancelled' est une fonction optionnelle qui arrête la vérification si elle renvoie True.
+        """
+
+        roots = {}
+        for path in paths:
+            roots.setdefault(get_share_root(path), []).append(path)
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix='path_checker')
+        try:
+            # 1 - Tester chaque racine une seule fois, toutes en même temps
+            root_futures = {
+                root: executor.submit(os.path.isdir, root)
+                for root in roots
+                if not self._is_cached(self._unreachable_roots, root)
+            }
+            deadline = time.monotonic() + self.ROOT_TIMEOUT
+            for root, future in root_futures.items():
+                try:
+                    reachable = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except concurrent.futures.TimeoutError:
+                    reachable = False
+                if not reachable:
+                    print(f"Partage injoignable : {root}")
+                    self._cache(self._unreachable_roots, root)
+
+            # 2 - Vérifier les fichiers des racines joignables en parallèle
+            file_futures = {}
+            for root, root_paths in roots.items():
+                if self._is_cached(self._unreachable_roots, root):
+                    continue
+                for path in root_paths:
+                    if not self._is_cached(self._missing, path):
+                        file_futures[path] = executor.submit(os.path.isfile, path)
+
+            # 3 - Rendre les résultats dans l'ordre d'origine
+            for path in paths:
+                if cancelled is not None and cancelled():
+                    return
+
+                root = get_share_root(path)
+                if self._is_cached(self._unreachable_roots, root):
+                    yield path, False, STATUS_UNREACHABLE
+                    continue
+
+                future = file_futures.get(path)
+                if future is None:
+                    yield path, False, STATUS_MISSING
+                    continue
+
+                try:
+                    exists = future.result(timeout=self.CALL_TIMEOUT)
+                except concurrent.futures.TimeoutError:
+                    # Le serveur ne répond plus : ne pas attendre les autres fichiers de ce partage
+                    print(f"Partage trop lent, marqué injoignable : {root}")
+                    self._cache(self._unreachable_roots, root)
+                    yield path, False, STATUS_TIMEOUT
+                    continue
+
+                if not exists:
+                    self._cache(self._missing, path)
+                yield path, exists, STATUS_OK if exists else STATUS_MISSING
+
+        finally:
+            # Ne pas attendre les appels réseau bloqués
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Instance globale du vérificateur de chemins
+path_checker = PathChecker()
@@ -0,0 +1,105 @@
+"""
+Exécution d'un graphe de tâches (ex: démarrage de PipeZer).
+
+Chaque tâche déclare les tâches dont elle dépend : les tâches indépendantes
+tournent en parallèle, et la durée de chacune est mesurée et loggée.
+"""
+
+import time
+import concurrent.futures
+from Packages.utils.logger import init_logger
+
+
+logger = init_logger(__file__)
+
+
+class TaskGraph:
+    """Graphe de tâches exécutées sur un pool de threads"""
+
+    def __init__(self, name: str, max_workers: int = 4):
+        self.name = name
+        self.max_workers = max_workers
+        self._tasks = {}
+
+        self.timings = {}
+        self.failed = set()
+        self.skipped = set()
+
+    def add(self, name: str, func, depends=()):
+        """Ajoute une tâche, lancée quand toutes ses dépendances sont terminées"""
+        if name in self._tasks:
+            raise ValueError(f'Task already declared: {name}')
+        self._tasks[name] = (func, tuple(depends))
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def _check(self):
+        for name, (_, depends) in self._tasks.items():
+            for dependency in depends:
+                if dependency not in self._tasks:
+                    raise ValueError(f'Task {name} depends on unknown task {dependency}')
+
+    def _timed(self, name, func):
+        start = time.perf_counter()
+        try:
+            func()
+        finally:
+            self.timings[name] = time.perf_counter() - start
+
+    def run(self, on_task_done=None) -> float:
+        """
+        Exécute le graphe et retourne la durée totale en secondes.
+        on_task_done(nombre de tâches terminées, nombre total, nom de la tâche) est appelé après chaque tâche.
+        Si une tâche échoue, les tâches qui en dépendent ne sont pas lancées.
+        """
+
+        self._check()
+        self.timings.clear()
+        self.failed.clear()
+        self.skipped.clear()
+
+        start = time.perf_counter()
+        remaining = dict(self._tasks)
+        done = set()
+        running = {}
+        total = len(self._tasks)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name) as executor:
+            while remaining or running:
+                skipped_count = len(self.skipped)
+                for name, (func, depends) in list(remaining.items()):
+                    if any(dependency in self.failed or dependency in self.skipped for dependency in depends):
+                        del remaining[name]
+                        self.skipped.add(name)
+                        logger.warning(f'{self.name}: task {name} skipped (dependency failed)')
+                        if on_task_done:
+                            on_task_done(len(done) + len(self.failed) + len(self.skipped), total, name)
+                    elif all(dependency in done for dependency in depends):
+                        del remaining[name]
+                        running[executor.submit(self._timed, name, func)] = name
+
+                if not running:
+                    if len(self.skipped) != skipped_count:
+                        continue
+                    if remaining:
+                        raise ValueError(f'{self.name}: dependency cycle between {", ".join(remaining)}')
+                    break
+
+                finished, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        done.add(name)
+                    else:
+                        self.failed.add(name)
+                        logger.error(f'{self.name}: task {name} failed: {error}')
+
+                    if on_task_done:
+                        on_task_done(len(done) + len(self.failed) + len(self.skipped), total, name)
+
+        total_time = time.perf_counter() - start
+        details = ', '.join(f'{name} {duration * 1000:.0f} ms' for name, duration in self.timings.items())
+        logger.info(f'{self.name}: {total_time * 1000:.0f} ms ({details})')
+        return total_time
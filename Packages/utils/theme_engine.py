@@ -0,0 +1,166 @@
+"""
+Moteur de thème de PipeZer : les feuilles de style des widgets sont compilées
+une seule fois en une feuille de style globale appliquée à la QApplication.
+
+Dans un logiciel hôte (Maya, Houdini...) la QApplication n'est pas à PipeZer :
+chaque section est appliquée sur la racine de son widget, jamais sur l'application.
+"""
+
+import os
+import re
+import json
+import time
+from PySide2.QtCore import QTimer
+from PySide2.QtWidgets import QApplication
+from Packages.utils.logger import init_logger
+
+
+logger = init_logger(__file__)
+
+_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.S)
+_RULE_PATTERN = re.compile(r'([^{}]+)\{([^{}]*)\}')
+
+
+def scope_stylesheet(stylesheet: str, scope: str, root_type: str = None) -> str:
+    """
+    Préfixe chaque sélecteur par l'objectName du widget pour qu'une feuille
+    de style de widget puisse être appliquée au niveau de l'application.
+
+    Exemple :
+    scope_stylesheet('QDialog { } QLabel#title { }', 'ModernCreateShotDialog', 'QDialog')
+    -> 'QDialog#ModernCreateShotDialog { } #ModernCreateShotDialog QLabel#title { }'
+    """
+
+    stylesheet = _COMMENT_PATTERN.sub('', stylesheet)
+    rules = []
+
+    for selectors, body in _RULE_PATTERN.findall(stylesheet):
+        scoped_selectors = []
+        for selector in selectors.split(','):
+            selector = selector.strip()
+            if not selector:
+                continue
+
+            # Règle qui vise le widget lui-même (ex: 'QDialog', 'QTableWidget::item')
+            is_root = (
+                root_type
+                and selector.startswith(root_type)
+                and (len(selector) == len(root_type) or not (selector[len(root_type)].isalnum() or selector[len(root_type)] == '_'))
+            )
+            if is_root:
+                scoped_selectors.append(f'{root_type}#{scope}{selector[len(root_type):]}')
+            else:
+                scoped_selectors.append(f'#{scope} {selector}')
+
+        rules.append(f"{', '.join(scoped_selectors)} {{{body.rstrip()}\n}}")
+
+    return '\n'.join(rules)
+
+
+class ThemeEngine:
+    """Gestionnaire de la feuille de style globale"""
+
+    def __init__(self):
+        # True uniquement dans PipeZerApp : ailleurs l'application appartient au logiciel hôte
+        self.standalone = False
+        self._sections = {}
+        self._scoped_cache = {}
+        self._file_cache = {}
+        self._compiled = None
+        self._base_stylesheet = None
+        self._apply_pending = False
+
+    def compile_file(self, style_path: str, palette_path: str) -> str:
+        """Remplace les couleurs de la palette dans un fichier .qss, en une passe et avec cache"""
+        key = (style_path, palette_path)
+        mtimes = (os.path.getmtime(style_path), os.path.getmtime(palette_path))
+
+        cached = self._file_cache.get(key)
+        if cached and cached[0] == mtimes:
+            return cached[1]
+
+        with open(palette_path, 'r') as json_file:
+            palette = json.load(json_file)
+
+        with open(style_path, 'r') as file:
+            style_sheet = file.read()
+
+        if palette:
+            # Les clés les plus longues d'abord pour éviter les remplacements partiels
+            pattern = re.compile('|'.join(re.escape(k) for k in sorted(palette, key=len, reverse=True)))
+            style_sheet = pattern.sub(lambda match: palette[match.group(0)], style_sheet)
+
+        self._file_cache[key] = (mtimes, style_sheet)
+        return style_sheet
+
+    def set_section(self, name: str, stylesheet: str, scope: str, root_type: str = None, widget=None):
+        """
+        Enregistre (ou remplace) la partie de la feuille de style globale d'un widget.
+        scope est l'objectName du widget (donné à widget s'il n'en a pas).
+        Dans un logiciel hôte, la section est appliquée sur widget uniquement.
+        Si rien n'a changé, il n'y a aucun re-polish.
+        """
+
+        cache_key = (stylesheet, scope, root_type)
+        compiled = self._scoped_cache.get(cache_key)
+        if compiled is None:
+            compiled = scope_stylesheet(stylesheet, scope, root_type)
+            self._scoped_cache[cache_key] = compiled
+
+        if widget is not None:
+            if not widget.objectName():
+                widget.setObjectName(scope)
+            elif widget.objectName() != scope:
+                logger.warning(f"Theme section '{name}' is scoped to #{scope} but the widget is #{widget.objectName()}")
+
+        if not self.standalone:
+            if widget is not None and widget.styleSheet() != compiled:
+                widget.setStyleSheet(compiled)
+            return
+
+        if self._sections.get(name) == compiled:
+            return
+
+        self._sections[name] = compiled
+        self._compiled = None
+        self._schedule_apply()
+
+    def stylesheet(self) -> str:
+        """Feuille de style globale compilée"""
+        if self._compiled is None:
+            self._compiled = '\n\n'.join(self._sections.values())
+        return self._compiled
+
+    def _schedule_apply(self):
+        """Regroupe les changements de plusieurs widgets en un seul re-polish"""
+        if self._apply_pending:
+            return
+        self._apply_pending = True
+        QTimer.singleShot(0, self.apply)
+
+    def apply(self):
+        """Applique la feuille de style globale à l'application si elle a changé (PipeZerApp uniquement)"""
+        self._apply_pending = False
+
+        app = QApplication.instance()
+        if app is None or not self.standalone:
+            return
+
+        # Conserver une éventuelle feuille de style déjà en place sur l'application
+        if self._base_stylesheet is None:
+            self._base_stylesheet = app.styleSheet()
+
+        style_sheet = self.stylesheet()
+        if self._base_stylesheet:
+            style_sheet = f'{self._base_stylesheet}\n\n{style_sheet}'
+
+        if app.styleSheet() == style_sheet:
+            return
+
+        start = time.perf_counter()
+        app.setStyleSheet(style_sheet)
+        logger.debug(f'Stylesheet applied in {(time.perf_counter() - start) * 1000:.1f} ms ({len(self._sections)} sections)')
+
+
+# Instance globale du moteur de thème
+theme_engine = ThemeEngine()
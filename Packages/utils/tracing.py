@@ -0,0 +1,215 @@
+"""
+Traces légères : spans (durées), compteurs et histogrammes.
+
+Désactivé par défaut, un span ne coûte alors qu'un appel de fonction.
+Activation avec la variable d'environnement PIPEZER_TRACE=1 ou set_enabled(True)
+(mode développeur). Quand c'est activé, chaque span est écrit par le logger au
+niveau debug et les mesures sont consultables avec snapshot().
+
+Exemple :
+    with tracing.span('search.scan', directory=project_folder):
+        ...
+    tracing.count('table.rows')
+"""
+
+import os
+import time
+import threading
+import functools
+from collections import deque
+from datetime import datetime
+from Packages.utils.logger import init_logger
+
+
+logger = init_logger(__file__)
+
+_lock = threading.Lock()
+_enabled = os.environ.get('PIPEZER_TRACE', '') not in ('', '0')
+_counters = {}
+_histograms = {}
+_gauges = {}
+
+# Derniers spans terminés (pour le panneau de performances du mode développeur)
+RECENT_SPANS = 200
+_recent_spans = deque(maxlen=RECENT_SPANS)
+
+
+class Histogram:
+    """Distribution d'une mesure, sur les SAMPLES dernières valeurs pour les percentiles"""
+
+    SAMPLES = 512
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.samples = deque(maxlen=self.SAMPLES)
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.samples.append(value)
+
+    def percentile(self, percent: float) -> float:
+        if not self.samples:
+            return 0.0
+        values = sorted(self.samples)
+        return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+    def summary(self) -> dict:
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else 0.0,
+            'min': self.min or 0.0,
+            'max': self.max or 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+        }
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool):
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def count(name: str, value: int = 1):
+    """Incrémente un compteur"""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def observe(name: str, value: float):
+    """Ajoute une valeur à un histogramme"""
+    if not _enabled:
+        return
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.add(value)
+
+
+class _Span:
+
+    __slots__ = ('name', 'attributes', 'start')
+
+    def __init__(self, name: str, attributes: dict):
+        self.name = name
+        self.attributes = attributes
+        self.start = 0.0
+
+    def set(self, **attributes):
+        """Ajoute des informations au span (ex: nombre de fichiers trouvés)"""
+        self.attributes.update(attributes)
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration_ms = (time.perf_counter() - self.start) * 1000
+        observe(self.name, duration_ms)
+        details = ' '.join(f'{key}={value}' for key, value in self.attributes.items())
+        status = f' error={exc_type.__name__}' if exc_type else ''
+        _recent_spans.append((datetime.now().strftime('%H:%M:%S'), self.name, duration_ms, f'{details}{status}'))
+        logger.debug(f'[trace] {self.name} {duration_ms:.2f} ms {details}{status}')
+        return False
+
+
+class _NoSpan:
+
+    __slots__ = ()
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str, **attributes):
+    """Mesure la durée d'un bloc (context manager)"""
+    if not _enabled:
+        return _NO_SPAN
+    return _Span(name, attributes)
+
+
+def traced(name: str = None):
+    """Décorateur : mesure chaque appel de la fonction"""
+    def decorator(func):
+        span_name = name or f'{func.__module__}.{func.__qualname__}'
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def register_gauge(name: str, func):
+    """Valeur lue à la demande (ex: taille d'une file d'attente de workers)"""
+    with _lock:
+        _gauges[name] = func
+
+
+def gauges() -> dict:
+    with _lock:
+        items = list(_gauges.items())
+
+    values = {}
+    for name, func in items:
+        try:
+            values[name] = func()
+        except Exception:
+            # L'objet mesuré n'existe plus
+            with _lock:
+                _gauges.pop(name, None)
+    return values
+
+
+def recent_spans(limit: int = 50) -> list:
+    """Derniers spans [(heure, nom, durée ms, détails)], du plus récent au plus ancien"""
+    with _lock:
+        spans = list(_recent_spans)
+    return spans[::-1][:limit]
+
+
+def hit_rate(name: str) -> tuple:
+    """(hits, misses) des compteurs '<name>.hits' et '<name>.misses'"""
+    with _lock:
+        return _counters.get(f'{name}.hits', 0), _counters.get(f'{name}.misses', 0)
+
+
+def snapshot() -> dict:
+    """Copie des compteurs et des résumés des histogrammes (durées des spans en ms)"""
+    with _lock:
+        return {
+            'counters': dict(_counters),
+            'histograms': {name: histogram.summary() for name, histogram in _histograms.items()},
+        }
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+        _recent_spans.clear()
@@ -22,9 +22,13 @@ TRANSLATIONS = {
         'recent_files': 'Fichiers récents',
         'crash_folder': 'Dossier Crash',
         'page_title': 'Titre de la page',
+        'loading': 'Chargement...',
         'rename': 'Renommer',
         'duplicate': 'Dupliquer',
         'open_in_explorer': 'Ouvrir dans l\'explorateur',
+        'version_up_selection': 'Version suivante',
+        'rename_selection': 'Renommer la sélection',
+        'move_to_old': 'Déplacer dans OLD',
         'create_asset_desc': 'Créez un nouvel asset pour votre projet',
         'asset_info': 'Informations de l\'asset',
         'asset_name': 'Nom de l\'asset',
@@ -81,9 +85,13 @@ TRANSLATIONS = {
         'recent_files': 'Recent files',
         'crash_folder': 'Crash folder',
         'page_title': 'Page title',
+        'loading': 'Loading...',
         'rename': 'Rename',
         'duplicate': 'Duplicate',
         'open_in_explorer': 'Open in explorer',
+        'version_up_selection': 'Version up',
+        'rename_selection': 'Rename selection',
+        'move_to_old': 'Move to OLD',
         'create_asset_desc': 'Create a new asset for your project',
         'asset_info': 'Asset information',
         'asset_name': 'Asset name',
@@ -140,9 +148,13 @@ TRANSLATIONS = {
         'recent_files': 'Archivos recientes',
         'crash_folder': 'Carpeta Crash',
         'page_title': 'Título de página',
+        'loading': 'Cargando...',
         'rename': 'Renombrar',
         'duplicate': 'Duplicar',
         'open_in_explorer': 'Abrir en explorador',
+        'version_up_selection': 'Versión siguiente',
+        'rename_selection': 'Renombrar selección',
+        'move_to_old': 'Mover a OLD',
         'create_asset_desc': 'Crear un nuevo asset para tu proyecto',
         'asset_info': 'Información del asset',
         'asset_name': 'Nombre del asset',
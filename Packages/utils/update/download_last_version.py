@@ -1,8 +1,9 @@
-import requests
 import shutil
 import os
 
 def download_github_repo(repo_url, save_path):
+    import requests
+
     # Construire l'URL pour télécharger le dépôt en tant qu'archive zip
     if repo_url.endswith('/'):
         repo_url = repo_url[:-1]
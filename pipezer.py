@@ -1,25 +1,82 @@
 import os
 import stat
+import time
+import threading
 
 os.environ['QT_PLUGIN_PATH'] = r"C:\Program Files\Pixar\RenderManProServer-26.2\lib\plugins"
 
+PERMISSIONS_STAMP_NAME = '.permissions_stamp'
+
+
+def needs_permission_fix(mode: int) -> bool:
+    # Sous Windows, chmod ne gère que la lecture seule
+    if os.name == 'nt':
+        return not mode & stat.S_IWUSR
+    return stat.S_IMODE(mode) != stat.S_IRWXU
+
+
+def fix_permissions(directory: str, last_run: float) -> int:
+    """
+    Corrige les permissions des éléments créés depuis le dernier passage.
+    ctime est aussi regardé car shutil.copy2/copytree conservent la date de modification de la source.
+    Un dossier dont la date n'a pas changé n'a pas de nouveaux éléments : seuls ses sous-dossiers sont visités.
+    """
+    fixed = 0
+    to_visit = [directory]
+
+    while to_visit:
+        current = to_visit.pop()
+        current_stat = os.stat(current)
+        if needs_permission_fix(current_stat.st_mode):
+            os.chmod(current, stat.S_IRWXU)  # Répertoires
+            fixed += 1
+        has_new_entries = max(current_stat.st_mtime, current_stat.st_ctime) >= last_run
+
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    to_visit.append(entry.path)
+                elif has_new_entries and entry.name != PERMISSIONS_STAMP_NAME:
+                    entry_stat = entry.stat(follow_symlinks=False)
+                    if max(entry_stat.st_mtime, entry_stat.st_ctime) >= last_run and needs_permission_fix(entry_stat.st_mode):
+                        os.chmod(entry.path, stat.S_IRWXU)  # Fichiers
+                        fixed += 1
+
+    return fixed
+
+
 def set_permissions_for_pipezer_folder():
     folder_path = os.path.expanduser('~/.pipezer')
+    stamp_path = os.path.join(folder_path, PERMISSIONS_STAMP_NAME)
     try:
-        for root, dirs, files in os.walk(folder_path):
-            os.chmod(root, stat.S_IRWXU)  # Répertoires
-            for file in files:
-                file_path = os.path.join(root, file)
-                os.chmod(file_path, stat.S_IRWXU)  # Fichiers
-        from Packages.utils.translation import translation_manager
-        print(translation_manager.get_text("messages.permissions_updated", path=folder_path))
+        if not os.path.isdir(folder_path):
+            return
+
+        try:
+            last_run = os.stat(stamp_path).st_mtime
+        except OSError:
+            last_run = 0.0
+
+        start = time.time()
+        fixed = fix_permissions(folder_path, last_run)
+
+        # La date du marqueur est celle du début du passage, pour ne rien rater pendant le parcours
+        with open(stamp_path, 'a'):
+            pass
+        os.utime(stamp_path, (start, start))
+
+        if fixed:
+            from Packages.utils.translation import translation_manager
+            print(translation_manager.get_text("messages.permissions_updated", path=folder_path))
     except Exception as e:
         from Packages.utils.translation import translation_manager
         print(translation_manager.get_text("messages.error_permissions", error=str(e)))
 
-set_permissions_for_pipezer_folder()
+
+# Hors du chemin critique : la fenêtre n'attend pas la vérification des permissions
+threading.Thread(target=set_permissions_for_pipezer_folder, name='pipezer_permissions', daemon=True).start()
 
 from Packages.apps.standalone.standalone_app import PipeZerApp
 
 app = PipeZerApp()
-app.exec_()
\ No newline at end of file
+app.exec_()
@@ -0,0 +1,50 @@
+import pytest
+
+from Packages.utils import import_profiler
+from Packages.utils.import_profiler import (
+    DEFAULT_MODULE, IMPORT_BUDGET_MS, eager_heavy_imports, parse_import_times, profile_import
+)
+
+
+IMPORT_TIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2500 |       3100 |     PIL.Image
+import time:       800 |       3900 |   PIL
+import time:      1000 |       4900 | Packages.ui.base_main_window
+"""
+
+
+def test_parse_import_times():
+    entries = parse_import_times(IMPORT_TIME_OUTPUT)
+
+    assert [entry['module'] for entry in entries] == ['_io', 'PIL.Image', 'PIL', 'Packages.ui.base_main_window']
+    assert entries[1]['self_ms'] == 2.5
+    assert entries[3]['cumulative_ms'] == 4.9
+    assert [entry['depth'] for entry in entries] == [1, 2, 1, 0]
+
+
+def test_eager_heavy_imports():
+    report = {'modules': parse_import_times(IMPORT_TIME_OUTPUT)}
+
+    assert eager_heavy_imports(report) == ['PIL', 'PIL.Image']
+    assert eager_heavy_imports(report, heavy_modules=('requests',)) == []
+
+
+def test_budget_exit_code(monkeypatch):
+    report = {'module': DEFAULT_MODULE, 'python': '3', 'total_ms': 4.9,
+              'modules': parse_import_times(IMPORT_TIME_OUTPUT)}
+    monkeypatch.setattr(import_profiler, 'profile_import', lambda module: report)
+
+    assert import_profiler.main([]) == 0
+    # PIL importé au démarrage : refusé même dans le budget
+    assert import_profiler.main(['--budget']) == 1
+
+
+def test_main_window_import_budget():
+    pytest.importorskip('PySide2')
+
+    report = profile_import(DEFAULT_MODULE)
+
+    assert eager_heavy_imports(report) == []
+    assert report['total_ms'] <= IMPORT_BUDGET_MS